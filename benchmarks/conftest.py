@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import os
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from netscout_teststream.cli.netscout_cli_handler import NetscoutCliHandler
+from netscout_teststream.cli.simulator.cli_simulator import CLISimulator
+from netscout_teststream.cli.simulator.fake_switch_server import FakeSwitchServer
+from netscout_teststream.driver_commands import DriverCommands
+from netscout_teststream.switch_registry import SwitchRegistry
+
+DATA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    os.pardir,
+    "netscout_teststream",
+    "cli",
+    "simulator",
+    "data",
+)
+"""Simulated round-trip of one CLI command, seconds"""
+LATENCY = 0.005
+"""Switches of the simulator data with show connection outputs"""
+SWITCHES = [
+    "3912X_24.30",
+    "3912_Kaiser",
+    "NetScout 3912",
+    "OS192_103",
+    "3903",
+    "3903X_25.28",
+    "3200X_26.27",
+    "HS-3200",
+]
+"""Switches served by the switch emulator, OS-192 has no connections"""
+EMULATED_SWITCHES = SWITCHES + ["OS-192"]
+"""Rows of the generated table, large switches report thousands connections"""
+LARGE_TABLE_ROWS = 5000
+
+logger = logging.getLogger("benchmarks")
+
+
+def runtime_config(**values):
+    """Runtime configuration stub, keys use "_" instead of "."."""
+    config = Mock()
+    config.read_key.side_effect = lambda key, default=None: values.get(
+        key.replace(".", "_"), default
+    )
+    return config
+
+
+def switch_address(switch_name):
+    return f"10.0.0.1?teststream={switch_name}"
+
+
+def simulated_driver(latency=LATENCY, **config):
+    """Driver commands instance working with the cli simulator."""
+    driver = DriverCommands(runtime_config(**config))
+    driver._switches = SwitchRegistry(
+        lambda: CLISimulator(DATA_PATH, logger, latency), driver._topology_ttl
+    )
+    return driver
+
+
+class SwitchEmulator:
+    """Switch emulator server running in a background thread."""
+
+    def __init__(self, latency=LATENCY):
+        self.server = FakeSwitchServer(latency=latency)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._idle_ports = {}
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def start(self):
+        self._thread.start()
+        self._run(self.server.start())
+
+    async def _close(self):
+        await self.server.close()
+        tasks = asyncio.all_tasks() - {asyncio.current_task()}
+        if tasks:
+            await asyncio.wait(tasks, timeout=1)
+
+    def stop(self):
+        """Close the server and the sessions of the drivers."""
+        self._run(self._close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    @property
+    def commands_count(self):
+        return len(self.server.commands)
+
+    def address(self, switch_name):
+        return f"127.0.0.1:{self.server.port}?teststream={switch_name}"
+
+    def idle_ports(self, switch_name, count):
+        """Driver addresses of the ports without connections.
+
+        Ports are taken on the first call, the same ports are returned after
+        the benchmarks connected them.
+        """
+        if switch_name not in self._idle_ports:
+            self._idle_ports[switch_name] = self.server.switch(switch_name).idle_ports()
+        address = self.address(switch_name)
+        ports = self._idle_ports[switch_name][:count]
+        return [
+            "/".join([address] + [str(int(part)) for part in port.split(".")[1:]])
+            for port in ports
+        ]
+
+
+@pytest.fixture(scope="session")
+def switch_emulator():
+    emulator = SwitchEmulator()
+    emulator.start()
+    yield emulator
+    emulator.stop()
+
+
+def _telnet_cli_handler():
+    cli_handler = NetscoutCliHandler()
+    cli_handler._session_types = ["TELNET"]
+    return cli_handler
+
+
+def emulated_driver(**config):
+    """Driver commands instance connecting to the switch emulator by telnet."""
+    driver = DriverCommands(runtime_config(**config))
+    driver._switches = SwitchRegistry(_telnet_cli_handler, driver._topology_ttl)
+    return driver
+
+
+def show_connection(switch_name):
+    """Show connection output of the simulator switch."""
+    file_name = f"show_connection_switch_{switch_name.replace(' ', '_')}.txt"
+    with open(os.path.join(DATA_PATH, file_name)) as f:
+        return f.read()
+
+
+def large_show_connection(rows=LARGE_TABLE_ROWS):
+    """Show connection output with the rows of OS192_103 repeated."""
+    lines = show_connection("OS192_103").splitlines()
+    border_index = next(
+        index for index, line in enumerate(lines) if line.startswith("--------")
+    )
+    table_rows = [line for line in lines[border_index + 1 :] if line.strip()]
+    return "\n".join(
+        lines[: border_index + 1]
+        + [table_rows[index % len(table_rows)] for index in range(rows)]
+    )
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--update-baselines",
+        action="store_true",
+        help="Store the results of the driver commands benchmarks as baselines",
+    )
+    parser.addoption(
+        "--check-resources",
+        action="store_true",
+        help="Fail the driver commands benchmarks on peak memory and wall time "
+        "above the baselines, stored on the same machine",
+    )
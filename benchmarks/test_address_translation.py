@@ -0,0 +1,76 @@
+"""Translation of CloudShell port addresses to switch port addresses.
+
+Requests of 10k addresses are translated by the split and zfill conversion
+the driver did for every call before, and by the address translator:
+cold - parsed and put into the LRU cache, cached - found in the LRU cache,
+registered - found in the table built from the autoload port index.
+
+Run with: pytest benchmarks/test_address_translation.py
+"""
+import pytest
+
+from netscout_teststream.address_translator import AddressTranslator
+
+from benchmarks.conftest import switch_address
+
+ADDRESS_COUNT = 10000
+PORTS_PER_BLADE = 64
+ADDRESS = switch_address("3912X_24.30")
+
+
+class _Port:
+    def __init__(self, address, resource_id):
+        self.address = address
+        self.resource_id = resource_id
+
+
+def _addresses():
+    return [
+        f"{ADDRESS}/{blade_id + 1}/{port_id + 1:02d}"
+        for blade_id, port_id in (
+            divmod(index, PORTS_PER_BLADE) for index in range(ADDRESS_COUNT)
+        )
+    ]
+
+
+def _convert_port_address(port_address):
+    ip_addr, blade_id, port_id = port_address.split("/")
+    port_id = port_id.split("-")[0]
+    return f"{str(1).zfill(2)}.{blade_id.zfill(2)}.{port_id.zfill(2)}"
+
+
+def _port_index(translator, addresses):
+    return {
+        translator.to_switch(address)[0]: (_Port(address, address.split("/")[-1]),)
+        for address in addresses
+    }
+
+
+@pytest.mark.parametrize("mode", ["split", "cold", "cached", "registered"])
+def test_address_translation(benchmark, mode):
+    addresses = _addresses()
+    if mode == "split":
+        convert = _convert_port_address
+        setup = None
+    else:
+        translator = AddressTranslator(cache_size=2 * ADDRESS_COUNT)
+        if mode == "registered":
+            translator.register_ports(ADDRESS, _port_index(translator, addresses))
+        translator._parse.cache_clear()
+
+        def convert(address):
+            return translator.to_switch(address)[0]
+
+        def setup():
+            if mode == "cold":
+                translator._parse.cache_clear()
+            elif mode == "cached":
+                for address in addresses:
+                    convert(address)
+
+    def translate():
+        return [convert(address) for address in addresses]
+
+    result = benchmark.pedantic(translate, setup=setup, rounds=20, iterations=1)
+    assert result == [_convert_port_address(address) for address in addresses]
+    benchmark.extra_info["addresses"] = ADDRESS_COUNT
@@ -0,0 +1,169 @@
+"""Driver commands against the switch emulator, end to end over telnet.
+
+Every operation is measured on every emulated switch:
+ - commands, CLI commands received by the emulator
+ - peak_memory, bytes allocated at peak, emulator thread included
+ - wall_time, mean seconds of the benchmark rounds
+and compared with benchmarks/baselines/driver_commands.json. More commands
+than the baseline fail the test. Memory and wall time depend on the hardware,
+they fail above the tolerance only with --check-resources, on the machine the
+baselines were stored on. Setup (login, mappings to clear) is not measured.
+
+Mappings use up to MAX_DST_PORTS destination ports, as many as the switch has
+idle ports for, so the large switches are measured with large bursts.
+
+Run with: pytest benchmarks/test_driver_commands.py
+With memory and wall time: pytest benchmarks/test_driver_commands.py --check-resources
+Store new baselines: pytest benchmarks/test_driver_commands.py --update-baselines
+"""
+import gc
+import json
+import os
+import tracemalloc
+
+import pytest
+
+from benchmarks.conftest import EMULATED_SWITCHES, emulated_driver
+
+BASELINES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "baselines", "driver_commands.json"
+)
+ROUNDS = 3
+MEMORY_TOLERANCE = 1.25
+WALL_TIME_TOLERANCE = 1.5
+MAX_DST_PORTS = 32
+USERNAME = "admin"
+PASSWORD = "admin"
+OPERATIONS = [
+    "login",
+    "get_resource_description",
+    "map_uni",
+    "map_bidi",
+    "map_clear_to",
+    "map_clear",
+]
+"""Operations failing on the switch data"""
+KNOWN_FAILURES = {}
+
+
+@pytest.fixture(scope="module")
+def baselines(request):
+    if os.path.exists(BASELINES_PATH):
+        with open(BASELINES_PATH) as f:
+            stored = json.load(f)
+    else:
+        stored = {}
+    results = {}
+    yield stored, results
+
+    if request.config.getoption("--update-baselines") and results:
+        for switch_name, operations in results.items():
+            stored.setdefault(switch_name, {}).update(operations)
+        os.makedirs(os.path.dirname(BASELINES_PATH), exist_ok=True)
+        with open(BASELINES_PATH, "w") as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+
+def _operation(switch_emulator, switch_name, operation):
+    """Setup and the measured call of the operation.
+
+    The driver is logged in once and reused by the rounds, as by CloudShell,
+    only the login rounds start with a new driver.
+    """
+    address = switch_emulator.address(switch_name)
+    src_port, *dst_ports, bidi_src, bidi_dst = switch_emulator.idle_ports(
+        switch_name, MAX_DST_PORTS + 3
+    )
+
+    driver = None
+
+    def setup():
+        nonlocal driver
+        if driver is None or operation == "login":
+            driver = emulated_driver()
+            if operation != "login":
+                driver.login(address, USERNAME, PASSWORD)
+        if operation in ("map_clear_to", "map_clear"):
+            driver.map_uni(src_port, dst_ports)
+            driver.map_bidi(bidi_src, bidi_dst)
+        return (driver,), {}
+
+    calls = {
+        "login": lambda driver: driver.login(address, USERNAME, PASSWORD),
+        "get_resource_description": lambda driver: driver.get_resource_description(
+            address
+        ),
+        "map_uni": lambda driver: driver.map_uni(src_port, dst_ports),
+        "map_bidi": lambda driver: driver.map_bidi(bidi_src, bidi_dst),
+        "map_clear_to": lambda driver: driver.map_clear_to(src_port, dst_ports),
+        "map_clear": lambda driver: driver.map_clear(dst_ports + [bidi_src]),
+    }
+    return setup, calls[operation]
+
+
+def _measure(switch_emulator, setup, call):
+    """Commands sent and peak memory of one call."""
+    args, kwargs = setup()
+    commands_count = switch_emulator.commands_count
+    gc.collect()
+    tracemalloc.start()
+    try:
+        call(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "commands": switch_emulator.commands_count - commands_count,
+        "peak_memory": peak,
+    }
+
+
+def _regressions(result, baseline, check_resources=False):
+    regressions = []
+    if result["commands"] > baseline["commands"]:
+        regressions.append(f"commands {result['commands']} > {baseline['commands']}")
+    if not check_resources:
+        return regressions
+    if result["peak_memory"] > baseline["peak_memory"] * MEMORY_TOLERANCE:
+        regressions.append(
+            f"peak_memory {result['peak_memory']} > {baseline['peak_memory']}"
+        )
+    if (
+        result.get("wall_time")
+        and baseline.get("wall_time")
+        and result["wall_time"] > baseline["wall_time"] * WALL_TIME_TOLERANCE
+    ):
+        regressions.append(
+            f"wall_time {result['wall_time']:.3f} > {baseline['wall_time']:.3f}"
+        )
+    return regressions
+
+
+@pytest.mark.parametrize("operation", OPERATIONS)
+@pytest.mark.parametrize("switch_name", EMULATED_SWITCHES)
+def test_driver_command(
+    request, benchmark, switch_emulator, baselines, switch_name, operation
+):
+    if (switch_name, operation) in KNOWN_FAILURES:
+        raises, reason = KNOWN_FAILURES[switch_name, operation]
+        request.node.add_marker(
+            pytest.mark.xfail(raises=raises, reason=reason, strict=True)
+        )
+    setup, call = _operation(switch_emulator, switch_name, operation)
+    benchmark.pedantic(call, setup=setup, rounds=ROUNDS)
+    # measured after the rounds, once the process is warmed up
+    result = _measure(switch_emulator, setup, call)
+    if benchmark.stats:
+        result["wall_time"] = benchmark.stats["mean"]
+    benchmark.extra_info.update(result)
+
+    stored, results = baselines
+    results.setdefault(switch_name, {})[operation] = result
+    baseline = stored.get(switch_name, {}).get(operation)
+    if baseline is None:
+        pytest.skip("No baseline, run with --update-baselines")
+    regressions = _regressions(
+        result, baseline, request.config.getoption("--check-resources")
+    )
+    assert not regressions, ", ".join(regressions)
@@ -0,0 +1,53 @@
+"""Logging of large CLI outputs on the command thread.
+
+A generated show connection output of thousands of rows is logged at DEBUG,
+as the CLI session logs every output, to the file handler of the command
+log: sync - formatted and written by the caller, queued - put into the log
+queue, capped and written in batches by its thread. Only the caller side
+is measured.
+
+Run with: pytest benchmarks/test_logging.py
+"""
+import logging
+
+import pytest
+
+from netscout_teststream.log_queue import LogQueue
+
+from benchmarks.conftest import large_show_connection
+
+OUTPUTS = 20
+MAX_PAYLOAD = 65536
+
+
+@pytest.mark.parametrize("mode", ["sync", "queued"])
+def test_log_cli_outputs(benchmark, tmp_path, mode):
+    output = large_show_connection()
+    log_path = tmp_path / "commands.log"
+    log = logging.getLogger(f"benchmarks.logging.{mode}")
+    log.propagate = False
+    log.setLevel(logging.DEBUG)
+    file_handler = logging.FileHandler(log_path)
+    file_handler.setFormatter(
+        logging.Formatter("%(asctime)s [%(levelname)s]: %(threadName)s %(message)s")
+    )
+    log.addHandler(file_handler)
+    log_queue = None
+    if mode == "queued":
+        log_queue = LogQueue(MAX_PAYLOAD)
+        log_queue.attach(log)
+        log_queue.start()
+
+    def log_outputs():
+        for _ in range(OUTPUTS):
+            log.debug(output)
+
+    try:
+        benchmark.pedantic(log_outputs, rounds=10)
+    finally:
+        if log_queue:
+            log_queue.stop()
+        log.handlers = []
+        file_handler.close()
+    benchmark.extra_info["output_size"] = len(output)
+    benchmark.extra_info["log_size"] = log_path.stat().st_size
@@ -0,0 +1,124 @@
+"""Memory of the autoload and disconnect data structures.
+
+Compact forms are compared with plain objects having per-instance __dict__
+built from the parse_table rows, as the driver did before.
+Sizes are reported in the benchmark extra info.
+
+Run with: pytest benchmarks/test_memory.py
+"""
+import gc
+import os
+import tracemalloc
+from unittest.mock import Mock
+
+import pytest
+
+import netscout_teststream.command_actions.actions_helper as helper
+from netscout_teststream.command_actions.autoload_actions import AutoloadActions
+from netscout_teststream.command_actions.connection_table import (
+    CONNECTION_COLUMNS,
+    ConnectionTable,
+)
+
+from benchmarks.conftest import (
+    DATA_PATH,
+    SWITCHES,
+    large_show_connection,
+    show_connection,
+)
+
+LARGE_TABLE = "large"
+
+
+class PlainConnectionInfo:
+    def __init__(self, src_address, dst_address, connection_type):
+        self.src_address = src_address
+        self.dst_address = dst_address
+        self.connection_type = connection_type
+
+
+class PlainPortInfo:
+    def __init__(self, name, address, protocol_id):
+        self.name = name
+        self.address = address
+        self.protocol_id = protocol_id
+
+
+def _memory(build):
+    """Peak and retained memory allocated by build, bytes."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak, retained
+
+
+def _plain_connections(output):
+    return [
+        PlainConnectionInfo(row["src_addr"], row["dst_addr"], row["connection_type"])
+        for row in helper.parse_table(output, CONNECTION_COLUMNS)
+    ]
+
+
+def _plain_ports(output):
+    port_table = {}
+    for line in output.strip().splitlines():
+        address, protocol_id, port_mode, *_, name = line.strip().split(",")
+        if int(port_mode) != AutoloadActions.NOT_USED_PORT_MODE:
+            port_table[address] = PlainPortInfo(name.strip("'"), address, protocol_id)
+    return port_table
+
+
+def _compact_ports(output):
+    cli_service = Mock()
+    cli_service.send_command.return_value = output
+    return AutoloadActions("switch", cli_service).port_table()
+
+
+def _report(benchmark, plain, compact):
+    benchmark.extra_info.update(
+        {
+            "plain_peak": plain[0],
+            "plain_retained": plain[1],
+            "compact_peak": compact[0],
+            "compact_retained": compact[1],
+        }
+    )
+
+
+@pytest.mark.parametrize("switch_name", SWITCHES + [LARGE_TABLE])
+def test_connection_table_memory(benchmark, switch_name):
+    if switch_name == LARGE_TABLE:
+        output = large_show_connection()
+    else:
+        output = show_connection(switch_name)
+
+    plain = _memory(lambda: _plain_connections(output))
+    compact = _memory(lambda: ConnectionTable.from_output(output))
+    _report(benchmark, plain, compact)
+    benchmark(ConnectionTable.from_output, output)
+
+    if switch_name == LARGE_TABLE:
+        assert compact[1] < plain[1]
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    sorted(
+        file_name
+        for file_name in os.listdir(DATA_PATH)
+        if file_name.startswith("show_port_rawinfo")
+    ),
+)
+def test_port_table_memory(benchmark, file_name):
+    with open(os.path.join(DATA_PATH, file_name)) as f:
+        output = f.read()
+
+    plain = _memory(lambda: _plain_ports(output))
+    compact = _memory(lambda: _compact_ports(output))
+    _report(benchmark, plain, compact)
+    benchmark(_compact_ports, output)
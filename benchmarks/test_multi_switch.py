@@ -0,0 +1,35 @@
+"""Aggregate mapping throughput of one driver process serving several switches.
+
+Run with: pytest benchmarks/test_multi_switch.py
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from benchmarks.conftest import SWITCHES, simulated_driver, switch_address
+
+PORTS_PER_SWITCH = 16
+
+
+def _map_switch(driver, switch_name):
+    address = switch_address(switch_name)
+    driver.login(address, "user", "password")
+    dst_ports = [f"{address}/2/{port}" for port in range(2, PORTS_PER_SWITCH + 2)]
+    driver.map_uni(f"{address}/2/1", dst_ports)
+    driver.map_clear(dst_ports)
+
+
+@pytest.mark.parametrize("switch_count", [1, 2, 4, 8])
+def test_multi_switch_mapping_throughput(benchmark, switch_count):
+    driver = simulated_driver()
+    switches = SWITCHES[:switch_count]
+
+    def run():
+        with ThreadPoolExecutor(max_workers=switch_count) as executor:
+            list(executor.map(lambda name: _map_switch(driver, name), switches))
+
+    benchmark.pedantic(run, rounds=5, iterations=1)
+    mappings = switch_count * PORTS_PER_SWITCH
+    benchmark.extra_info["mappings"] = mappings
+    if benchmark.stats:
+        benchmark.extra_info["mappings_per_second"] = mappings / benchmark.stats["mean"]
@@ -0,0 +1,41 @@
+"""Parsing of show connection tables.
+
+Run with: pytest benchmarks/test_parse_table.py
+"""
+import pytest
+
+import netscout_teststream.command_actions.actions_helper as helper
+from netscout_teststream.command_actions.connection_table import (
+    CONNECTION_COLUMNS,
+    ConnectionTable,
+)
+
+from benchmarks.conftest import (
+    LARGE_TABLE_ROWS,
+    SWITCHES,
+    large_show_connection,
+    show_connection,
+)
+
+
+@pytest.mark.parametrize("switch_name", SWITCHES)
+def test_parse_show_connection(benchmark, switch_name):
+    output = show_connection(switch_name)
+    benchmark(helper.parse_table, output, CONNECTION_COLUMNS)
+
+
+def test_parse_large_table(benchmark):
+    output = large_show_connection()
+    result = benchmark(helper.parse_table, output, CONNECTION_COLUMNS)
+    assert len(result) == LARGE_TABLE_ROWS
+
+
+def test_iterate_large_table(benchmark):
+    output = large_show_connection()
+    benchmark(lambda: sum(1 for _ in helper.iter_table(output, CONNECTION_COLUMNS)))
+
+
+def test_connection_table_large_table(benchmark):
+    output = large_show_connection()
+    table = benchmark(ConnectionTable.from_output, output)
+    assert len(table) == LARGE_TABLE_ROWS
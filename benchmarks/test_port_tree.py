@@ -0,0 +1,112 @@
+"""Construction time and memory of the autoload port tree.
+
+Ports with interned attributes are compared with ports allocating their own
+attribute objects, as the driver did before. Port names and protocols are
+taken from the 3912X_24.30 port rawinfo, repeated to the port count.
+Sizes are reported in the benchmark extra info.
+
+Run with: pytest benchmarks/test_port_tree.py
+"""
+import gc
+import os
+import tracemalloc
+from unittest.mock import Mock, patch
+
+import pytest
+
+from netscout_teststream.command_actions.autoload_actions import (
+    AutoloadActions,
+    PortInfoDTO,
+)
+from netscout_teststream.driver_commands import DriverCommands
+from netscout_teststream.model.netscout_blade import NetscoutBlade
+from netscout_teststream.model.netscout_port import NetscoutPort
+from netscout_teststream.topology_cache import TopologyCache
+
+from benchmarks.conftest import DATA_PATH, runtime_config
+
+PORTS_PER_BLADE = 64
+RAWINFO_FILE = "show_port_rawinfo_asterisk_switch_3912X_24.30.txt"
+
+
+class PlainPort(NetscoutPort):
+    def __init__(self, resource_id, port_model_name=None, netscout_protocol_id=0):
+        super(NetscoutPort, self).__init__(resource_id)
+        protocol_id, protocol_type_id, speed_id = self.PROTOCOL_ASSOCIATION_TABLE.get(
+            int(netscout_protocol_id), self.DEFAULT_PROTOCOL
+        )
+        self.set_protocol(protocol_id)
+        self.set_protocol_type(protocol_type_id)
+        self.set_speed(speed_id)
+        self.set_model_name(port_model_name)
+        self.set_protocol_value(netscout_protocol_id)
+
+
+def _switch_ports():
+    with open(os.path.join(DATA_PATH, RAWINFO_FILE)) as f:
+        cli_service = Mock()
+        cli_service.send_command.return_value = f.read()
+    return list(AutoloadActions("switch", cli_service).port_table().values())
+
+
+def _ports_table(port_count):
+    switch_ports = _switch_ports()
+    ports_table = {}
+    for index in range(port_count):
+        blade_id, port_id = divmod(index, PORTS_PER_BLADE)
+        address = f"01.{blade_id + 1:02d}.{port_id + 1:02d}"
+        port_info = switch_ports[index % len(switch_ports)]
+        ports_table[address] = PortInfoDTO(
+            port_info.name, address, port_info.protocol_id
+        )
+    return ports_table
+
+
+def _blades(port_count):
+    blade_count = -(-port_count // PORTS_PER_BLADE)
+    return {
+        (1, blade_id): NetscoutBlade(blade_id, "S-Blade")
+        for blade_id in range(1, blade_count + 1)
+    }
+
+
+def _build(driver, ports_table, blades_dict):
+    return driver._build_ports(TopologyCache(), blades_dict, ports_table)
+
+
+def _memory(build):
+    """Peak and retained memory allocated by build, bytes."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak, retained
+
+
+@pytest.mark.parametrize("port_mode", ["LOGICAL", "PHYSICAL"])
+@pytest.mark.parametrize("port_count", [1000, 10000, 50000])
+def test_port_tree(benchmark, port_count, port_mode):
+    driver = DriverCommands(runtime_config(DRIVER_PORT_MODE=port_mode))
+    ports_table = _ports_table(port_count)
+    blades_dict = _blades(port_count)
+
+    with patch("netscout_teststream.model.netscout_port.NetscoutPort", PlainPort):
+        plain = _memory(lambda: _build(driver, ports_table, _blades(port_count)))
+    interned = _memory(lambda: _build(driver, ports_table, _blades(port_count)))
+    benchmark.extra_info.update(
+        {
+            "plain_peak": plain[0],
+            "plain_retained": plain[1],
+            "interned_peak": interned[0],
+            "interned_retained": interned[1],
+        }
+    )
+    benchmark.pedantic(
+        _build, args=(driver, ports_table, blades_dict), rounds=3, iterations=1
+    )
+
+    assert interned[1] < plain[1]
@@ -0,0 +1,115 @@
+"""Driver startup, interpreter start to the listening socket.
+
+The driver process is started the way CloudShell starts it, by main.py,
+and measured until a connection to its port is accepted:
+lazy - the driver as is, actions, models and CLI sessions are imported
+on first use, eager - the same modules imported before the driver starts,
+as the driver did before.
+
+Run with: pytest benchmarks/test_startup.py
+"""
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DRIVER_NAME = "netscout_teststream"
+ROUNDS = 5
+"""Seconds to wait for the listening socket"""
+STARTUP_TIMEOUT = 30
+"""Modules deferred by the driver, imported up front in the eager mode"""
+EAGER_MODULES = [
+    "netscout_teststream.cli.netscout_ssh_session",
+    "netscout_teststream.cli.netscout_telnet_session",
+    "netscout_teststream.command_actions.autoload_actions",
+    "netscout_teststream.command_actions.mapping_actions",
+    "netscout_teststream.command_actions.system_actions",
+    "netscout_teststream.model.netscout_blade",
+    "netscout_teststream.model.netscout_chassis",
+    "netscout_teststream.model.netscout_port",
+]
+STARTUP_SCRIPT = """
+import importlib
+for module in {modules!r}:
+    importlib.import_module(module)
+from main import Main
+Main({main_path!r}, {port}, {log_path!r}).run_driver({driver_name!r})
+"""
+
+
+def _free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start_driver(mode, log_path):
+    """Start the driver process, return it once its port accepts connections."""
+    port = _free_port()
+    script = STARTUP_SCRIPT.format(
+        modules=EAGER_MODULES if mode == "eager" else [],
+        main_path=os.path.join(ROOT_PATH, "main.py"),
+        port=port,
+        log_path=str(log_path),
+        driver_name=DRIVER_NAME,
+    )
+    process = subprocess.Popen(
+        [sys.executable, "-c", script],
+        cwd=ROOT_PATH,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return process
+        except OSError:
+            if process.poll() is not None or time.monotonic() > deadline:
+                _stop([process])
+                raise Exception(f"Driver did not start listening on port {port}")
+            time.sleep(0.002)
+
+
+def _stop(processes):
+    while processes:
+        process = processes.pop()
+        process.terminate()
+        process.wait()
+
+
+def _startup_time(mode, log_path):
+    start_time = time.perf_counter()
+    process = _start_driver(mode, log_path)
+    startup_time = time.perf_counter() - start_time
+    _stop([process])
+    return startup_time
+
+
+@pytest.mark.parametrize("mode", ["lazy", "eager"])
+def test_startup(benchmark, tmp_path, mode):
+    processes = []
+
+    def setup():
+        _stop(processes)
+        return (), {}
+
+    def start():
+        processes.append(_start_driver(mode, tmp_path))
+
+    try:
+        benchmark.pedantic(start, setup=setup, rounds=ROUNDS)
+    finally:
+        _stop(processes)
+
+
+def test_lazy_startup_faster(tmp_path):
+    startup_times = {
+        mode: min(_startup_time(mode, tmp_path) for _ in range(ROUNDS))
+        for mode in ("eager", "lazy")
+    }
+    assert startup_times["lazy"] < startup_times["eager"], startup_times
@@ -23,11 +23,41 @@ class Main:
             os.path.join(self._driver_path, f"{driver_name}_runtime_config.yml")
         )
 
+        # Queueing XML and command logs, written in batches by a daemon thread
+        log_queue = None
+        if runtime_config.read_key("LOGGING.ASYNC", False):
+            from netscout_teststream.log_queue import LogQueue, QueuedXMLLogger
+
+            log_queue = LogQueue(int(runtime_config.read_key("LOGGING.MAX_PAYLOAD", 0)))
+            log_queue.start()
+
         # Creating XMl logger instance
         xml_file_name = (
             f"{driver_name}--{datetime.now().strftime('%d-%b-%Y--%H-%M-%S')}.xml"
         )
-        xml_logger = XMLLogger(os.path.join(self._log_path, driver_name, xml_file_name))
+        xml_log_path = os.path.join(self._log_path, driver_name, xml_file_name)
+        if log_queue:
+            xml_logger = QueuedXMLLogger(
+                xml_log_path,
+                log_queue,
+                int(runtime_config.read_key("LOGGING.AUTOLOAD_SAMPLE_RATE", 1)),
+            )
+        else:
+            xml_logger = XMLLogger(xml_log_path)
+
+        # Exporting command metrics next to the XML log
+        metrics_interval = int(runtime_config.read_key("METRICS.EXPORT_INTERVAL", 0))
+        metrics_exporter = None
+        if metrics_interval:
+            from netscout_teststream.metrics import MetricsExporter
+
+            metrics_exporter = MetricsExporter(
+                os.path.join(
+                    self._log_path, driver_name, f"{driver_name}_metrics.prom"
+                ),
+                metrics_interval,
+            )
+            metrics_exporter.start()
 
         # Creating command logger instance
         command_logger = get_qs_logger(
@@ -37,6 +67,8 @@ class Main:
         )
         log_level = runtime_config.read_key("LOGGING.LEVEL", "INFO")
         set_log_level(command_logger, log_level)
+        if log_queue:
+            log_queue.attach(command_logger)
 
         command_logger.info(
             f"Starting driver {driver_name} on port {self._port}, PID: {os.getpid()}"
@@ -55,7 +87,14 @@ class Main:
         server = DriverListener(command_executor, xml_logger)
 
         # Start listening
-        server.start_listening(port=self._port)
+        try:
+            server.start_listening(port=self._port)
+        finally:
+            driver_instance.close()
+            if metrics_exporter:
+                metrics_exporter.stop()
+            if log_queue:
+                log_queue.stop()
 
 
 if __name__ == "__main__":
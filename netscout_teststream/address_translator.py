@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import threading
+from functools import lru_cache
+
+from cloudshell.layer_one.core.helper.logger import get_l1_logger
+
+logger = get_l1_logger(name=__name__)
+
+
+class AddressTranslator:
+    """Translation of CloudShell port addresses to switch port addresses.
+
+    CloudShell address "192.168.42.240?teststream=switch/7/1-Tx" is the switch
+    port "01.07.01" with the sub-port index "Tx". Ports found by autoload are
+    translated by the table built from the autoload port index, other
+    addresses are parsed and kept in a LRU cache.
+    """
+
+    ADDRESS_SEPARATOR = "/"
+    SUFFIX_SEPARATOR = "-"
+    CHASSIS_ID = 1
+    CACHE_SIZE = 8192
+
+    def __init__(self, cache_size: int = CACHE_SIZE):
+        self._lock = threading.Lock()
+        self._switch_ports = {}
+        self._parse = lru_cache(maxsize=cache_size)(self._parse_address)
+
+    def _parse_address(self, port_address: str) -> tuple[str, str]:
+        try:
+            _, blade_id, port_id = port_address.split(self.ADDRESS_SEPARATOR)
+        except ValueError:
+            raise Exception(f"Incorrect port address {port_address}")
+        port_id, _, sub_idx = port_id.partition(self.SUFFIX_SEPARATOR)
+        return (
+            f"{str(self.CHASSIS_ID).zfill(2)}.{blade_id.zfill(2)}.{port_id.zfill(2)}",
+            sub_idx,
+        )
+
+    def to_switch(self, port_address: str) -> tuple[str, str]:
+        """Switch port address and sub-port index of the CloudShell address."""
+        switch_port = self._switch_ports.get(port_address)
+        if switch_port is None:
+            switch_port = self._parse(port_address)
+        return switch_port
+
+    def register_ports(self, address: str, port_index: dict):
+        """Replace the ports of the switch with the autoload port index."""
+        switch_ports = {}
+        for switch_port, ports in port_index.items():
+            for port in ports:
+                _, _, sub_idx = port.resource_id.partition(self.SUFFIX_SEPARATOR)
+                switch_ports[port.address] = (switch_port, sub_idx)
+        # readers do not lock, the table is replaced once complete
+        with self._lock:
+            switch_ports.update(
+                (port_address, switch_port)
+                for port_address, switch_port in self._switch_ports.items()
+                if not port_address.startswith(address + self.ADDRESS_SEPARATOR)
+            )
+            self._switch_ports = switch_ports
+        logger.debug(f"Registered port addresses of {address}")
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import re
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from logging import Logger
+
+from cloudshell.cli.command_template.command_template_executor import (
+    CommandTemplateExecutor,
+)
+from cloudshell.cli.session.session_exceptions import ExpectedSessionException
+from cloudshell.layer_one.core.helper.logger import get_l1_logger
+from cloudshell.layer_one.core.helper.runtime_configuration import RuntimeConfiguration
+from cloudshell.layer_one.core.layer_one_driver_exception import LayerOneDriverException
+
+from netscout_teststream.cli.async_session import (
+    AsyncExpectSession,
+    AsyncSSHSession,
+    AsyncTelnetSession,
+)
+from netscout_teststream.cli.netscout_command_modes import DefaultCommandMode
+
+logger = get_l1_logger(name=__name__)
+
+
+class AsyncCliService:
+    """Default mode cli service of an asyncio session."""
+
+    def __init__(
+        self,
+        session: AsyncExpectSession,
+        prompt: str = DefaultCommandMode.PROMPT,
+        logger: Logger = logger,
+    ):
+        self.session = session
+        self._prompt = prompt
+        self._logger = logger
+
+    async def send_command(
+        self,
+        command: str | None,
+        expected_string: str = None,
+        action_map: OrderedDict = None,
+        error_map: OrderedDict = None,
+        logger: Logger = None,
+        remove_prompt: bool = False,
+        **kwargs,
+    ) -> str:
+        expected_string = expected_string or self._prompt
+        output = await self.session.hardware_expect(
+            command,
+            expected_string=expected_string,
+            logger=logger or self._logger,
+            action_map=action_map,
+            error_map=error_map,
+            **kwargs,
+        )
+        if remove_prompt:
+            output = re.sub(rf"^.*{expected_string}.*$", "", output, flags=re.MULTILINE)
+        return output
+
+
+class AsyncCommandTemplateExecutor(CommandTemplateExecutor):
+    """Execute command template using asyncio cli service."""
+
+    async def execute_command(self, **command_kwargs) -> str:
+        command = self._command_template.prepare_command(**command_kwargs)
+        return await self._cli_service.send_command(
+            command,
+            action_map=self.action_map,
+            error_map=self.error_map,
+            **self.optional_kwargs,
+        )
+
+
+class AsyncNetscoutCliHandler:
+    """Asyncio sessions of one switch.
+
+    Up to CLI.POOL.MAX_SIZE sessions are opened, idle sessions are kept
+    for the next commands. Session types are tried in the CLI.TYPE order.
+    """
+
+    POOL_MAX_SIZE = 1
+
+    def __init__(self, runtime_config: RuntimeConfiguration = None):
+        runtime_config = runtime_config or RuntimeConfiguration()
+        self._pool_max_size = int(
+            runtime_config.read_key("CLI.POOL.MAX_SIZE", self.POOL_MAX_SIZE)
+        )
+        self._defined_session_types = {
+            AsyncSSHSession.SESSION_TYPE: AsyncSSHSession,
+            AsyncTelnetSession.SESSION_TYPE: AsyncTelnetSession,
+        }
+        self._session_types = (
+            runtime_config.read_key("CLI.TYPE") or self._defined_session_types.keys()
+        )
+        self._ports = runtime_config.read_key("CLI.PORTS", {})
+
+        self._host = None
+        self._username = None
+        self._password = None
+        self._port = None
+        self._idle_sessions = []
+        self._semaphore = None
+
+    def define_session_attributes(
+        self, address: str, username: str, password: str, port: int = None
+    ):
+        """Define session attributes."""
+        if len(address.split(":")) > 1:
+            raise LayerOneDriverException("Incorrect resource address")
+        self._host = address
+        self._username = username
+        self._password = password
+        self._port = port
+        self._idle_sessions = []
+
+    async def _new_session(self) -> AsyncExpectSession:
+        if not self._host or not self._username or not self._password:
+            raise LayerOneDriverException(
+                "Cli Attributes is not defined, call Login command first"
+            )
+        exceptions = []
+        for session_type in self._session_types:
+            session_class = self._defined_session_types.get(session_type)
+            if not session_class:
+                raise LayerOneDriverException(
+                    f"Session type {session_type} is not defined"
+                )
+            session = session_class(
+                self._host,
+                self._username,
+                self._password,
+                self._port or self._ports.get(session_type),
+            )
+            try:
+                await session.connect(logger)
+                return session
+            except Exception as e:
+                logger.debug(f"{session_type} session failed: {e}")
+                await session.disconnect()
+                exceptions.append(f"{session_type}: {e}")
+        raise LayerOneDriverException(
+            f"Failed to open session: {', '.join(exceptions)}"
+        )
+
+    @asynccontextmanager
+    async def default_mode_service(self):
+        """Default mode cli service of a pooled or new session."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._pool_max_size)
+        async with self._semaphore:
+            session = None
+            while self._idle_sessions and session is None:
+                session = self._idle_sessions.pop()
+                if not session.active():
+                    session = None
+            if session is None:
+                session = await self._new_session()
+            try:
+                yield AsyncCliService(session)
+            except (ExpectedSessionException, OSError, asyncio.CancelledError):
+                # output of the interrupted command can still arrive
+                await session.disconnect()
+                session = None
+                raise
+            finally:
+                if session is not None:
+                    self._idle_sessions.append(session)
+
+    async def close(self):
+        """Disconnect idle sessions."""
+        while self._idle_sessions:
+            await self._idle_sessions.pop().disconnect()
@@ -0,0 +1,356 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import re
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from logging import Logger
+
+from cloudshell.cli.session.expect_session import normalize_buffer
+from cloudshell.cli.session.session_exceptions import (
+    CommandExecutionException,
+    ExpectedSessionException,
+    SessionLoopDetectorException,
+)
+from cloudshell.layer_one.core.helper.logger import get_l1_logger
+
+from netscout_teststream.cli.netscout_command_modes import DefaultCommandMode
+from netscout_teststream.command_templates.errors import GENERIC_ERRORS
+
+try:
+    import asyncssh
+except ImportError:  # pragma: no cover
+    asyncssh = None
+
+logger = get_l1_logger(name=__name__)
+
+
+class AsyncExpectSession(ABC):
+    """Netscout CLI session on asyncio streams.
+
+    Works like the cloudshell-cli expect session, but waits for the prompt
+    without holding a thread, so sessions of different switches are served
+    by one event loop.
+    """
+
+    SESSION_TYPE = None
+    NEW_LINE = "\r"
+    READ_SIZE = 65536
+    TIMEOUT = 30
+    MAX_ACTION_LOOPS = 3
+
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        password: str,
+        port: int = None,
+        timeout: int = TIMEOUT,
+    ):
+        self.host = host
+        self.username = username
+        self.password = password
+        self.port = port
+        self._timeout = timeout
+        self.selected_switch = None
+
+    @staticmethod
+    def _login_error_map() -> OrderedDict:
+        error_map = OrderedDict(
+            [
+                ("[Aa]ccess [Dd]enied", "Invalid username/password for login"),
+            ]
+        )
+        error_map.update(GENERIC_ERRORS)
+        return error_map
+
+    @staticmethod
+    def _login_action_map() -> OrderedDict:
+        action_map = OrderedDict()
+        action_map["Accept/Decline"] = lambda session, logger: session.send_line(
+            "A", logger
+        )
+        return action_map
+
+    async def connect(self, logger: Logger = logger):
+        await self._open()
+        await self._connect_actions(logger)
+
+    @abstractmethod
+    async def _open(self):
+        pass
+
+    @abstractmethod
+    async def _connect_actions(self, logger: Logger):
+        pass
+
+    @abstractmethod
+    async def _read(self) -> str:
+        pass
+
+    @abstractmethod
+    def _write(self, data: str):
+        pass
+
+    @abstractmethod
+    async def disconnect(self):
+        pass
+
+    @abstractmethod
+    def active(self) -> bool:
+        pass
+
+    async def send_line(self, command: str, logger: Logger = logger):
+        self._write(command + self.NEW_LINE)
+
+    @staticmethod
+    def _command_pattern(command: str) -> str:
+        return r"\s*" + re.sub(r"\\\s+", r"\\s+", re.escape(command)) + r"\s*"
+
+    async def hardware_expect(
+        self,
+        command: str | None,
+        expected_string: str,
+        logger: Logger = logger,
+        action_map: OrderedDict = None,
+        error_map: OrderedDict = None,
+        timeout: int = None,
+        remove_command_from_output: bool = True,
+        **optional_args,
+    ) -> str:
+        """Send the command and read the output up to the expected string.
+
+        Actions of the action map are called for the matched patterns, error
+        map is checked on the whole output.
+        """
+        if not expected_string:
+            raise ExpectedSessionException(
+                self.__class__.__name__, "List of expected messages can't be empty!"
+            )
+        action_map = action_map or OrderedDict()
+        error_map = error_map or OrderedDict()
+        timeout = timeout or self._timeout
+
+        if command is not None:
+            logger.debug(f"Command: {command}")
+            await self.send_line(command, logger)
+
+        output_list = []
+        output_str = ""
+        action_loops = {}
+        while True:
+            try:
+                read_buffer = await asyncio.wait_for(self._read(), timeout)
+            except asyncio.TimeoutError:
+                raise ExpectedSessionException(
+                    self.__class__.__name__,
+                    f"Expected string was not received in {timeout} seconds",
+                )
+            if not read_buffer:
+                raise ExpectedSessionException(
+                    self.__class__.__name__, "Session closed by the device"
+                )
+            read_buffer = normalize_buffer(read_buffer)
+            logger.debug(read_buffer)
+            output_str += read_buffer
+            if command and remove_command_from_output:
+                command_pattern = self._command_pattern(command)
+                if re.search(command_pattern, output_str, flags=re.MULTILINE):
+                    output_str = re.sub(
+                        command_pattern, "", output_str, count=1, flags=re.MULTILINE
+                    )
+                    remove_command_from_output = False
+
+            if re.search(expected_string, output_str, re.DOTALL):
+                output_list.append(output_str)
+                break
+
+            for action_key, action in action_map.items():
+                if re.search(action_key, output_str, re.DOTALL):
+                    output_list.append(output_str)
+                    action_loops[action_key] = action_loops.get(action_key, 0) + 1
+                    if action_loops[action_key] > self.MAX_ACTION_LOOPS:
+                        raise SessionLoopDetectorException(
+                            self.__class__.__name__,
+                            "Expected actions loops detected",
+                        )
+                    logger.debug(f"Action key: {action_key}")
+                    result = action(self, logger)
+                    if inspect.isawaitable(result):
+                        await result
+                    output_str = ""
+                    break
+
+        result_output = "".join(output_list)
+        for error_pattern, error in error_map.items():
+            if re.search(error_pattern, result_output, re.DOTALL):
+                if isinstance(error, CommandExecutionException):
+                    raise error
+                raise CommandExecutionException(f"Session returned '{error}'")
+        return result_output
+
+    async def probe_for_prompt(self, expected_string: str, logger: Logger = logger):
+        return await self.hardware_expect(
+            "", expected_string, logger, remove_command_from_output=False
+        )
+
+
+class AsyncTelnetSession(AsyncExpectSession):
+    """Telnet session, options offered by the device are declined."""
+
+    SESSION_TYPE = "TELNET"
+    DEFAULT_PORT = 23
+
+    IAC = 255
+    DONT = 254
+    DO = 253
+    WONT = 252
+    WILL = 251
+    SB = 250
+    SE = 240
+    ECHO = 1
+    SGA = 3
+    ACCEPTED_OPTIONS = (ECHO, SGA)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._reader = None
+        self._writer = None
+        self._pending = b""
+
+    async def _open(self):
+        self._reader, self._writer = await asyncio.open_connection(
+            self.host, self.port or self.DEFAULT_PORT
+        )
+
+    async def _connect_actions(self, logger: Logger):
+        self.selected_switch = None
+        await self.hardware_expect(
+            None,
+            DefaultCommandMode.PROMPT,
+            logger,
+            action_map=self._login_action_map(),
+            error_map=self._login_error_map(),
+        )
+        await self.hardware_expect(
+            f"logon {self.username} {self.password}",
+            DefaultCommandMode.PROMPT,
+            logger,
+            action_map=self._login_action_map(),
+            error_map=self._login_error_map(),
+        )
+
+    def _negotiate(self, data: bytes) -> bytes:
+        """Remove telnet commands from the data, answer option requests."""
+        data = self._pending + data
+        self._pending = b""
+        result = bytearray()
+        index = 0
+        while index < len(data):
+            byte = data[index]
+            if byte != self.IAC:
+                result.append(byte)
+                index += 1
+                continue
+            if index + 1 >= len(data):
+                self._pending = data[index:]
+                break
+            command = data[index + 1]
+            if command == self.IAC:
+                result.append(self.IAC)
+                index += 2
+            elif command in (self.DO, self.DONT, self.WILL, self.WONT):
+                if index + 2 >= len(data):
+                    self._pending = data[index:]
+                    break
+                self._answer(command, data[index + 2])
+                index += 3
+            elif command == self.SB:
+                end = data.find(bytes([self.IAC, self.SE]), index)
+                if end < 0:
+                    self._pending = data[index:]
+                    break
+                index = end + 2
+            else:
+                index += 2
+        return bytes(result)
+
+    def _answer(self, command: int, option: int):
+        if command == self.DO:
+            answer = self.WONT
+        elif command == self.WILL:
+            answer = self.DO if option in self.ACCEPTED_OPTIONS else self.DONT
+        else:
+            return
+        self._writer.write(bytes([self.IAC, answer, option]))
+
+    async def _read(self) -> str:
+        while True:
+            data = await self._reader.read(self.READ_SIZE)
+            if not data:
+                return ""
+            data = self._negotiate(data)
+            if data:
+                return data.decode(errors="replace")
+
+    def _write(self, data: str):
+        self._writer.write(data.encode())
+
+    async def disconnect(self):
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+
+    def active(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+
+class AsyncSSHSession(AsyncExpectSession):
+    """SSH session, needs the asyncssh package."""
+
+    SESSION_TYPE = "SSH"
+    DEFAULT_PORT = 22
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._connection = None
+        self._process = None
+
+    async def _open(self):
+        if asyncssh is None:
+            raise ExpectedSessionException(
+                self.__class__.__name__, "asyncssh package is required for SSH"
+            )
+        self._connection = await asyncssh.connect(
+            self.host,
+            self.port or self.DEFAULT_PORT,
+            username=self.username,
+            password=self.password,
+            known_hosts=None,
+        )
+        self._process = await self._connection.create_process(term_type="vt100")
+
+    async def _connect_actions(self, logger: Logger):
+        self.selected_switch = None
+        await self.hardware_expect(
+            None,
+            DefaultCommandMode.PROMPT,
+            logger,
+            action_map=self._login_action_map(),
+            error_map=self._login_error_map(),
+        )
+
+    async def _read(self) -> str:
+        return await self._process.stdout.read(self.READ_SIZE)
+
+    def _write(self, data: str):
+        self._process.stdin.write(data)
+
+    async def disconnect(self):
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+
+    def active(self) -> bool:
+        return self._connection is not None
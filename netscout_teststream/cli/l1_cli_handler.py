@@ -1,40 +1,88 @@
 from __future__ import annotations
 
-from cloudshell.cli.service.cli import CLI
+import importlib
+
 from cloudshell.cli.service.command_mode import CommandMode
 from cloudshell.cli.service.session_pool_context_manager import (
     SessionPoolContextManager,
 )
-from cloudshell.cli.service.session_pool_manager import SessionPoolManager
-from cloudshell.cli.session.ssh_session import SSHSession
-from cloudshell.cli.session.telnet_session import TelnetSession
 from cloudshell.layer_one.core.helper.logger import get_l1_logger
 from cloudshell.layer_one.core.helper.runtime_configuration import RuntimeConfiguration
 from cloudshell.layer_one.core.layer_one_driver_exception import LayerOneDriverException
 
+from netscout_teststream.cli.session_pool import (
+    KeepaliveSessionPoolManager,
+    PooledSessionContextManager,
+)
+
 logger = get_l1_logger(name=__name__)
 
 
 class L1CliHandler:
+    POOL_MAX_SIZE = 1
+    POOL_TIMEOUT = 100
+    POOL_KEEPALIVE_INTERVAL = 60
+    # session classes are imported on the first connection, SSH pulls paramiko
+    SESSION_TYPES = {
+        "SSH": "cloudshell.cli.session.ssh_session.SSHSession",
+        "TELNET": "cloudshell.cli.session.telnet_session.TelnetSession",
+    }
+
     def __init__(self):
-        self._cli = CLI(session_pool=SessionPoolManager(max_pool_size=1))
-        self._defined_session_types = {"SSH": SSHSession, "TELNET": TelnetSession}
+        runtime_config = RuntimeConfiguration()
+        self._session_pool = KeepaliveSessionPoolManager(
+            max_pool_size=int(
+                runtime_config.read_key("CLI.POOL.MAX_SIZE", self.POOL_MAX_SIZE)
+            ),
+            pool_timeout=int(
+                runtime_config.read_key("CLI.POOL.TIMEOUT", self.POOL_TIMEOUT)
+            ),
+            keepalive_interval=int(
+                runtime_config.read_key(
+                    "CLI.POOL.KEEPALIVE_INTERVAL", self.POOL_KEEPALIVE_INTERVAL
+                )
+            ),
+        )
+        self._defined_session_types = dict(self.SESSION_TYPES)
 
         self._session_types = (
-            RuntimeConfiguration().read_key("CLI.TYPE")
-            or self._defined_session_types.keys()
+            runtime_config.read_key("CLI.TYPE") or self._defined_session_types.keys()
         )
-        self._ports = RuntimeConfiguration().read_key("CLI.PORTS")
+        self._ports = runtime_config.read_key("CLI.PORTS", {})
 
         self._host = None
         self._username = None
         self._password = None
         self._port = None
+        self._sessions = None
+
+    def close(self):
+        """Stop the session keepalive, disconnect idle sessions."""
+        self._session_pool.close(logger)
 
     def _new_sessions(self) -> list:
+        """Defined sessions, created once for the session attributes.
+
+        The pool connects copies of them, so they can be reused to check
+        compatibility of the pooled sessions.
+        """
+        if self._sessions is None:
+            self._sessions = self._create_sessions()
+        return self._sessions
+
+    def _session_class(self, session_type: str):
+        """Session class of the type, imported from its path on first use."""
+        session_class = self._defined_session_types.get(session_type)
+        if isinstance(session_class, str):
+            module_name, _, class_name = session_class.rpartition(".")
+            session_class = getattr(importlib.import_module(module_name), class_name)
+            self._defined_session_types[session_type] = session_class
+        return session_class
+
+    def _create_sessions(self) -> list:
         sessions = []
         for session_type in self._session_types:
-            session_class = self._defined_session_types.get(session_type)
+            session_class = self._session_class(session_type)
             if not session_class:
                 raise LayerOneDriverException(
                     f"Session type {session_type} is not defined"
@@ -56,6 +104,7 @@ class L1CliHandler:
         self._username = username
         self._password = password
         self._port = port
+        self._sessions = None
 
     def get_cli_service(self, command_mode: CommandMode) -> SessionPoolContextManager:
         """Create new cli service or get it from pool."""
@@ -63,4 +112,6 @@ class L1CliHandler:
             raise LayerOneDriverException(
                 "Cli Attributes is not defined, call Login command first"
             )
-        return self._cli.get_session(self._new_sessions(), command_mode, logger)
+        return PooledSessionContextManager(
+            self._session_pool, self._new_sessions(), command_mode, logger
+        )
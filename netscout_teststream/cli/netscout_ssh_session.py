@@ -8,6 +8,7 @@ from netscout_teststream.command_templates.errors import GENERIC_ERRORS
 
 class NetscoutSSHSession(SSHSession):
     def _connect_actions(self, prompt, logger):
+        self.selected_switch = None
         error_map = OrderedDict(
             [
                 ("[Aa]ccess [Dd]enied", "Invalid username/password for login"),
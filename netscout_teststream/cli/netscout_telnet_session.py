@@ -8,6 +8,7 @@ from netscout_teststream.command_templates.errors import GENERIC_ERRORS
 
 class NetscoutTelnetSession(TelnetSession):
     def _connect_actions(self, prompt, logger):
+        self.selected_switch = None
         command = f"logon {self.username} {self.password}"
         error_map = OrderedDict(
             [
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from logging import Logger
+
+from cloudshell.cli.service.cli_service_impl import CliServiceImpl
+from cloudshell.cli.service.session_manager_impl import SessionManagerImpl
+from cloudshell.cli.service.session_pool_context_manager import (
+    SessionPoolContextManager,
+)
+from cloudshell.cli.service.session_pool_manager import (
+    SessionPoolException,
+    SessionPoolManager,
+)
+from cloudshell.layer_one.core.helper.logger import get_l1_logger
+
+from netscout_teststream.metrics import METRICS
+
+logger = get_l1_logger(name=__name__)
+
+
+class KeepaliveSessionPoolManager(SessionPoolManager):
+    """Session pool which keeps idle sessions logged in and drops dead ones.
+
+    Sessions idle in the pool are probed for the prompt every
+    keepalive_interval seconds, sessions which do not answer are removed.
+    A session idle for longer than keepalive_interval is probed again before
+    it is handed out.
+
+    Only the checkout is done under the pool lock, probing and connecting
+    sessions are not, so a slow or dead session does not block the threads
+    waiting for the pool.
+    """
+
+    KEEPALIVE_INTERVAL = 60
+
+    def __init__(
+        self,
+        max_pool_size: int = SessionPoolManager.MAX_POOL_SIZE,
+        pool_timeout: int = SessionPoolManager.POOL_TIMEOUT,
+        keepalive_interval: int = KEEPALIVE_INTERVAL,
+    ):
+        super().__init__(
+            session_manager=SessionManagerImpl(),
+            max_pool_size=max_pool_size,
+            pool_timeout=pool_timeout,
+        )
+        self._keepalive_interval = keepalive_interval
+        self._keepalive_thread = None
+        self._stop_event = threading.Event()
+        self._prompt = None
+        self._connecting = 0
+
+    def get_session(self, defined_sessions: list, prompt: str, logger: Logger):
+        """Return session from the pool, register checkout latency."""
+        start_time = time.time()
+        self._prompt = prompt
+        self._start_keepalive()
+        while True:
+            session = self._checkout(start_time)
+            if session is None:
+                session = self._connect(defined_sessions, prompt, logger)
+                break
+            if self._session_manager.is_compatible(
+                session, defined_sessions, logger
+            ) and self._is_alive(session, prompt, logger):
+                break
+            logger.debug("Pooled session is dead or changed, removing it")
+            self.remove_session(session, logger)
+        METRICS.observe_checkout(
+            time.time() - start_time, reused=not session.new_session
+        )
+        return session
+
+    def _checkout(self, start_time: float):
+        """Pooled session, or None if a slot for a new session is reserved."""
+        with self._session_condition:
+            while True:
+                if not self._pool.empty():
+                    return self._pool.get(False)
+                sessions_count = self._session_manager.existing_sessions_count()
+                if sessions_count + self._connecting < self._pool.maxsize:
+                    self._connecting += 1
+                    return None
+                wait_time = self._pool_timeout - (time.time() - start_time)
+                if wait_time <= 0:
+                    raise SessionPoolException(
+                        self.__class__.__name__,
+                        f"Cannot get session instance during {self._pool_timeout} sec.",
+                    )
+                self._session_condition.wait(wait_time)
+
+    def _connect(self, defined_sessions: list, prompt: str, logger: Logger):
+        """New session in the reserved slot."""
+        try:
+            return self._new_session(defined_sessions, prompt, logger)
+        finally:
+            with self._session_condition:
+                self._connecting -= 1
+                self._session_condition.notify()
+
+    def return_session(self, session, logger: Logger):
+        session.last_used = time.time()
+        super().return_session(session, logger)
+
+    def remove_session(self, session, logger: Logger):
+        session.disconnect()
+        super().remove_session(session, logger)
+
+    def _new_session(self, new_sessions: list, prompt: str, logger: Logger):
+        # defined sessions are kept by the cli handler and used to check
+        # compatibility, connect copies of them
+        session = super()._new_session(
+            [copy.copy(new_session) for new_session in new_sessions], prompt, logger
+        )
+        session.last_used = time.time()
+        return session
+
+    def _is_alive(self, session, prompt: str, logger: Logger) -> bool:
+        if not session.active():
+            return False
+        idle_time = time.time() - getattr(session, "last_used", 0)
+        if self._keepalive_interval and idle_time < self._keepalive_interval:
+            return True
+        try:
+            session.probe_for_prompt(prompt, logger)
+        except Exception as e:
+            logger.debug(f"Session probe failed: {e}")
+            return False
+        session.last_used = time.time()
+        return True
+
+    def keepalive(self, logger: Logger = logger):
+        """Probe idle sessions, remove sessions which are not alive."""
+        with self._session_condition:
+            idle_sessions = []
+            while not self._pool.empty():
+                idle_sessions.append(self._pool.get(False))
+
+        for session in idle_sessions:
+            if self._is_alive(session, self._prompt, logger):
+                with self._session_condition:
+                    self._pool.put(session)
+                    self._session_condition.notify()
+            else:
+                logger.debug("Removing dead session from the pool")
+                self.remove_session(session, logger)
+
+    def _start_keepalive(self):
+        if not self._keepalive_interval or self._keepalive_thread:
+            return
+        self._keepalive_thread = threading.Thread(
+            target=self._keepalive_loop, name="cli-keepalive", daemon=True
+        )
+        self._keepalive_thread.start()
+
+    def _keepalive_loop(self):
+        while not self._stop_event.wait(self._keepalive_interval):
+            try:
+                self.keepalive()
+            except Exception:
+                logger.exception("Session keepalive failed:")
+
+    def close(self, logger: Logger = logger):
+        """Stop the keepalive thread, disconnect idle sessions."""
+        self._stop_event.set()
+        if self._keepalive_thread:
+            self._keepalive_thread.join()
+        with self._session_condition:
+            idle_sessions = []
+            while not self._pool.empty():
+                idle_sessions.append(self._pool.get(False))
+        for session in idle_sessions:
+            self.remove_session(session, logger)
+
+
+class PooledSessionContextManager(SessionPoolContextManager):
+    """Reuse the cli service of a pooled session.
+
+    Pooled sessions stay in the default mode, so the prompt detection done by
+    a new cli service is needed only for new sessions.
+    """
+
+    def _initialize_cli_service(self, session, prompt: str) -> CliServiceImpl:
+        cli_service = getattr(session, "cli_service", None)
+        if session.new_session or cli_service is None:
+            cli_service = super()._initialize_cli_service(session, prompt)
+            session.cli_service = cli_service
+        return cli_service
@@ -1,11 +1,27 @@
 import os
 import re
+import time
 
 from cloudshell.cli.service.cli_service import CliService
 
+import netscout_teststream.command_actions.actions_helper as helper
 from netscout_teststream.cli.l1_cli_handler import L1CliHandler
 
 
+def command_output(data_path, command):
+    """Output of the command saved in the data folder, None if not saved."""
+    file_name = re.sub(r"\*", "asterisk", command)
+    file_name = re.sub(r"\s", "_", file_name)
+    file_name = re.sub('"', "", file_name)
+
+    try:
+        with open(os.path.join(data_path, file_name + ".txt")) as f:
+            output = f.read()
+        return output
+    except OSError:
+        pass
+
+
 class TestCliContextManager:
     def __init__(self, test_cli):
         self._test_cli = test_cli
@@ -18,9 +34,10 @@ class TestCliContextManager:
 
 
 class TestCliService(CliService):
-    def __init__(self, data_path, logger):
+    def __init__(self, data_path, logger, latency=0):
         self._data_path = data_path
         self._logger = logger
+        self._latency = latency
 
     def reconnect(self, timeout=None):
         pass
@@ -36,25 +53,30 @@ class TestCliService(CliService):
         error_map=None,
         logger=None,
         *args,
-        **kwargs
+        **kwargs,
     ):
+        if self._latency:
+            time.sleep(self._latency)
+        if expected_string:
+            # pipelined commands, every output ends with the prompt
+            return "".join(
+                f"{self._command_output(burst_command) or ''}\n"
+                f"{helper.PROMPT_MARKER} "
+                for burst_command in command.split(helper.BURST_SEPARATOR)
+            )
+        return self._command_output(command)
+
+    def _command_output(self, command):
         self._logger.debug(command)
-        file_name = re.sub(r"\*", "asterisk", command)
-        file_name = re.sub(r"\s", "_", file_name)
-        file_name = re.sub('"', "", file_name)
-
-        try:
-            with open(os.path.join(self._data_path, file_name + ".txt")) as f:
-                output = f.read()
-            return output
-        except OSError:
-            pass
+        return command_output(self._data_path, command)
 
 
 class CLISimulator(L1CliHandler):
-    def __init__(self, data_path, logger):
+    def __init__(self, data_path, logger, latency=0):
         super().__init__()
-        self._cli_service = TestCliContextManager(TestCliService(data_path, logger))
+        self._cli_service = TestCliContextManager(
+            TestCliService(data_path, logger, latency)
+        )
 
     def get_cli_service(self, command_mode):
         return self._cli_service
@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import re
+
+from netscout_teststream.cli.simulator.cli_simulator import command_output
+from netscout_teststream.cli.simulator.simulated_switch import SimulatedSwitch
+
+try:
+    import asyncssh
+except ImportError:  # pragma: no cover
+    asyncssh = None
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "data")
+
+# every message matches one of the GENERIC_ERRORS patterns
+INJECTED_ERRORS = (
+    "License expired!",
+    "Invalid command",
+    "Command execution error",
+    "Switch not found",
+)
+
+
+class _CommandError(Exception):
+    """Command rejected by the emulated switch."""
+
+
+class FakeSwitchServer:
+    """TestStream emulator serving the simulator data over Telnet or SSH.
+
+    Emulates the prompt, the logon command, select switch and the mapping
+    commands, connections are kept per switch and shared by all sessions.
+    Other commands are answered with the saved outputs. Every command can be
+    delayed, commands matching command_latency patterns by their own
+    latency, and rejected with a random generic error at error_rate,
+    only the commands matching error_commands if it is set.
+    """
+
+    BANNER = "TestStream Management\r\n"
+    PROMPT = "=> "
+    ACCESS_DENIED = "Access Denied"
+    LOGON_REQUIRED = "Please logon first"
+    SWITCH_NOT_FOUND = "Switch not found"
+    NO_SWITCH_SELECTED = "ERROR: switch is not selected"
+    INCORRECT_PORT = "Incorrect port number"
+    NOT_SIMPLEX = "Subport is not simplex connected"
+    NOT_DUPLEX = "ERROR: ports are not duplex connected"
+    READ_SIZE = 4096
+    # option negotiation and other telnet commands sent by the clients
+    TELNET_COMMAND = re.compile(
+        rb"\xff[\xfb-\xfe].|\xff\xfa.*?\xff\xf0|\xff[\xf0-\xf9]", re.DOTALL
+    )
+
+    def __init__(
+        self,
+        username: str = "admin",
+        password: str = "admin",
+        data_path: str = DATA_PATH,
+        latency: float = 0,
+        command_latency: dict = None,
+        error_rate: float = 0,
+        error_commands: str = None,
+        seed: int = None,
+    ):
+        self.username = username
+        self.password = password
+        self.data_path = data_path
+        self.latency = latency
+        self.command_latency = {
+            re.compile(pattern): delay
+            for pattern, delay in (command_latency or {}).items()
+        }
+        self.error_rate = error_rate
+        self.error_commands = re.compile(error_commands or "")
+        self._random = random.Random(seed)
+        self.commands = []
+        self.switches = {}
+        self.host = None
+        self.port = None
+        self.ssh_port = None
+        self._server = None
+        self._ssh_server = None
+        self._writers = set()
+        self._handlers = (
+            (r'select switch "?([^"]+?)"?$', self._select_switch),
+            (r'show connection switch "?([^"]+?)"?$', self._show_connections),
+            (r'show port rawinfo \* switch "?([^"]+?)"?$', self._show_rawinfo),
+            (r"show conn prtnum (\S+)$", self._show_port_connections),
+            (
+                r"CONNECT -([sd]) -F PRTNUM (\S+) PRTNUM (\S+)$",
+                self._connect_new,
+            ),
+            (
+                r"connect (simplex|duplex) prtnum (\S+) to (\S+) force$",
+                self._connect,
+            ),
+            (
+                r"DISCONNECT -([sd]) -F PRTNUM (\S+) PRTNUM (\S+)$",
+                self._disconnect_new,
+            ),
+            (r"disconnect simplex (\S+) force$", self._disconnect_simplex),
+            (r"disconnect duplex prtnum (\S+) force$", self._disconnect_duplex),
+            (
+                r"disconnect multicast destination (\S+) force$",
+                self._disconnect_mcast,
+            ),
+        )
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0):
+        """Start the Telnet server, port 0 picks a free port."""
+        self._server = await asyncio.start_server(self._handle_telnet, host, port)
+        self.host, self.port = self._server.sockets[0].getsockname()[:2]
+
+    async def start_ssh(self, host: str = "127.0.0.1", port: int = 0):
+        """Start the SSH server, needs the asyncssh package."""
+        if asyncssh is None:
+            raise Exception("asyncssh package is required for SSH")
+        server = self
+
+        class _SSHServer(asyncssh.SSHServer):
+            def begin_auth(self, username):
+                return True
+
+            def password_auth_supported(self):
+                return True
+
+            def validate_password(self, username, password):
+                return (username, password) == (server.username, server.password)
+
+        self._ssh_server = await asyncssh.create_server(
+            _SSHServer,
+            host,
+            port,
+            server_host_keys=[asyncssh.generate_private_key("ssh-rsa")],
+            process_factory=self._handle_ssh,
+        )
+        self.ssh_port = self._ssh_server.get_port()
+
+    async def close(self):
+        """Stop the servers and close the sessions."""
+        for writer in self._writers:
+            writer.close()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._ssh_server:
+            self._ssh_server.close()
+            await self._ssh_server.wait_closed()
+            self._ssh_server = None
+
+    def switch(self, name: str) -> SimulatedSwitch | None:
+        if name not in self.switches:
+            self.switches[name] = SimulatedSwitch.from_data(self.data_path, name)
+        return self.switches[name]
+
+    async def _handle_telnet(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        async def read():
+            data = await reader.read(self.READ_SIZE)
+            if not data:
+                return None
+            return self.TELNET_COMMAND.sub(b"", data).decode(errors="replace")
+
+        def write(data):
+            writer.write(data.encode())
+
+        self._writers.add(writer)
+        try:
+            await self._serve(read, write, writer.drain, logged_in=False)
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _handle_ssh(self, process):
+        async def read():
+            return await process.stdin.read(self.READ_SIZE) or None
+
+        async def drain():
+            await process.stdout.drain()
+
+        try:
+            await self._serve(read, process.stdout.write, drain, logged_in=True)
+        finally:
+            process.exit(0)
+
+    async def _serve(self, read, write, drain, logged_in: bool):
+        session = {"logged_in": logged_in, "switch": None}
+        write(f"{self.BANNER}{self.PROMPT}")
+        buffer = ""
+        while True:
+            data = await read()
+            if data is None:
+                break
+            buffer += data
+            *lines, buffer = re.split(r"\r\n|\r|\n", buffer)
+            # a switch answers the commands one by one, like a terminal
+            for command in lines:
+                command = command.strip()
+                output = await self._answer(session, command) if command else ""
+                write(f"{command}\r\n{output}\r\n{self.PROMPT}")
+                await drain()
+
+    async def _answer(self, session: dict, command: str) -> str:
+        self.commands.append(command)
+        match = re.match(r"logon\s+(\S+)\s+(\S+)$", command)
+        if match:
+            session["logged_in"] = match.groups() == (self.username, self.password)
+            return "" if session["logged_in"] else self.ACCESS_DENIED
+        if not session["logged_in"]:
+            return self.LOGON_REQUIRED
+
+        await asyncio.sleep(self._latency(command))
+        if (
+            self.error_rate
+            and self.error_commands.search(command)
+            and self._random.random() < self.error_rate
+        ):
+            return self._random.choice(INJECTED_ERRORS)
+
+        for pattern, handler in self._handlers:
+            match = re.match(pattern, command)
+            if match:
+                try:
+                    return handler(session, *match.groups())
+                except _CommandError as e:
+                    return str(e)
+        return command_output(self.data_path, command) or ""
+
+    def _latency(self, command: str) -> float:
+        for pattern, delay in self.command_latency.items():
+            if pattern.search(command):
+                return delay
+        return self.latency
+
+    def _select_switch(self, session: dict, name: str) -> str:
+        self._known_switch(name)
+        session["switch"] = name
+        return ""
+
+    def _show_connections(self, session: dict, name: str) -> str:
+        return self._known_switch(name).connection_output()
+
+    def _show_rawinfo(self, session: dict, name: str) -> str:
+        return self._known_switch(name).rawinfo_output()
+
+    def _known_switch(self, name: str) -> SimulatedSwitch:
+        switch = self.switch(name)
+        if switch is None:
+            raise _CommandError(self.SWITCH_NOT_FOUND)
+        return switch
+
+    def _selected_switch(self, session: dict, *ports: str) -> SimulatedSwitch:
+        if session["switch"] is None:
+            raise _CommandError(self.NO_SWITCH_SELECTED)
+        switch = self.switch(session["switch"])
+        if len(set(ports)) != len(ports) or not all(map(switch.has_port, ports)):
+            raise _CommandError(self.INCORRECT_PORT)
+        return switch
+
+    def _show_port_connections(self, session: dict, port: str) -> str:
+        switch = self._selected_switch(session, port)
+        return switch.connection_output(port)
+
+    def _connect_new(self, session: dict, flag: str, src_port: str, dst_port: str):
+        return self._connect(
+            session, "duplex" if flag == "d" else "simplex", src_port, dst_port
+        )
+
+    def _connect(
+        self, session: dict, connection_type: str, src_port: str, dst_port: str
+    ) -> str:
+        switch = self._selected_switch(session, src_port, dst_port)
+        switch.connect(src_port, dst_port, duplex=connection_type == "duplex")
+        return ""
+
+    def _disconnect_new(self, session: dict, flag: str, src_port: str, dst_port: str):
+        switch = self._selected_switch(session, src_port, dst_port)
+        if flag == "d":
+            return self._disconnected(switch.disconnect_duplex(dst_port, src_port))
+        return self._disconnected(switch.disconnect_simplex(dst_port, src_port), True)
+
+    def _disconnect_simplex(self, session: dict, dst_port: str) -> str:
+        switch = self._selected_switch(session, dst_port)
+        return self._disconnected(switch.disconnect_simplex(dst_port), True)
+
+    def _disconnect_duplex(self, session: dict, dst_port: str) -> str:
+        switch = self._selected_switch(session, dst_port)
+        return self._disconnected(switch.disconnect_duplex(dst_port))
+
+    def _disconnected(self, removed: bool, simplex: bool = False) -> str:
+        if removed:
+            return ""
+        return self.NOT_SIMPLEX if simplex else self.NOT_DUPLEX
+
+    def _disconnect_mcast(self, session: dict, dst_port: str) -> str:
+        switch = self._selected_switch(session, dst_port)
+        switch.disconnect_simplex(dst_port)
+        return ""
+
+
+async def serve(args: argparse.Namespace):
+    server = FakeSwitchServer(
+        args.username,
+        args.password,
+        args.data_path,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        error_commands=args.error_commands,
+        seed=args.seed,
+    )
+    await server.start(args.host, args.port)
+    print(f"Telnet: {server.host}:{server.port}")  # noqa: T201
+    if args.ssh_port is not None:
+        await server.start_ssh(args.host, args.ssh_port)
+        print(f"SSH: {server.host}:{server.ssh_port}")  # noqa: T201
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TestStream switch emulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2323, help="Telnet port")
+    parser.add_argument("--ssh-port", type=int, help="SSH port, needs asyncssh")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument("--data-path", default=DATA_PATH)
+    parser.add_argument("--latency", type=float, default=0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0, help="0..1")
+    parser.add_argument("--error-commands", help="regex of the failing commands")
+    parser.add_argument("--seed", type=int)
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
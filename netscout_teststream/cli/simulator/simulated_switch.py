@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import csv
+import io
+
+import netscout_teststream.command_actions.actions_helper as helper
+from netscout_teststream.cli.simulator.cli_simulator import command_output
+from netscout_teststream.command_actions.connection_table import (
+    CONNECTION_COLUMNS,
+    DST_INDEX,
+    SRC_INDEX,
+    TYPE_INDEX,
+)
+
+
+class SimulatedSwitch:
+    """Ports and connections of one switch, changed by the mapping commands.
+
+    Initial state is loaded from the port rawinfo and show connection
+    outputs of the simulator data. Connected flags of the port rawinfo are
+    recalculated for the ports touched by the mapping commands.
+    """
+
+    SIMPLEX = "Simplex"
+    DUPLEX = "Duplex"
+    COLUMNS = (
+        ("GEO addr", 8),
+        ("Name (>20 ..)", 23),
+        ("Rx Pwr(dBm)", 11),
+        ("Conn Type", 9),
+        ("GEO addr", 8),
+        ("Name (>20 ..)", 23),
+        ("Rx Pwr(dBm)", 11),
+        ("Speed", 7),
+        ("Protocol", 8),
+    )
+    COLUMN_SEPARATOR = "  "
+    RX_POWER = "Not Present"
+    SPEED = "-"
+    PROTOCOL = "Ethernet"
+    RAWINFO_QUOTE = "'"
+    CONNECTED = "01"
+    NOT_CONNECTED = "00"
+    MODE_INDEX = 2
+    NOT_USED_PORT_MODE = 16
+    SRC_FLAG_INDEX = 3
+    DST_FLAG_INDEX = 4
+    NAME_INDEX = 8
+    NOT_FOUND = "Connection not found"
+
+    def __init__(self, name: str, rawinfo_output: str, connection_output: str = ""):
+        self.name = name
+        self._ports = {}
+        for row in csv.reader(
+            io.StringIO(rawinfo_output),
+            quotechar=self.RAWINFO_QUOTE,
+            skipinitialspace=True,
+        ):
+            if len(row) > self.NAME_INDEX:
+                row[0] = row[0].strip()
+                row[self.NAME_INDEX :] = [",".join(row[self.NAME_INDEX :])]
+                self._ports[row[0]] = row
+        self._connections = []
+        if "connection not found" not in connection_output.lower():
+            self._connections = [
+                list(row)
+                for row in helper.iter_rows(connection_output, CONNECTION_COLUMNS)
+            ]
+
+    @classmethod
+    def from_data(cls, data_path: str, name: str) -> SimulatedSwitch | None:
+        """Switch of the simulator data, None if the data has no such switch."""
+        rawinfo_output = command_output(
+            data_path, f'show port rawinfo * switch "{name}"'
+        )
+        if rawinfo_output is None:
+            return None
+        connection_output = command_output(
+            data_path, f'show connection switch "{name}"'
+        )
+        return cls(name, rawinfo_output, connection_output or "")
+
+    def has_port(self, address: str) -> bool:
+        return address in self._ports
+
+    def idle_ports(self) -> list[str]:
+        """Used ports without connections."""
+        return [
+            address
+            for address, row in self._ports.items()
+            if int(row[self.MODE_INDEX]) != self.NOT_USED_PORT_MODE
+            and row[self.SRC_FLAG_INDEX] == self.NOT_CONNECTED
+            and row[self.DST_FLAG_INDEX] == self.NOT_CONNECTED
+        ]
+
+    def _port_name(self, address: str) -> str:
+        return self._ports[address][self.NAME_INDEX]
+
+    def _remove(self, condition) -> list[list[str]]:
+        removed = [row for row in self._connections if condition(row)]
+        self._connections = [row for row in self._connections if not condition(row)]
+        return removed
+
+    def _update_flags(self, addresses):
+        for address in addresses:
+            row = self._ports.get(address)
+            if row is None:
+                continue
+            as_src = as_dst = False
+            for connection in self._connections:
+                duplex = connection[TYPE_INDEX] == self.DUPLEX
+                if connection[SRC_INDEX] == address:
+                    as_src = True
+                    as_dst = as_dst or duplex
+                elif connection[DST_INDEX] == address:
+                    as_dst = True
+                    as_src = as_src or duplex
+            row[self.SRC_FLAG_INDEX] = self.CONNECTED if as_src else self.NOT_CONNECTED
+            row[self.DST_FLAG_INDEX] = self.CONNECTED if as_dst else self.NOT_CONNECTED
+
+    def _changed(self, rows: list[list[str]], *addresses: str):
+        touched = set(addresses)
+        for row in rows:
+            touched.update((row[SRC_INDEX], row[DST_INDEX]))
+        self._update_flags(touched)
+
+    def _involves(self, row: list[str], address: str) -> bool:
+        return address in (row[SRC_INDEX], row[DST_INDEX])
+
+    def connect(self, src_port: str, dst_port: str, duplex: bool = False):
+        """Connect the ports, replacing connections of the destination."""
+        if duplex:
+            removed = self._remove(
+                lambda row: self._involves(row, src_port)
+                or self._involves(row, dst_port)
+            )
+        else:
+            removed = self._remove(
+                lambda row: row[DST_INDEX] == dst_port
+                or (row[TYPE_INDEX] == self.DUPLEX and self._involves(row, dst_port))
+            )
+        self._connections.append(
+            [
+                src_port,
+                self._port_name(src_port),
+                self.RX_POWER,
+                self.DUPLEX if duplex else self.SIMPLEX,
+                dst_port,
+                self._port_name(dst_port),
+                self.RX_POWER,
+                self.SPEED,
+                self.PROTOCOL,
+            ]
+        )
+        self._changed(removed, src_port, dst_port)
+
+    def disconnect_simplex(self, dst_port: str, src_port: str = None) -> bool:
+        removed = self._remove(
+            lambda row: row[DST_INDEX] == dst_port
+            and row[TYPE_INDEX] != self.DUPLEX
+            and src_port in (None, row[SRC_INDEX])
+        )
+        self._changed(removed)
+        return bool(removed)
+
+    def disconnect_duplex(self, dst_port: str, src_port: str = None) -> bool:
+        removed = self._remove(
+            lambda row: row[TYPE_INDEX] == self.DUPLEX
+            and self._involves(row, dst_port)
+            and (src_port is None or self._involves(row, src_port))
+        )
+        self._changed(removed)
+        return bool(removed)
+
+    def _table(self, rows: list[list[str]]) -> str:
+        lines = [
+            self.COLUMN_SEPARATOR.join(
+                title.ljust(width) for title, width in self.COLUMNS
+            ).rstrip(),
+            self.COLUMN_SEPARATOR.join("-" * width for _, width in self.COLUMNS),
+        ]
+        for row in rows:
+            lines.append(
+                self.COLUMN_SEPARATOR.join(
+                    value.ljust(width) for value, (_, width) in zip(row, self.COLUMNS)
+                ).rstrip()
+            )
+        return f"Switch: {self.name} [ 1 ]\n\n" + "\n".join(lines) + "\n"
+
+    def connection_output(self, port: str = None) -> str:
+        """Show connection output of the switch or of the port."""
+        rows = self._connections
+        if port is not None:
+            rows = [row for row in rows if self._involves(row, port)]
+        if not rows:
+            return self.NOT_FOUND
+        return self._table(rows)
+
+    def rawinfo_output(self) -> str:
+        return "\n".join(
+            ",".join(row[: self.NAME_INDEX])
+            + f",{self.RAWINFO_QUOTE}{row[self.NAME_INDEX]}{self.RAWINFO_QUOTE}"
+            for row in self._ports.values()
+        )
@@ -1,6 +1,128 @@
 from __future__ import annotations
 
 import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Iterator
+
+PROMPT_MARKER = "=>"
+BURST_SEPARATOR = "\r"
+
+
+def _prompt_line(prompt_marker: str) -> str:
+    """Start of a prompt line, the marker after optional spaces."""
+    return rf"[^\S\n]*{re.escape(prompt_marker)}"
+
+
+def burst_prompt(commands_count: int, prompt_marker: str = PROMPT_MARKER) -> str:
+    """Expected string for the output of several pipelined commands.
+
+    Matches once the output has a prompt line for every command sent in the
+    burst. Every repetition takes whole lines up to the next prompt line
+    only, so a partial output fails in linear time, without backtracking.
+    """
+    prompt_line = _prompt_line(prompt_marker)
+    return (
+        rf"\A(?:[^\n]*(?:\n(?!{prompt_line})[^\n]*)*\n{prompt_line})"
+        rf"{{{commands_count}}}"
+    )
+
+
+@lru_cache()
+def _prompt_line_pattern(prompt_marker: str) -> re.Pattern:
+    return re.compile(rf"\n{_prompt_line(prompt_marker)}")
+
+
+def split_burst_output(
+    output: str, commands_count: int, prompt_marker: str = PROMPT_MARKER
+) -> list[str]:
+    """Split the output of pipelined commands into per command outputs.
+
+    Output is split on the prompt lines, the marker in a command echo or
+    an error message does not end the command output.
+    """
+    return _prompt_line_pattern(prompt_marker).split(output)[:commands_count]
+
+
+def match_error(error_map: OrderedDict, output: str) -> str | None:
+    """Return the message of the first error pattern found in the output.
+
+    Message has the same format as CommandExecutionException raised by the
+    session for a single command.
+    """
+    for error_pattern, error in error_map.items():
+        if re.search(error_pattern, output, re.DOTALL):
+            return f"Session returned '{error}'"
+    return None
+
+
+@lru_cache()
+def _border_pattern(header_border_separator: str, separator: str) -> re.Pattern:
+    return re.compile(
+        r"^\s*(?:{hbs}{{2,}}(?:{sep})*)+\s*$".format(
+            hbs=re.escape(header_border_separator), sep=re.escape(separator)
+        )
+    )
+
+
+def _column_widths(border_line: str) -> list[int]:
+    return [len(border) for border in border_line.split()]
+
+
+def iter_rows(
+    parsable_str: str,
+    header_column_names: list[str],
+    header_border_separator: str = "-",
+    separator: str = "  ",
+) -> Iterator[tuple[str, ...]]:
+    """Parse formatted table row by row, rows are tuples of the column values.
+
+    Column widths are taken once from the header border line, every row is
+    cut by the column offsets. A value longer than its column moves the
+    following columns to the right, as it is printed by the switch.
+
+    :param parsable_str: table output
+    :param header_column_names: list of column names
+    :param header_border_separator: character of the header border
+    :param separator: column separator
+    """
+    border_pattern = _border_pattern(header_border_separator, separator)
+    separator_len = len(separator)
+    column_widths = None
+    for line in parsable_str.splitlines():
+        if column_widths is None:
+            if border_pattern.match(line):
+                column_widths = _column_widths(line)
+                if len(column_widths) != len(header_column_names):
+                    raise Exception("Parsing table error")
+            continue
+
+        line = line.strip()
+        if not line:
+            continue
+        line_len = len(line)
+        row = []
+        start = 0
+        for width in column_widths:
+            end = start + width
+            while end < line_len and line[end] != " ":
+                end += 1
+            row.append(line[start:end].strip())
+            start = end + separator_len
+        yield tuple(row)
+
+
+def iter_table(
+    parsable_str: str,
+    header_column_names: list[str],
+    header_border_separator: str = "-",
+    separator: str = "  ",
+) -> Iterator[dict]:
+    """Parse formatted table row by row, rows are dicts by the column names."""
+    for row in iter_rows(
+        parsable_str, header_column_names, header_border_separator, separator
+    ):
+        yield dict(zip(header_column_names, row))
 
 
 def parse_table(
@@ -29,37 +151,8 @@ def parse_table(
     01.05.23  03 01.05.23              -2.800889    Duplex     01.03.05  03 01.03.05 - 10G To ..  Not Present  10000    Ethernet
 
     """  # noqa: E501
-    res = []
-    match = re.search(
-        r"(?P<header_border>({hbs}{{2,}}({sep})*)+)\s+(?P<info>.*)".format(
-            hbs=header_border_separator, sep=separator
-        ),
-        parsable_str,
-        re.DOTALL,
+    return list(
+        iter_table(
+            parsable_str, header_column_names, header_border_separator, separator
+        )
     )
-    if match:
-        border_list = list(map(len, match.group("header_border").strip().split()))
-
-        if len(border_list) != len(header_column_names):
-            raise Exception("Parsing table error")
-
-        for line in match.group("info").splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            data = {}
-            for i, name in enumerate(header_column_names):
-                info_len = border_list[i]
-
-                temp = line[:info_len].strip()
-                while len(line) > info_len and line[info_len] != " ":
-                    temp += line[info_len]
-                    info_len += 1
-
-                data.update({name: temp})
-                line = line[info_len + len(separator) :]
-
-            if data:
-                res.append(data)
-
-    return res
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from cloudshell.cli.command_template.command_template import CommandTemplate
+from cloudshell.layer_one.core.helper.logger import get_l1_logger
+
+import netscout_teststream.command_actions.actions_helper as helper
+import netscout_teststream.command_templates.autoload as autoload_template
+import netscout_teststream.command_templates.mappings as command_template
+from netscout_teststream.cli.async_cli_handler import (
+    AsyncCliService,
+    AsyncCommandTemplateExecutor,
+)
+from netscout_teststream.command_actions.autoload_actions import AutoloadActions
+from netscout_teststream.command_actions.connection_table import (
+    ConnectionInfoDTO,
+    ConnectionTable,
+)
+from netscout_teststream.command_actions.mapping_actions import (
+    MappingCommand,
+    MappingCommandBuilder,
+)
+
+logger = get_l1_logger(name=__name__)
+
+
+class AsyncMappingActions(MappingCommandBuilder):
+    """Mapping actions on an asyncio cli service."""
+
+    async def select_switch(self) -> str:
+        """Select the switch, once per session."""
+        if self._is_switch_selected():
+            return ""
+        output = await AsyncCommandTemplateExecutor(
+            self._cli_service, command_template.SELECT_SWITCH
+        ).execute_command(switch_name=self._switch_name)
+        self._set_switch_selected()
+        return output
+
+    async def _execute(self, mapping_command: MappingCommand) -> str:
+        await self.select_switch()
+        return await AsyncCommandTemplateExecutor(
+            self._cli_service, mapping_command.template
+        ).execute_command(**mapping_command.command_kwargs)
+
+    async def _send_burst(self, mapping_commands: list[MappingCommand]) -> list[str]:
+        """Send the commands at once, return output of every command."""
+        if not mapping_commands:
+            return []
+
+        await self.select_switch()
+        command, expected_string = self._burst(mapping_commands)
+        output = await self._cli_service.send_command(
+            command, expected_string=expected_string
+        )
+        return helper.split_burst_output(output, len(mapping_commands))
+
+    async def execute_batch(
+        self, mapping_commands: list[MappingCommand]
+    ) -> dict[MappingCommand, str]:
+        """Send all mapping commands as one burst and check each output."""
+        return self._batch_errors(
+            mapping_commands, await self._send_burst(mapping_commands)
+        )
+
+    async def connect_simplex(self, src_port: str, dst_port: str) -> str:
+        return await self._execute(self.simplex_command(src_port, dst_port))
+
+    async def connect_duplex(self, src_port: str, dst_port: str) -> str:
+        return await self._execute(self.duplex_command(src_port, dst_port))
+
+    async def disconnect_simplex(self, src_port: str, dst_port: str) -> str:
+        return await self._execute(self.disconnect_simplex_command(src_port, dst_port))
+
+    async def disconnect_duplex(self, src_port: str, dst_port: str) -> str:
+        return await self._execute(self.disconnect_duplex_command(src_port, dst_port))
+
+    async def disconnect_mcast(self, dst_port: str) -> str:
+        return await self._execute(self.disconnect_mcast_command(dst_port))
+
+    async def connection_info(self, src_address: str) -> list[ConnectionInfoDTO]:
+        await self.select_switch()
+        output = await AsyncCommandTemplateExecutor(
+            self._cli_service, command_template.SHOW_CONNECTION, remove_prompt=True
+        ).execute_command(port=src_address)
+        return self._connection_list(output)
+
+    async def port_connection_table(self, ports: list[str]) -> ConnectionTable:
+        """Connections of the ports, read with one burst of show conn commands."""
+        show_commands = self.show_connection_commands(ports)
+        return self._merge_connections(
+            show_commands, await self._send_burst(show_commands)
+        )
+
+    async def connection_table(self) -> ConnectionTable:
+        """Snapshot of all switch connections."""
+        output = await AsyncCommandTemplateExecutor(
+            self._cli_service, autoload_template.SHOW_CONNECTIONS, remove_prompt=True
+        ).execute_command(switch_name=self._switch_name)
+        return ConnectionTable.from_output(output)
+
+
+class AsyncAutoloadActions:
+    """Autoload actions on an asyncio cli service.
+
+    Outputs are read asynchronously and parsed by AutoloadActions.
+    """
+
+    def __init__(self, switch_name: str, cli_service: AsyncCliService):
+        self._switch_name = switch_name
+        self._cli_service = cli_service
+        self._actions = AutoloadActions(switch_name, None)
+        self._read_templates = set()
+
+    async def _read(self, template: CommandTemplate) -> AutoloadActions:
+        if template not in self._read_templates:
+            output = await AsyncCommandTemplateExecutor(
+                self._cli_service, template, remove_prompt=True
+            ).execute_command(switch_name=self._switch_name)
+            self._actions.set_command_output(template, output)
+            self._read_templates.add(template)
+        return self._actions
+
+    async def switch_model_name(self) -> str:
+        actions = await self._read(autoload_template.SHOW_SWITCH_INFO)
+        return actions.switch_model_name()
+
+    async def switch_ip_addr(self) -> str:
+        actions = await self._read(autoload_template.SHOW_SWITCH_INFO)
+        return actions.switch_ip_addr()
+
+    async def chassis_table(self) -> dict:
+        actions = await self._read(autoload_template.SHOW_SWITCH_INFO)
+        return actions.chassis_table()
+
+    async def port_table(self) -> dict:
+        actions = await self._read(autoload_template.SHOW_PORTS_RAW)
+        return actions.port_table()
+
+    async def port_states(self) -> list[tuple]:
+        actions = await self._read(autoload_template.SHOW_PORTS_RAW)
+        return actions.port_states()
+
+    async def connected_ports(self) -> list[str]:
+        actions = await self._read(autoload_template.SHOW_PORTS_RAW)
+        return actions.connected_ports()
+
+    async def mapping_table(self) -> dict:
+        actions = await self._read(autoload_template.SHOW_CONNECTIONS)
+        return actions.mapping_table()
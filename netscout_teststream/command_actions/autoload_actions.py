@@ -1,21 +1,23 @@
 from __future__ import annotations
 
+import csv
+import io
 import re
-from collections import defaultdict
 
-from cloudshell.cli.command_template.command_template_executor import (
-    CommandTemplateExecutor,
-)
+from cloudshell.cli.command_template.command_template import CommandTemplate
 from cloudshell.cli.service.cli_service import CliService
 from cloudshell.layer_one.core.helper.logger import get_l1_logger
 
-import netscout_teststream.command_actions.actions_helper as helper
 import netscout_teststream.command_templates.autoload as command_template
+from netscout_teststream.command_actions.connection_table import ConnectionTable
+from netscout_teststream.metrics import TimedCommandTemplateExecutor
 
 logger = get_l1_logger(name=__name__)
 
 
 class PortInfoDTO:
+    __slots__ = ("name", "address", "protocol_id")
+
     def __init__(self, name: str, address: str, protocol_id: str):
         self.name = name
         self.address = address
@@ -27,18 +29,38 @@ class AutoloadActions:
 
     SW_INFORM = "sw_inform"
     SW_COMPONENTS = "sw_components"
+    RAWINFO_QUOTE = "'"
+    RAWINFO_NAME_INDEX = 8
+    NOT_USED_PORT_MODE = 16
+    NOT_CONNECTED = "00"
 
     def __init__(self, switch_name: str, cli_service: CliService):
         self._switch_name = switch_name
         self._cli_service = cli_service
         self.__switch_info_table = {}
+        self._command_outputs = {}
+        self.__port_rows = None
+
+    def _command_output(self, template: CommandTemplate) -> str:
+        """Output of the switch command, executed once."""
+        output = self._command_outputs.get(template)
+        if output is None:
+            output = TimedCommandTemplateExecutor(
+                self._cli_service, template, remove_prompt=True
+            ).execute_command(switch_name=self._switch_name)
+            self._command_outputs[template] = output
+        return output
+
+    def set_command_output(self, template: CommandTemplate, output: str):
+        """Use the output read by the caller instead of executing the command."""
+        self._command_outputs[template] = output
+        if template is command_template.SHOW_PORTS_RAW:
+            self.__port_rows = None
 
     @property
     def _switch_info_table(self) -> dict:
         if not self.__switch_info_table:
-            output = CommandTemplateExecutor(
-                self._cli_service, command_template.SHOW_SWITCH_INFO, remove_prompt=True
-            ).execute_command(switch_name=self._switch_name)
+            output = self._command_output(command_template.SHOW_SWITCH_INFO)
             info_match = re.search(
                 r"\s*\*+\s+PHYSICAL\sINFORMATION\s\*+\s*(?P<physical_info>.*)"
                 r"\s*\*+\s+SWITCH\sCOMPONENTS\s\*+\s*(?P<switch_components>.*)",
@@ -96,66 +118,51 @@ class AutoloadActions:
                 blade_dict[int(blade_id)] = blade_type
         return blade_dict
 
+    @property
+    def _port_rows(self) -> list[list[str]]:
+        """Rows of the port rawinfo output, parsed once.
+
+        Row fields: address, protocol_id, port_mode, connected, connected_dir,
+        subport_tx, subport_rx, alarm, 'name'. Name is quoted and can contain
+        commas.
+        """
+        if self.__port_rows is None:
+            self.__port_rows = []
+            for row in csv.reader(
+                io.StringIO(self._command_output(command_template.SHOW_PORTS_RAW)),
+                quotechar=self.RAWINFO_QUOTE,
+                skipinitialspace=True,
+            ):
+                if len(row) > self.RAWINFO_NAME_INDEX:
+                    row[0] = row[0].strip()
+                    self.__port_rows.append(row)
+                elif row:
+                    logger.debug(f"Skipping port rawinfo line: {row}")
+        return self.__port_rows
+
     def port_table(self) -> dict:
-        output = CommandTemplateExecutor(
-            self._cli_service, command_template.SHOW_PORTS_RAW, remove_prompt=True
-        ).execute_command(switch_name=self._switch_name)
         port_table = {}
-        for line in output.strip().splitlines():
-            (
-                address,
-                protocol_id,
-                port_mode,
-                connected,
-                connected_dir,
-                subport_tx,
-                subport_rx,
-                alarm,
-                name,
-            ) = line.strip().split(",")
-            if int(port_mode) != 16:
-                port_table[address] = PortInfoDTO(name.strip("'"), address, protocol_id)
+        for row in self._port_rows:
+            address, protocol_id, port_mode = row[:3]
+            if int(port_mode) == self.NOT_USED_PORT_MODE:
+                continue
+            name = ",".join(row[self.RAWINFO_NAME_INDEX :]).strip()
+            port_table[address] = PortInfoDTO(name, address, protocol_id)
         return port_table
 
+    def port_states(self) -> list[tuple]:
+        """Address, protocol, mode and connection flags of every port."""
+        return [tuple(row[:5]) for row in self._port_rows]
+
+    def connected_ports(self) -> list[str]:
+        """Ports flagged as connected in the port rawinfo output."""
+        return [
+            row[0]
+            for row in self._port_rows
+            if row[3] != self.NOT_CONNECTED or row[4] != self.NOT_CONNECTED
+        ]
+
     def mapping_table(self) -> dict:
         """Get mappings for all multi-cast/simplex/duplex port connections."""
-        output = CommandTemplateExecutor(
-            self._cli_service, command_template.SHOW_CONNECTIONS, remove_prompt=True
-        ).execute_command(switch_name=self._switch_name)
-        mapping_info = defaultdict(list)
-
-        if "connection not found" in output.lower():
-            return mapping_info
-
-        connections_data = helper.parse_table(
-            parsable_str=output,
-            header_column_names=[
-                "src_addr",
-                "src_name",
-                "src_rx",
-                "connection_type",
-                "dst_addr",
-                "dst_name",
-                "dst_rx",
-                "speed",
-                "protocol",
-            ],
-        )
-
-        for conn_info in connections_data:
-            conn_type = conn_info.get("connection_type").lower()
-            src = conn_info.get("src_addr")
-            dst = conn_info.get("dst_addr")
-
-            if conn_type in ("simplex", "mcast", "unknown"):
-                mapping_info[src].append(dst)
-            elif conn_type == "duplex":
-                mapping_info[src].append(dst)
-                mapping_info[dst].append(src)
-            else:
-                logger.warning(
-                    f"Can't set mapping for unhandled connection type."
-                    f"Connection info: {conn_info}"
-                )
-
-        return mapping_info
+        output = self._command_output(command_template.SHOW_CONNECTIONS)
+        return ConnectionTable.from_output(output).mapping_table()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import re
+
+from cloudshell.cli.command_template.command_template import CommandTemplate
+
+import netscout_teststream.command_templates.mappings as command_template
+
+
+class SoftwareVersion:
+    """Switch software version parsed from show status."""
+
+    __slots__ = ("major", "minor", "text")
+
+    def __init__(self, major: int, minor: int = 0, text: str = None):
+        self.major = major
+        self.minor = minor
+        self.text = text if text is not None else f"{major}.{minor}"
+
+    @classmethod
+    def parse(cls, text: str | int) -> SoftwareVersion:
+        match = re.search(r"(\d+)(?:\.(\d+))?", str(text))
+        if not match:
+            raise Exception(f"Can not parse Software Version {text}")
+        return cls(int(match.group(1)), int(match.group(2) or 0), str(text))
+
+    @property
+    def version_tuple(self) -> tuple[int, int]:
+        return self.major, self.minor
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, SoftwareVersion)
+            and self.version_tuple == other.version_tuple
+        )
+
+    def __hash__(self):
+        return hash(self.version_tuple)
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return f"SoftwareVersion({self.text})"
+
+
+class CommandDialect:
+    """Mapping command templates of the switch software version.
+
+    Switches with the software version 3 and newer use CONNECT/DISCONNECT
+    commands with the -F flag, older ones use the lowercase connect/disconnect
+    commands. Disconnect commands of the old dialect take only dst_port,
+    other parameters are ignored by the templates.
+    """
+
+    NEW_MAJOR_VERSION = 3
+
+    def __init__(
+        self,
+        name: str,
+        map_simplex: CommandTemplate,
+        map_duplex: CommandTemplate,
+        disconnect_simplex: CommandTemplate,
+        disconnect_duplex: CommandTemplate,
+    ):
+        self.name = name
+        self.map_simplex = map_simplex
+        self.map_duplex = map_duplex
+        self.disconnect_simplex = disconnect_simplex
+        self.disconnect_duplex = disconnect_duplex
+
+    def __repr__(self):
+        return f"CommandDialect({self.name})"
+
+    @classmethod
+    def for_version(cls, software_version: SoftwareVersion) -> CommandDialect:
+        if software_version.major >= cls.NEW_MAJOR_VERSION:
+            return NEW_DIALECT
+        return OLD_DIALECT
+
+
+NEW_DIALECT = CommandDialect(
+    "NEW",
+    command_template.MAP_SIMPLEX_NEW,
+    command_template.MAP_DUPLEX_NEW,
+    command_template.DISCONNECT_SIMPLEX_NEW,
+    command_template.DISCONNECT_DUPLEX_NEW,
+)
+OLD_DIALECT = CommandDialect(
+    "OLD",
+    command_template.MAP_SIMPLEX_OLD,
+    command_template.MAP_DUPLEX_OLD,
+    command_template.DISCONNECT_SIMPLEX_OLD,
+    command_template.DISCONNECT_DUPLEX_OLD,
+)
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from array import array
+from collections import defaultdict
+from typing import Iterator
+
+from cloudshell.layer_one.core.helper.logger import get_l1_logger
+
+import netscout_teststream.command_actions.actions_helper as helper
+
+logger = get_l1_logger(name=__name__)
+
+CONNECTION_COLUMNS = [
+    "src_addr",
+    "src_name",
+    "src_rx",
+    "connection_type",
+    "dst_addr",
+    "dst_name",
+    "dst_rx",
+    "speed",
+    "protocol",
+]
+SRC_INDEX = CONNECTION_COLUMNS.index("src_addr")
+TYPE_INDEX = CONNECTION_COLUMNS.index("connection_type")
+DST_INDEX = CONNECTION_COLUMNS.index("dst_addr")
+
+
+class ConnectionInfoDTO:
+    __slots__ = ("src_address", "dst_address", "connection_type")
+
+    def __init__(self, src_address: str, dst_address: str, connection_type: str):
+        self.src_address = src_address
+        self.dst_address = dst_address
+        self.connection_type = connection_type
+
+    def _key(self) -> tuple:
+        return self.src_address, self.dst_address, self.connection_type
+
+    def __eq__(self, other):
+        return isinstance(other, ConnectionInfoDTO) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+
+class ConnectionTable:
+    """Connections of the switch stored column by column.
+
+    Source and destination addresses are kept in two lists, connection types
+    as codes in a byte array. Connection objects are created only for
+    the connections requested, address indexes are built on the first
+    lookup.
+    """
+
+    SIMPLEX_TYPES = ("simplex", "mcast", "unknown")
+    SIMPLEX_CONNECTED_TYPES = ("simplex", "mcast")
+    DUPLEX_TYPE = "duplex"
+    NOT_FOUND = "connection not found"
+
+    def __init__(self):
+        self._src_addresses = []
+        self._dst_addresses = []
+        self._type_codes = array("B")
+        self._types = []
+        self._type_index = {}
+        self._by_src = None
+        self._by_dst = None
+
+    @classmethod
+    def from_output(cls, output: str) -> ConnectionTable:
+        """Parse show connection output."""
+        table = cls()
+        if cls.NOT_FOUND in output.lower():
+            return table
+        for row in helper.iter_rows(output, CONNECTION_COLUMNS):
+            table.add(row[SRC_INDEX], row[DST_INDEX], row[TYPE_INDEX])
+        return table
+
+    def add(self, src_address: str, dst_address: str, connection_type: str):
+        type_code = self._type_index.get(connection_type)
+        if type_code is None:
+            type_code = self._type_index[connection_type] = len(self._types)
+            self._types.append(connection_type)
+        self._src_addresses.append(src_address)
+        self._dst_addresses.append(dst_address)
+        self._type_codes.append(type_code)
+        self._by_src = self._by_dst = None
+
+    def _keys(self) -> Iterator[tuple[str, str, str]]:
+        return zip(
+            self._src_addresses,
+            self._dst_addresses,
+            (self._types[type_code] for type_code in self._type_codes),
+        )
+
+    def update(self, other: ConnectionTable):
+        """Add connections of the other table which are not in this one."""
+        known = set(self._keys())
+        for src_address, dst_address, connection_type in other._keys():
+            if (src_address, dst_address, connection_type) not in known:
+                known.add((src_address, dst_address, connection_type))
+                self.add(src_address, dst_address, connection_type)
+
+    def __len__(self):
+        return len(self._src_addresses)
+
+    def __iter__(self) -> Iterator[ConnectionInfoDTO]:
+        return map(self._connection, range(len(self)))
+
+    def _connection(self, index: int) -> ConnectionInfoDTO:
+        return ConnectionInfoDTO(
+            self._src_addresses[index],
+            self._dst_addresses[index],
+            self._types[self._type_codes[index]],
+        )
+
+    @staticmethod
+    def _index(addresses: list[str]) -> dict[str, list[int]]:
+        index = defaultdict(list)
+        for position, address in enumerate(addresses):
+            index[address].append(position)
+        return index
+
+    def from_source(self, address: str) -> list[ConnectionInfoDTO]:
+        if self._by_src is None:
+            self._by_src = self._index(self._src_addresses)
+        return [self._connection(index) for index in self._by_src.get(address, [])]
+
+    def to_destination(self, address: str) -> list[ConnectionInfoDTO]:
+        if self._by_dst is None:
+            self._by_dst = self._index(self._dst_addresses)
+        return [self._connection(index) for index in self._by_dst.get(address, [])]
+
+    def port_connections(self, address: str) -> list[ConnectionInfoDTO]:
+        """Connections starting or ending on the port."""
+        return self.from_source(address) + [
+            connection
+            for connection in self.to_destination(address)
+            if connection.src_address != address
+        ]
+
+    def received_by(self, address: str) -> list[ConnectionInfoDTO]:
+        """Connections the port receives from, duplex ones in both directions."""
+        return self.to_destination(address) + [
+            connection
+            for connection in self.from_source(address)
+            if connection.connection_type.lower() == self.DUPLEX_TYPE
+        ]
+
+    def is_simplex_connected(self, src_address: str, dst_address: str) -> bool:
+        """The destination receives only from the source, by a simplex link."""
+        received = self.received_by(dst_address)
+        return (
+            len(received) == 1
+            and received[0].src_address == src_address
+            and received[0].connection_type.lower() in self.SIMPLEX_CONNECTED_TYPES
+        )
+
+    def is_duplex_connected(self, src_address: str, dst_address: str) -> bool:
+        """The ports have no other connection than the duplex one between them."""
+        connections = set(self.port_connections(src_address))
+        connections.update(self.port_connections(dst_address))
+        if len(connections) != 1:
+            return False
+        (connection,) = connections
+        return connection.connection_type.lower() == self.DUPLEX_TYPE and {
+            connection.src_address,
+            connection.dst_address,
+        } == {src_address, dst_address}
+
+    def mapping_table(self) -> dict[str, list[str]]:
+        """Destination addresses for every port, both ways for duplex."""
+        mapping_info = defaultdict(list)
+        for src, dst, connection_type in self._keys():
+            conn_type = connection_type.lower()
+            if conn_type in self.SIMPLEX_TYPES:
+                mapping_info[src].append(dst)
+            elif conn_type == self.DUPLEX_TYPE:
+                mapping_info[src].append(dst)
+                mapping_info[dst].append(src)
+            else:
+                logger.warning(
+                    f"Can't set mapping for unhandled connection type."
+                    f"Connection info: {src} {connection_type} {dst}"
+                )
+        return mapping_info
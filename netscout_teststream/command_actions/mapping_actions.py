@@ -1,138 +1,341 @@
 from __future__ import annotations
 
-import re
-
-from cloudshell.cli.command_template.command_template_executor import (
-    CommandTemplateExecutor,
-)
+from cloudshell.cli.command_template.command_template import CommandTemplate
 from cloudshell.cli.service.cli_service import CliService
 from cloudshell.layer_one.core.helper.logger import get_l1_logger
 
 import netscout_teststream.command_actions.actions_helper as helper
+import netscout_teststream.command_templates.autoload as autoload_template
 import netscout_teststream.command_templates.mappings as command_template
+from netscout_teststream.command_actions.command_dialect import (
+    NEW_DIALECT,
+    CommandDialect,
+)
+from netscout_teststream.command_actions.connection_table import (
+    ConnectionInfoDTO,
+    ConnectionTable,
+)
+from netscout_teststream.metrics import TimedCommandTemplateExecutor, timed_send_command
 
 logger = get_l1_logger(name=__name__)
 
 
-class ConnectionInfoDTO:
-    def __init__(self, src_address: str, dst_address: str, connection_type: str):
-        self.src_address = src_address
-        self.dst_address = dst_address
-        self.connection_type = connection_type
+class MappingCommand:
+    """Port command queued for a burst."""
 
+    def __init__(self, port_address: str, template: CommandTemplate, **command_kwargs):
+        self.port = port_address
+        self.template = template
+        self.command_kwargs = command_kwargs
 
-class MappingActions:
-    """Mapping actions."""
+    @property
+    def command(self) -> str:
+        return self.template.prepare_command(**self.command_kwargs)
+
+
+class MappingResult:
+    """Ports of a mapping transaction: applied, failed and rolled back."""
+
+    def __init__(self):
+        self.applied = []
+        self.failed = {}
+        self.rolled_back = []
+        self.rollback_failed = {}
+
+    @property
+    def succeeded(self) -> bool:
+        return not self.failed
+
+    @staticmethod
+    def _port_errors(errors: dict) -> str:
+        return ", ".join(f"{port}: {error}" for port, error in errors.items())
+
+    def error_message(self) -> str:
+        """Errors of the failed ports, rolled back ports and rollback errors."""
+        message = self._port_errors(self.failed)
+        if self.rolled_back:
+            message += f". Rolled back ports: {', '.join(self.rolled_back)}"
+        if self.rollback_failed:
+            message += f". Rollback failed: {self._port_errors(self.rollback_failed)}"
+        return message
+
+
+class MappingTransaction:
+    """Mapping commands applied together or not at all.
+
+    Every step is a mapping command with the commands undoing it. Steps are
+    sent as one burst, if any of them fails the applied ones are undone in
+    one burst, in reverse order. Steps failed before sending abort
+    the transaction without touching the switch.
+    """
+
+    def __init__(self, mapping_actions: MappingActions):
+        self._mapping_actions = mapping_actions
+        self._steps = []
+        self._failed = {}
+
+    def add(self, mapping_command: MappingCommand, undo_commands: list):
+        self._steps.append((mapping_command, undo_commands))
+
+    def fail(self, port: str, error: str):
+        """Step which could not be prepared."""
+        self._failed[port] = error
+
+    def commit(self, rollback: bool = True) -> MappingResult:
+        """Send the steps, undo them if any fails and rollback is set.
+
+        Without rollback the steps are sent even if some failed before.
+        """
+        result = MappingResult()
+        result.failed.update(self._failed)
+        if self._failed and rollback:
+            return result
+
+        errors = self._mapping_actions.execute_batch(
+            [mapping_command for mapping_command, _ in self._steps]
+        )
+        applied = []
+        for mapping_command, undo_commands in self._steps:
+            if mapping_command in errors:
+                result.failed[mapping_command.port] = errors[mapping_command]
+            else:
+                applied.append((mapping_command, undo_commands))
+                result.applied.append(mapping_command.port)
 
-    NEW_MAJOR_VERSION = 3
+        if result.failed and rollback and applied:
+            self._rollback(applied, result)
+        return result
 
-    def __init__(self, switch_name: str, cli_service: CliService):
+    def _rollback(self, applied: list, result: MappingResult):
+        undo_steps = [
+            (mapping_command.port, undo_command)
+            for mapping_command, undo_commands in reversed(applied)
+            for undo_command in undo_commands
+        ]
+        logger.debug(f"Rolling back {len(applied)} mapping commands")
+        errors = self._mapping_actions.execute_batch(
+            [undo_command for _, undo_command in undo_steps]
+        )
+        for port, undo_command in undo_steps:
+            if undo_command in errors:
+                result.rollback_failed[port] = errors[undo_command]
+        result.rolled_back = [
+            port for port in result.applied if port not in result.rollback_failed
+        ]
+        result.applied = [
+            port for port in result.applied if port in result.rollback_failed
+        ]
+
+
+class MappingCommandBuilder:
+    """Mapping commands of the switch and parsing of their outputs.
+
+    Base of the mapping actions, does not talk to the switch.
+    """
+
+    def __init__(
+        self,
+        switch_name: str,
+        cli_service: CliService,
+        dialect: CommandDialect = NEW_DIALECT,
+    ):
         self._switch_name = switch_name
         self._cli_service = cli_service
+        self._dialect = dialect
+        self._switch_selected = False
+
+    @property
+    def _session(self):
+        return getattr(self._cli_service, "session", None)
+
+    def _is_switch_selected(self) -> bool:
+        return (
+            self._switch_selected
+            or getattr(self._session, "selected_switch", None) == self._switch_name
+        )
+
+    def _set_switch_selected(self):
+        self._switch_selected = True
+        if self._session is not None:
+            self._session.selected_switch = self._switch_name
+
+    def simplex_command(self, src_port: str, dst_port: str) -> MappingCommand:
+        return MappingCommand(
+            dst_port, self._dialect.map_simplex, src_port=src_port, dst_port=dst_port
+        )
+
+    def duplex_command(self, src_port: str, dst_port: str) -> MappingCommand:
+        return MappingCommand(
+            dst_port, self._dialect.map_duplex, src_port=src_port, dst_port=dst_port
+        )
+
+    def disconnect_simplex_command(
+        self, src_port: str, dst_port: str
+    ) -> MappingCommand:
+        return MappingCommand(
+            dst_port,
+            self._dialect.disconnect_simplex,
+            src_port=src_port,
+            dst_port=dst_port,
+        )
 
-    def _is_new_command_format(self, software_version: str | int):
-        major_version = int(re.search(r"(\d+)", software_version).group(1))
-        return major_version >= self.NEW_MAJOR_VERSION
+    def disconnect_duplex_command(self, src_port: str, dst_port: str) -> MappingCommand:
+        return MappingCommand(
+            dst_port,
+            self._dialect.disconnect_duplex,
+            src_port=src_port,
+            dst_port=dst_port,
+        )
+
+    def reconnect_command(self, connection_info: ConnectionInfoDTO) -> MappingCommand:
+        """Command restoring the connection."""
+        if connection_info.connection_type.lower() == ConnectionTable.DUPLEX_TYPE:
+            return self.duplex_command(
+                connection_info.src_address, connection_info.dst_address
+            )
+        return self.simplex_command(
+            connection_info.src_address, connection_info.dst_address
+        )
+
+    def disconnect_mcast_command(self, dst_port: str) -> MappingCommand:
+        return MappingCommand(
+            dst_port, command_template.DISCONNECT_MCAST, dst_port=dst_port
+        )
+
+    @staticmethod
+    def show_connection_commands(ports: list[str]) -> list[MappingCommand]:
+        return [
+            MappingCommand(port, command_template.SHOW_CONNECTION, port=port)
+            for port in ports
+        ]
+
+    @staticmethod
+    def _burst(mapping_commands: list[MappingCommand]) -> tuple[str, str]:
+        """Command line and expected string of the burst."""
+        return (
+            helper.BURST_SEPARATOR.join(
+                mapping_command.command for mapping_command in mapping_commands
+            ),
+            helper.burst_prompt(len(mapping_commands)),
+        )
+
+    @staticmethod
+    def _batch_errors(
+        mapping_commands: list[MappingCommand], command_outputs: list[str]
+    ) -> dict[MappingCommand, str]:
+        errors = {}
+        for mapping_command, command_output in zip(mapping_commands, command_outputs):
+            error = helper.match_error(
+                mapping_command.template.error_map, command_output
+            )
+            if error:
+                logger.debug(f"{mapping_command.command}: {error}")
+                errors[mapping_command] = error
+        return errors
+
+    @staticmethod
+    def _merge_connections(
+        show_commands: list[MappingCommand], command_outputs: list[str]
+    ) -> ConnectionTable:
+        connection_table = ConnectionTable()
+        for show_command, output in zip(show_commands, command_outputs):
+            error = helper.match_error(show_command.template.error_map, output)
+            if error:
+                raise Exception(f"{show_command.command}: {error}")
+            connection_table.update(ConnectionTable.from_output(output))
+        return connection_table
+
+    @staticmethod
+    def _connection_list(output: str) -> list[ConnectionInfoDTO]:
+        connection_list = list(ConnectionTable.from_output(output))
+        if not connection_list:
+            logger.warning("There is no connection info.")
+        return connection_list
+
+
+class MappingActions(MappingCommandBuilder):
+    """Mapping actions."""
 
     def select_switch(self) -> str:
-        return CommandTemplateExecutor(
+        """Select the switch, once per session.
+
+        Pooled sessions remember the selected switch, so the switch is not
+        selected again when the session is reused.
+        """
+        if self._is_switch_selected():
+            return ""
+        output = TimedCommandTemplateExecutor(
             self._cli_service, command_template.SELECT_SWITCH
         ).execute_command(switch_name=self._switch_name)
+        self._set_switch_selected()
+        return output
 
-    def connect_simplex(
-        self, src_port: str, dst_port: str, software_version=NEW_MAJOR_VERSION
-    ) -> str:
+    def _execute(self, mapping_command: MappingCommand) -> str:
         self.select_switch()
-        if self._is_new_command_format(software_version):
-            template = command_template.MAP_SIMPLEX_NEW
-        else:
-            template = command_template.MAP_SIMPLEX_OLD
-        output = CommandTemplateExecutor(self._cli_service, template).execute_command(
-            src_port=src_port, dst_port=dst_port
-        )
-        return output
+        return TimedCommandTemplateExecutor(
+            self._cli_service, mapping_command.template
+        ).execute_command(**mapping_command.command_kwargs)
+
+    def _send_burst(self, mapping_commands: list[MappingCommand]) -> list[str]:
+        """Send the commands at once, return output of every command."""
+        if not mapping_commands:
+            return []
 
-    def connect_duplex(
-        self, src_port: str, dst_port: str, software_version=NEW_MAJOR_VERSION
-    ) -> str:
         self.select_switch()
-        if self._is_new_command_format(software_version):
-            template = command_template.MAP_DUPLEX_NEW
-        else:
-            template = command_template.MAP_DUPLEX_OLD
-        output = CommandTemplateExecutor(self._cli_service, template).execute_command(
-            src_port=src_port, dst_port=dst_port
+        command, expected_string = self._burst(mapping_commands)
+        output = timed_send_command(
+            self._cli_service,
+            [mapping_command.template for mapping_command in mapping_commands],
+            command,
+            expected_string=expected_string,
         )
-        return output
+        return helper.split_burst_output(output, len(mapping_commands))
 
-    def disconnect_simplex(
-        self, src_port: str, dst_port: str, software_version=NEW_MAJOR_VERSION
-    ) -> str:
-        self.select_switch()
-        if self._is_new_command_format(software_version):
-            output = CommandTemplateExecutor(
-                self._cli_service, command_template.DISCONNECT_SIMPLEX_NEW
-            ).execute_command(src_port=src_port, dst_port=dst_port)
-        else:
-            output = CommandTemplateExecutor(
-                self._cli_service, command_template.DISCONNECT_SIMPLEX_OLD
-            ).execute_command(dst_port=dst_port)
-        return output
+    def execute_batch(
+        self, mapping_commands: list[MappingCommand]
+    ) -> dict[MappingCommand, str]:
+        """Send all mapping commands as one burst and check each output.
 
-    def disconnect_duplex(
-        self, src_port: str, dst_port: str, software_version=NEW_MAJOR_VERSION
-    ) -> str:
-        self.select_switch()
-        if self._is_new_command_format(software_version):
-            output = CommandTemplateExecutor(
-                self._cli_service, command_template.DISCONNECT_DUPLEX_NEW
-            ).execute_command(src_port=src_port, dst_port=dst_port)
-        else:
-            output = CommandTemplateExecutor(
-                self._cli_service, command_template.DISCONNECT_DUPLEX_OLD
-            ).execute_command(dst_port=dst_port)
-        return output
+        The commands are written to the session at once, without waiting for
+        the prompt between them, so the whole batch costs a single round-trip.
+        Return error message for every command rejected by the switch.
+        """
+        return self._batch_errors(mapping_commands, self._send_burst(mapping_commands))
 
-    def disconnect_mcast(self, dst_port: str) -> str:
-        self.select_switch()
+    def transaction(self) -> MappingTransaction:
+        return MappingTransaction(self)
 
-        output = CommandTemplateExecutor(
-            self._cli_service, command_template.DISCONNECT_MCAST
-        ).execute_command(dst_port=dst_port)
-        return output
+    def connect_simplex(self, src_port: str, dst_port: str) -> str:
+        return self._execute(self.simplex_command(src_port, dst_port))
+
+    def connect_duplex(self, src_port: str, dst_port: str) -> str:
+        return self._execute(self.duplex_command(src_port, dst_port))
+
+    def disconnect_simplex(self, src_port: str, dst_port: str) -> str:
+        return self._execute(self.disconnect_simplex_command(src_port, dst_port))
+
+    def disconnect_duplex(self, src_port: str, dst_port: str) -> str:
+        return self._execute(self.disconnect_duplex_command(src_port, dst_port))
+
+    def disconnect_mcast(self, dst_port: str) -> str:
+        return self._execute(self.disconnect_mcast_command(dst_port))
 
     def connection_info(self, src_address: str) -> list[ConnectionInfoDTO]:
         self.select_switch()
         template = command_template.SHOW_CONNECTION
-        output = CommandTemplateExecutor(
+        output = TimedCommandTemplateExecutor(
             self._cli_service, template, remove_prompt=True
         ).execute_command(port=src_address)
+        return self._connection_list(output)
 
-        connections_data = helper.parse_table(
-            parsable_str=output,
-            header_column_names=[
-                "src_addr",
-                "src_name",
-                "src_rx",
-                "connection_type",
-                "dst_addr",
-                "dst_name",
-                "dst_rx",
-                "speed",
-                "protocol",
-            ],
-        )
-
-        connection_list = []
-        for conn_info in connections_data:
-            src_addr_info = conn_info.get("src_addr")
-            dst_addr_info = conn_info.get("dst_addr")
-            connection_type_info = conn_info.get("connection_type")
-            connection_list.append(
-                ConnectionInfoDTO(src_addr_info, dst_addr_info, connection_type_info)
-            )
-
-        if not connection_list:
-            logger.warning("There is no connection info.")
+    def port_connection_table(self, ports: list[str]) -> ConnectionTable:
+        """Connections of the ports, read with one burst of show conn commands."""
+        show_commands = self.show_connection_commands(ports)
+        return self._merge_connections(show_commands, self._send_burst(show_commands))
 
-        return connection_list
+    def connection_table(self) -> ConnectionTable:
+        """Snapshot of all switch connections."""
+        output = TimedCommandTemplateExecutor(
+            self._cli_service, autoload_template.SHOW_CONNECTIONS, remove_prompt=True
+        ).execute_command(switch_name=self._switch_name)
+        return ConnectionTable.from_output(output)
@@ -2,12 +2,10 @@ from __future__ import annotations
 
 import re
 
-from cloudshell.cli.command_template.command_template_executor import (
-    CommandTemplateExecutor,
-)
 from cloudshell.cli.service.cli_service import CliService
 
 import netscout_teststream.command_templates.system as command_template
+from netscout_teststream.metrics import TimedCommandTemplateExecutor
 
 
 class SystemActions:
@@ -19,7 +17,7 @@ class SystemActions:
 
     def available_switches(self) -> list[str]:
         """Get available switches."""
-        output = CommandTemplateExecutor(
+        output = TimedCommandTemplateExecutor(
             self._cli_service, command_template.SHOW_SWITCHES
         ).execute_command()
         switches_match = re.search(
@@ -29,7 +27,7 @@ class SystemActions:
 
     def software_version(self) -> str:
         """Get software version."""
-        output = CommandTemplateExecutor(
+        output = TimedCommandTemplateExecutor(
             self._cli_service, command_template.SHOW_STATUS
         ).execute_command()
         match = re.search(r"Version[ ]?(.*?)\n", output, re.DOTALL)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import re
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 from cloudshell.layer_one.core.driver_commands_interface import DriverCommandsInterface
 from cloudshell.layer_one.core.helper.logger import get_l1_logger
@@ -12,15 +13,29 @@ from cloudshell.layer_one.core.response.response_info import (
     ResourceDescriptionResponseInfo,
 )
 
+from netscout_teststream.address_translator import AddressTranslator
 from netscout_teststream.cli.netscout_cli_handler import NetscoutCliHandler
 
 # from netscout_teststream.cli.simulator.cli_simulator import CLISimulator  # noqa: E800
-from netscout_teststream.command_actions.autoload_actions import AutoloadActions
-from netscout_teststream.command_actions.mapping_actions import MappingActions
-from netscout_teststream.command_actions.system_actions import SystemActions
-from netscout_teststream.model.netscout_blade import NetscoutBlade
-from netscout_teststream.model.netscout_chassis import NetscoutChassis
-from netscout_teststream.model.netscout_port import NetscoutPort
+from netscout_teststream.command_actions.command_dialect import SoftwareVersion
+from netscout_teststream.switch_registry import SwitchContext, SwitchRegistry
+from netscout_teststream.switch_state import SwitchState
+from netscout_teststream.topology_cache import TopologyCache
+
+# Actions and models are imported by the commands using them, so the driver
+# starts listening without loading the parsing and autoload modules.
+if TYPE_CHECKING:
+    from netscout_teststream.command_actions.autoload_actions import AutoloadActions
+    from netscout_teststream.command_actions.connection_table import (
+        ConnectionInfoDTO,
+        ConnectionTable,
+    )
+    from netscout_teststream.command_actions.mapping_actions import (
+        MappingActions,
+        MappingCommand,
+    )
+    from netscout_teststream.command_actions.system_actions import SystemActions
+    from netscout_teststream.model.netscout_chassis import NetscoutChassis
 
 logger = get_l1_logger(name=__name__)
 
@@ -33,29 +48,72 @@ class DriverCommands(DriverCommandsInterface):
     RX_SUBPORT_INDEX = "RX"
     SUFFIX_SEPARATOR = "-"
     CHASSIS_ID = 1
+    RAWINFO_MAPPINGS_MAX_PORTS = 16
+    AUTOLOAD_WORKERS = 3
 
     def __init__(self, runtime_config: RuntimeConfiguration):
         self._runtime_config = runtime_config
         self._driver_port_mode = runtime_config.read_key(
             "DRIVER.PORT_MODE", self.LOGICAL_PORT_MODE
         )
-        self._cli_handler = NetscoutCliHandler()
+        self._topology_ttl = int(
+            runtime_config.read_key("DRIVER.TOPOLOGY_CACHE_TTL", 0)
+        )
+        self._rawinfo_mappings = bool(
+            runtime_config.read_key("DRIVER.RAWINFO_MAPPINGS", False)
+        )
+        self._rawinfo_mappings_max_ports = int(
+            runtime_config.read_key(
+                "DRIVER.RAWINFO_MAPPINGS_MAX_PORTS", self.RAWINFO_MAPPINGS_MAX_PORTS
+            )
+        )
+        self._blade_models = runtime_config.read_key("DRIVER.BLADE_MODELS", {})
+        self._idempotent_mapping = bool(
+            runtime_config.read_key("DRIVER.IDEMPOTENT_MAPPING", False)
+        )
+        self._parallel_autoload = bool(
+            runtime_config.read_key("DRIVER.PARALLEL_AUTOLOAD", False)
+        )
+        self._addresses = AddressTranslator()
+        self._switches = SwitchRegistry(NetscoutCliHandler, self._topology_ttl)
         """
-        self._cli_handler = CLISimulator(
-            os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                         "cli",
-                         "simulator",
-                         "data"),
-            logger)
+        self._switches = SwitchRegistry(
+            lambda: CLISimulator(
+                os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "cli",
+                             "simulator",
+                             "data"),
+                logger),
+            self._topology_ttl,
+        )
         """  # noqa: E800
-        self._switch_name = None
-        self.__software_version = None
 
-    def _software_version(self, session):
-        if not self.__software_version:
-            system_actions = SystemActions(self._switch_name, session)
-            self.__software_version = system_actions.software_version()
-        return self.__software_version
+    @staticmethod
+    def _system_actions(switch: SwitchContext, session) -> SystemActions:
+        from netscout_teststream.command_actions.system_actions import SystemActions
+
+        return SystemActions(switch.name, session)
+
+    @staticmethod
+    def _autoload_actions(switch: SwitchContext, session) -> AutoloadActions:
+        from netscout_teststream.command_actions.autoload_actions import AutoloadActions
+
+        return AutoloadActions(switch.name, session)
+
+    @classmethod
+    def _software_version(cls, switch: SwitchContext, session) -> SoftwareVersion:
+        if not switch.software_version:
+            system_actions = cls._system_actions(switch, session)
+            switch.set_software_version(
+                SoftwareVersion.parse(system_actions.software_version())
+            )
+        return switch.software_version
+
+    def _mapping_actions(self, switch: SwitchContext, session) -> MappingActions:
+        from netscout_teststream.command_actions.mapping_actions import MappingActions
+
+        self._software_version(switch, session)
+        return MappingActions(switch.name, session, switch.dialect)
 
     @property
     def _is_logical_port_mode(self):
@@ -94,30 +152,59 @@ class DriverCommands(DriverCommandsInterface):
         except Exception:  # noqa: E722
             port = None
 
-        self._switch_name = address_data.group("switch_name")
+        switch_name = address_data.group("switch_name")
 
-        logger.debug(f"Defined switch: {self._switch_name}")
+        logger.debug(f"Defined switch: {switch_name}")
 
-        self._cli_handler.define_session_attributes(host, username, password, port)
-        with self._cli_handler.default_mode_service() as session:
-            system_actions = SystemActions(self._switch_name, session)
+        switch = self._switches.register(
+            address, switch_name, host, username, password, port
+        )
+        with switch.cli_handler.default_mode_service() as session:
+            system_actions = self._system_actions(switch, session)
             available_switches = system_actions.available_switches()
             logger.debug(f"Available Switches: {', '.join(available_switches)}")
-            if self._switch_name.lower() not in (s.lower() for s in available_switches):
-                raise Exception(f"Switch {self._switch_name} is not available")
+            if switch.name.lower() not in (s.lower() for s in available_switches):
+                raise Exception(f"Switch {switch.name} is not available")
+            software_version = self._software_version(switch, session)
+            logger.debug(f"Software version: {software_version}")
+
+    def _refresh_state(self, switch: SwitchContext) -> SwitchState:
+        state = switch.state
+        if not state.is_valid():
+            generation = state.generation
+            with switch.cli_handler.default_mode_service() as session:
+                autoload_actions = self._autoload_actions(switch, session)
+                state.update(
+                    state.fingerprint(autoload_actions.port_states()), generation
+                )
+        return state
+
+    def close(self):
+        """Close the sessions of all switches, called when the driver stops."""
+        self._switches.close()
 
     def get_state_id(self) -> GetStateIdResponseInfo:
         """Check if CS synchronized with the device."""
-        return GetStateIdResponseInfo(-1)
+        switch = self._switches.current
+        with switch.state.lock:
+            return GetStateIdResponseInfo(self._refresh_state(switch).state_id)
 
     def set_state_id(self, state_id: str):
         """Set synchronization state id to the device."""
-        pass
+        switch = self._switches.current
+        with switch.state.lock:
+            self._refresh_state(switch).set_state_id(state_id)
+
+    def _parse_port_address(self, port_address: str) -> tuple[str, str]:
+        """Switch port address and sub-port index of the resource port address.
+
+        Example:
+            "192.168.42.240/1/21-Tx" => ("01.01.21", "Tx")
+        """
+        return self._addresses.to_switch(port_address)
 
     def _convert_port_address(self, port_address: str) -> str:
-        ip_addr, blade_id, port_id = port_address.split("/")
-        port_id = port_id.split(self.SUFFIX_SEPARATOR)[0]
-        return f"{str(self.CHASSIS_ID).zfill(2)}.{blade_id.zfill(2)}.{port_id.zfill(2)}"
+        return self._parse_port_address(port_address)[0]
 
     def map_bidi(self, src_port: str, dst_port: str):
         """Create a bidirectional connection between source and destination ports."""
@@ -126,176 +213,414 @@ class DriverCommands(DriverCommandsInterface):
                 f"Bidirectional port mapping could be done only in LOGICAL port_mode. "
                 f"Current port mode: {self._driver_port_mode}"
             )
-        with self._cli_handler.default_mode_service() as session:
-            mapping_action = MappingActions(self._switch_name, session)
-            mapping_action.connect_duplex(
-                self._convert_port_address(src_port),
-                self._convert_port_address(dst_port),
-                self._software_version(session),
-            )
+        switch = self._switches.for_port(src_port)
+        src_address = self._convert_port_address(src_port)
+        dst_address = self._convert_port_address(dst_port)
+        with switch.mapping_service() as session:
+            mapping_action = self._mapping_actions(switch, session)
+            if self._idempotent_mapping and mapping_action.port_connection_table(
+                [src_address, dst_address]
+            ).is_duplex_connected(src_address, dst_address):
+                logger.debug(f"Ports {src_address}, {dst_address} already connected")
+                return
+            mapping_action.connect_duplex(src_address, dst_address)
 
     def map_uni(self, src_port: str, dst_ports: list[str]):
         """Unidirectional mapping of two ports."""
-        if not self._is_logical_port_mode:
-            self._validate_tx_port(src_port)
-            map(lambda x: self._validate_rx_subport(x), dst_ports)  # noqa: C417
-
-        with self._cli_handler.default_mode_service() as session:
-            mapping_action = MappingActions(self._switch_name, session)
-            src_address = self._convert_port_address(src_port)
-            exception_messages = []
-            for dst_port in dst_ports:
-                try:
-                    mapping_action.connect_simplex(
-                        src_address,
-                        self._convert_port_address(dst_port),
-                        self._software_version(session),
+        self._validate_ports(src_port, dst_ports)
+        src_address = self._convert_port_address(src_port)
+        dst_addresses = [self._convert_port_address(dst_port) for dst_port in dst_ports]
+
+        switch = self._switches.for_port(src_port)
+        with switch.mapping_service() as session:
+            mapping_action = self._mapping_actions(switch, session)
+            connection_table = None
+            if self._idempotent_mapping:
+                connection_table = mapping_action.port_connection_table(dst_addresses)
+                dst_addresses = self._not_connected(
+                    connection_table, src_address, dst_addresses
+                )
+            transaction = mapping_action.transaction()
+            for dst_address in dst_addresses:
+                # forced connect replaces the connections the port received from
+                undo_commands = [
+                    mapping_action.disconnect_simplex_command(src_address, dst_address)
+                ]
+                if connection_table is not None:
+                    undo_commands.extend(
+                        map(
+                            mapping_action.reconnect_command,
+                            connection_table.received_by(dst_address),
+                        )
                     )
-                except Exception as e:
-                    if len(e.args) > 1:
-                        exception_messages.append(e.args[1])
-                    elif len(e.args) == 1:
-                        exception_messages.append(e.args[0])
-
-            if exception_messages:
-                raise Exception(", ".join(exception_messages))
+                transaction.add(
+                    mapping_action.simplex_command(src_address, dst_address),
+                    undo_commands,
+                )
+            result = transaction.commit()
+
+        if not result.succeeded:
+            raise Exception(result.error_message())
+
+    @staticmethod
+    def _not_connected(
+        connection_table: ConnectionTable, src_address: str, dst_addresses: list[str]
+    ) -> list[str]:
+        """Destinations not yet receiving from the source only."""
+        not_connected = [
+            dst_address
+            for dst_address in dst_addresses
+            if not connection_table.is_simplex_connected(src_address, dst_address)
+        ]
+        logger.debug(
+            f"{len(dst_addresses) - len(not_connected)} of {len(dst_addresses)} "
+            f"ports already connected to {src_address}"
+        )
+        return not_connected
 
     def get_resource_description(self, address: str) -> ResourceDescriptionResponseInfo:
         """Auto-load function to retrieve all information from the device."""
-        with self._cli_handler.default_mode_service() as session:
-            chassis_dict = {}
-            autoload_actions = AutoloadActions(self._switch_name, session)
-            switch_model_name = autoload_actions.switch_model_name()
-            software_version = self._software_version(session)
-            switch_address = autoload_actions.switch_ip_addr()
-            ports_table = autoload_actions.port_table()
+        switch = self._switches.get(address)
+        topology = switch.topology
+        with topology.lock:
+            if topology.is_valid(address):
+                logger.debug("Using cached topology")
+                return ResourceDescriptionResponseInfo(topology.chassis_dict.values())
+
+            topology.begin_update(address)
+            state_generation = switch.state.generation
+            if self._parallel_autoload:
+                switch_info, port_info, mapping_table = self._read_parallel(switch)
+            else:
+                switch_info, port_info, mapping_table = self._read_sequential(switch)
+            *chassis_info, chassis_table = switch_info
+            ports_table, port_states = port_info
             blades_dict = {}
-            for chassis_id, chassis_data in autoload_actions.chassis_table().items():
-                chassis = NetscoutChassis(chassis_id, address)
-                chassis.set_ip_address(switch_address)
-                chassis.set_model_name(switch_model_name)
-                chassis.set_os_version(software_version)
-                chassis_dict[chassis_id] = chassis
-                blades_dict = self._build_blades(chassis_id, chassis, chassis_data)
-            port_dict = self._build_ports(blades_dict, ports_table)
-            mapping_table = autoload_actions.mapping_table()
-            self._build_mappings(mapping_table, port_dict)
-        return ResourceDescriptionResponseInfo(chassis_dict.values())
-
-    def _build_blades(self, chassis_id, chassis, chassis_data: dict) -> dict:
+            for chassis_id, chassis_data in chassis_table.items():
+                chassis = topology.get_resource(
+                    ("chassis", chassis_id),
+                    (address, *chassis_info),
+                    lambda: self._build_chassis(chassis_id, address, *chassis_info),
+                )
+                topology.chassis_dict[chassis_id] = chassis
+                blades_dict.update(
+                    self._build_blades(topology, chassis_id, chassis, chassis_data)
+                )
+            port_index = self._build_ports(topology, blades_dict, ports_table)
+            self._addresses.register_ports(address, port_index)
+            self._build_mappings(mapping_table, port_index)
+            switch.state.update(switch.state.fingerprint(port_states), state_generation)
+            topology.end_update()
+            return ResourceDescriptionResponseInfo(topology.chassis_dict.values())
+
+    def _read_sequential(self, switch: SwitchContext) -> tuple:
+        """Autoload data read on one session."""
+        with switch.cli_handler.default_mode_service() as session:
+            autoload_actions = self._autoload_actions(switch, session)
+            return (
+                self._switch_info(switch, session, autoload_actions),
+                self._port_info(switch, session, autoload_actions),
+                self._mapping_table(switch, session, autoload_actions),
+            )
+
+    def _read_parallel(self, switch: SwitchContext) -> tuple:
+        """Autoload data read concurrently, every query on its own session.
+
+        Workers parse the outputs as soon as they are read, so autoload takes
+        about as long as the slowest query. In the rawinfo mode the mappings
+        depend on the port rawinfo and are read by its worker.
+        """
+
+        def read(*info_getters):
+            with switch.cli_handler.default_mode_service() as session:
+                autoload_actions = self._autoload_actions(switch, session)
+                return [
+                    info_getter(switch, session, autoload_actions)
+                    for info_getter in info_getters
+                ]
+
+        if self._rawinfo_mappings:
+            worker_getters = [
+                (self._switch_info,),
+                (self._port_info, self._mapping_table),
+            ]
+        else:
+            worker_getters = [
+                (self._switch_info,),
+                (self._port_info,),
+                (self._mapping_table,),
+            ]
+        with ThreadPoolExecutor(
+            max_workers=self.AUTOLOAD_WORKERS, thread_name_prefix="autoload"
+        ) as executor:
+            futures = [executor.submit(read, *getters) for getters in worker_getters]
+            return tuple(info for future in futures for info in future.result())
+
+    def _switch_info(
+        self, switch: SwitchContext, session, autoload_actions: AutoloadActions
+    ) -> tuple:
+        """IP address, model name, software version and chassis table."""
+        return (
+            autoload_actions.switch_ip_addr(),
+            autoload_actions.switch_model_name(),
+            self._software_version(switch, session),
+            autoload_actions.chassis_table(),
+        )
+
+    @staticmethod
+    def _port_info(
+        switch: SwitchContext, session, autoload_actions: AutoloadActions
+    ) -> tuple:
+        """Port table and port states."""
+        return autoload_actions.port_table(), autoload_actions.port_states()
+
+    def _mapping_table(
+        self, switch: SwitchContext, session, autoload_actions: AutoloadActions
+    ) -> dict:
+        """Mappings of the switch ports.
+
+        In the rawinfo mode only ports flagged as connected in the port rawinfo
+        output are asked for their connections, the whole connection table is
+        read if there are more of them than the limit.
+        """
+        if self._rawinfo_mappings:
+            connected_ports = autoload_actions.connected_ports()
+            if len(connected_ports) <= self._rawinfo_mappings_max_ports:
+                logger.debug(f"Reading connections of {len(connected_ports)} ports")
+                from netscout_teststream.command_actions.mapping_actions import (
+                    MappingActions,
+                )
+
+                mapping_action = MappingActions(switch.name, session)
+                return mapping_action.port_connection_table(
+                    connected_ports
+                ).mapping_table()
+        return autoload_actions.mapping_table()
+
+    @staticmethod
+    def _build_chassis(
+        chassis_id, address, switch_address, switch_model_name, software_version
+    ) -> NetscoutChassis:
+        from netscout_teststream.model.netscout_chassis import NetscoutChassis
+
+        chassis = NetscoutChassis(chassis_id, address)
+        chassis.set_ip_address(switch_address)
+        chassis.set_model_name(switch_model_name)
+        chassis.set_os_version(str(software_version))
+        return chassis
+
+    def _build_blades(
+        self, topology: TopologyCache, chassis_id, chassis, chassis_data: dict
+    ) -> dict:
+        from netscout_teststream.model.netscout_blade import NetscoutBlade
+
+        if self._blade_models:
+            NetscoutBlade.register_models(self._blade_models)
+            self._blade_models = None
         logger.debug("Build Blades")
         blades_dict = {}
         for blade_id, blade_type in chassis_data.items():
-            blade_instance = NetscoutBlade(blade_id, blade_type)
-            blade_instance.set_parent_resource(chassis)
+            blade_instance = topology.get_resource(
+                ("blade", chassis_id, blade_id),
+                (blade_type,),
+                lambda: NetscoutBlade(blade_id, blade_type),
+                chassis,
+            )
             blades_dict[(chassis_id, blade_id)] = blade_instance
         return blades_dict
 
-    def _build_ports(self, blades_dict: dict, ports_table: dict):
+    def _build_ports(
+        self, topology: TopologyCache, blades_dict: dict, ports_table: dict
+    ) -> dict:
+        """Build the ports, return the port index.
+
+        Index maps the port address to the logical port, or to the TX and RX
+        subports in the physical mode.
+        """
+        from netscout_teststream.model.netscout_port import NetscoutPort
+
         logger.debug("Build Ports")
-        port_dict = defaultdict(list)
+        port_index = {}
+        prefix_blades = {}
         for address, port_info in ports_table.items():
-            chassis_id, blade_id, port_id = address.split(".")
-            blade = blades_dict.get((int(chassis_id), int(blade_id)))
+            prefix, _, port_id = address.rpartition(".")
+            if prefix not in prefix_blades:
+                chassis_id, blade_id = prefix.split(".")
+                prefix_blades[prefix] = blades_dict.get(
+                    (int(chassis_id), int(blade_id))
+                )
+            blade = prefix_blades[prefix]
             if blade:
+                signature = (port_info.name, port_info.protocol_id)
                 if self._is_logical_port_mode:
-                    port = NetscoutPort(port_id, port_info.name, port_info.protocol_id)
-                    port.set_parent_resource(blade)
-                    port_dict[address].append(port)
+                    port_index[address] = (
+                        topology.get_resource(
+                            ("port", address),
+                            signature,
+                            lambda: NetscoutPort(
+                                port_id, port_info.name, port_info.protocol_id
+                            ),
+                            blade,
+                        ),
+                    )
                 else:
-                    for suffix in (self.TX_SUBPORT_INDEX, self.RX_SUBPORT_INDEX):
-                        subport_id = f"{port_id}-{suffix}"
-                        port = NetscoutPort(
-                            subport_id, port_info.name, port_info.protocol_id
+                    port_index[address] = tuple(
+                        topology.get_resource(
+                            ("port", address, suffix),
+                            signature,
+                            lambda: NetscoutPort(
+                                f"{port_id}-{suffix}",
+                                port_info.name,
+                                port_info.protocol_id,
+                            ),
+                            blade,
                         )
-                        port.set_parent_resource(blade)
-                        port_dict[address].append(port)
-        return port_dict
+                        for suffix in (self.TX_SUBPORT_INDEX, self.RX_SUBPORT_INDEX)
+                    )
+        return port_index
+
+    def _build_mappings(self, mapping_table: dict, port_index: dict) -> int:
+        """Set mappings of the destination ports, return skipped endpoints.
 
-    def _build_mappings(self, mapping_table: dict, port_dict: dict):
+        Connections of ports which are not in the index, not used or unknown
+        ports, are skipped.
+        """
         logger.debug("Build mappings")
+        skipped = 0
         for src_addr, dst_addr_list in mapping_table.items():
-            self._map_ports(src_addr, dst_addr_list, port_dict)
-
-    def _map_ports(self, src_addr: str, dst_addr_list: list[str], port_dict: dict):
-        src_port = port_dict.get(src_addr, [])[0]
-        for dst_addr in dst_addr_list:
-            if self._is_logical_port_mode:
-                dst_port = port_dict.get(dst_addr, [])[0]
-            else:
-                dst_port = port_dict.get(dst_addr, [])[1]
-            dst_port.add_mapping(src_port)
+            src_ports = port_index.get(src_addr)
+            if src_ports is None:
+                skipped += len(dst_addr_list)
+                continue
+            for dst_addr in dst_addr_list:
+                dst_ports = port_index.get(dst_addr)
+                if dst_ports is None:
+                    skipped += 1
+                    continue
+                # logical port or the RX subport
+                dst_ports[-1].add_mapping(src_ports[0])
+        if skipped:
+            logger.warning(f"Skipped {skipped} connections of unknown ports")
+        return skipped
 
     def map_clear(self, ports: list[str]):
         """Remove simplex/multi-cast/duplex connection ending on the destination port.
 
         ports - ["192.168.42.240/1/21", "192.168.42.240/1/22"]
         """
-        exception_messages = []
-        for port in ports:
-            try:
-                port_addr = self._convert_port_address(port)
-                self._disconnect_ports(port_addr)
-            except Exception as e:
-                if len(e.args) > 1:
-                    exception_messages.append(e.args[1])
-                elif len(e.args) == 1:
-                    exception_messages.append(e.args[0])
+        exception_messages = self._switches.run_parallel(
+            lambda switch, switch_ports: self._disconnect_ports(
+                switch, [self._convert_port_address(port) for port in switch_ports]
+            ),
+            self._switches.group_ports(ports),
+        )
 
         if exception_messages:
             raise Exception(", ".join(exception_messages))
 
     def map_clear_to(self, src_port: str, dst_ports: list[str]):
         """Remove simplex/multi-cast/duplex connection ending on the dst port."""
-        if not self._is_logical_port_mode:
-            self._validate_tx_port(src_port)
-            map(lambda x: self._validate_rx_subport(x), dst_ports)  # noqa: C417
+        self._validate_ports(src_port, dst_ports)
+        self._disconnect_ports(
+            self._switches.for_port(src_port),
+            [self._convert_port_address(src_port)],
+            [self._convert_port_address(dst_port) for dst_port in dst_ports],
+            rollback=True,
+        )
 
-        exception_messages = []
-        src_port_addr = self._convert_port_address(src_port)
-        for dst_port in dst_ports:
-            try:
-                dst_port_addr = self._convert_port_address(dst_port)
-                self._disconnect_ports(src_port_addr, dst_port_addr)
-            except Exception as e:
-                if len(e.args) > 1:
-                    exception_messages.append(e.args[1])
-                elif len(e.args) == 1:
-                    exception_messages.append(e.args[0])
+    def _disconnect_ports(
+        self,
+        switch: SwitchContext,
+        ports: list[str],
+        dst_ports: list[str] = None,
+        rollback: bool = False,
+    ):
+        """Disconnect all connections of the ports using a single session.
+
+        Connections are taken from one snapshot of the switch connection table,
+        if dst_ports are given only connections between the ports and
+        the dst_ports are removed. With rollback the removed connections are
+        restored if any of them fails.
+        """
+        with switch.mapping_service() as session:
+            mapping_action = self._mapping_actions(switch, session)
+            connection_table = mapping_action.connection_table()
+            connections = {}
+            for port in ports:
+                port_connections = connection_table.port_connections(port)
+                if dst_ports:
+                    port_connections = [
+                        connection
+                        for connection in port_connections
+                        if connection.dst_address in dst_ports
+                        or (
+                            connection.connection_type.lower() == "duplex"
+                            and connection.src_address in dst_ports
+                        )
+                    ]
+                if not port_connections:
+                    logger.debug(f"Port {port} is not connected")
+                connections.update(dict.fromkeys(port_connections))
 
-        if exception_messages:
-            raise Exception(", ".join(exception_messages))
+            transaction = mapping_action.transaction()
+            for connection_info in connections:
+                try:
+                    transaction.add(
+                        self._disconnect_command(mapping_action, connection_info),
+                        [mapping_action.reconnect_command(connection_info)],
+                    )
+                except Exception as e:
+                    transaction.fail(connection_info.dst_address, e.args[0])
+            result = transaction.commit(rollback=rollback)
+
+        if not result.succeeded:
+            raise Exception(result.error_message())
+
+    @staticmethod
+    def _disconnect_command(
+        mapping_action: MappingActions,
+        connection_info: ConnectionInfoDTO,
+    ) -> MappingCommand:
+        connection_type = connection_info.connection_type.lower()
+        if connection_type in ["simplex", "unknown"]:
+            return mapping_action.disconnect_simplex_command(
+                connection_info.src_address, connection_info.dst_address
+            )
+        elif connection_type == "duplex":
+            return mapping_action.disconnect_duplex_command(
+                connection_info.src_address, connection_info.dst_address
+            )
+        elif connection_type == "mcast":
+            return mapping_action.disconnect_mcast_command(connection_info.dst_address)
+        raise Exception(
+            f"Connection type {connection_info.connection_type} "
+            f"is no supported by the driver."
+        )
 
-    def _disconnect_ports(self, src_port: str, dst_port: str = None):
-        with self._cli_handler.default_mode_service() as session:
-            mapping_action = MappingActions(self._switch_name, session)
-            connection_info_list = mapping_action.connection_info(src_port)
-            if not connection_info_list:
-                logger.debug(f"Port {src_port} is not connected")
-                return
-            for connection_info in connection_info_list:
-                if dst_port and connection_info.dst_address != dst_port:
-                    continue
+    def _validate_ports(self, src_port: str, dst_ports: list[str]):
+        """Validate the source and all destination ports before any session.
 
-                if connection_info.connection_type.lower() in ["simplex", "unknown"]:
-                    mapping_action.disconnect_simplex(
-                        connection_info.src_address,
-                        connection_info.dst_address,
-                        self._software_version(session),
-                    )
-                elif connection_info.connection_type.lower() == "duplex":
-                    mapping_action.disconnect_duplex(
-                        connection_info.src_address,
-                        connection_info.dst_address,
-                        self._software_version(session),
-                    )
-                elif connection_info.connection_type.lower() == "mcast":
-                    mapping_action.disconnect_mcast(connection_info.dst_address)
-                else:
-                    raise Exception(
-                        f"Connection type {connection_info.connection_type} "
-                        f"is no supported by the driver."
-                    )
+        Every address is parsed, in the PHYSICAL port mode the source has to
+        be a transmitter and the destinations receiver sub-ports. All errors
+        are reported at once.
+        """
+        if self._is_logical_port_mode:
+            validations = [
+                (self._parse_port_address, port_address)
+                for port_address in [src_port, *dst_ports]
+            ]
+        else:
+            validations = [(self._validate_tx_port, src_port)] + [
+                (self._validate_rx_subport, dst_port) for dst_port in dst_ports
+            ]
+        errors = []
+        for validate, port_address in validations:
+            try:
+                validate(port_address)
+            except Exception as e:
+                errors.append(f"{port_address}: {e.args[0]}")
+        if errors:
+            raise Exception(", ".join(errors))
 
     def _validate_tx_port(self, port_address: str):
         """Validate if given sub-port is a correct transceiver sub-port.
@@ -305,8 +630,9 @@ class DriverCommands(DriverCommandsInterface):
             sub-port "1.1.1-Tx" => port "1.1.1"
             sub-port "1.1.1-Rx" => raise Exception
         """
-        ip_addr, blade_id, port_id = port_address.split("/")
-        port, sub_idx = port_id.split(self.SUFFIX_SEPARATOR)
+        _, sub_idx = self._parse_port_address(port_address)
+        if not sub_idx:
+            raise Exception("Sub-port is not specified")
         if sub_idx.upper() != self.TX_SUBPORT_INDEX.upper():
             raise Exception("Receiver sub-port can't be used as a source")
 
@@ -318,8 +644,9 @@ class DriverCommands(DriverCommandsInterface):
             sub-port "1.1.1-Rx" => port "1.1.1"
             sub-port "1.1.1-Tx" => raise Exception
         """
-        ip_addr, blade_id, port_id = port_address.split("/")
-        port, sub_idx = port_id.split(self.SUFFIX_SEPARATOR)
+        _, sub_idx = self._parse_port_address(port_address)
+        if not sub_idx:
+            raise Exception("Sub-port is not specified")
         if sub_idx.upper() != self.RX_SUBPORT_INDEX.upper():
             raise Exception("Transmitter sub-port can't be used as a destination")
 
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import copy
+import logging
+import queue
+import re
+import threading
+
+from cloudshell.layer_one.core.helper.logger import get_l1_logger
+from cloudshell.layer_one.core.helper.xml_logger import XMLLogger
+
+logger = get_l1_logger(name=__name__)
+
+
+def cap_payload(payload: str, max_size: int) -> str:
+    """Payload cut to max_size characters, 0 - not limited."""
+    if not max_size or len(payload) <= max_size:
+        return payload
+    return f"{payload[:max_size]}... [{len(payload) - max_size} characters truncated]"
+
+
+class LogQueue:
+    """Log records and XML messages written in batches by a daemon thread.
+
+    Callers only put the payload into the queue. Formatting, capping
+    payloads at max_payload characters and writing is done by the writer
+    thread, every file is written and flushed once per batch.
+    """
+
+    BATCH_SIZE = 512
+
+    def __init__(self, max_payload: int = 0):
+        self.max_payload = max_payload
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+
+    def put(self, writer, item):
+        """Queue the item for writer.write_batch."""
+        self._queue.put((writer, item))
+
+    def attach(self, log: logging.Logger) -> QueuedLogHandler:
+        """Replace handlers of the logger with a queued handler wrapping them."""
+        handler = QueuedLogHandler(self, log.handlers)
+        for wrapped_handler in handler.handlers:
+            log.removeHandler(wrapped_handler)
+        log.addHandler(handler)
+        return handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="log-queue", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Write the queued items and stop the writer thread."""
+        self._queue.put(None)
+        if self._thread:
+            self._thread.join()
+
+    def _run(self):
+        stopped = False
+        while not stopped:
+            batch = [self._queue.get()]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                stopped = True
+                batch = [entry for entry in batch if entry is not None]
+            self._write(batch)
+
+    @staticmethod
+    def _write(batch: list):
+        writer_items = {}
+        for writer, item in batch:
+            writer_items.setdefault(writer, []).append(item)
+        for writer, items in writer_items.items():
+            try:
+                writer.write_batch(items)
+            except Exception as e:
+                logger.warning(f"Failed to write {len(items)} log entries: {e}")
+
+
+class QueuedLogHandler(logging.Handler):
+    """Handler queueing the records for the wrapped handlers.
+
+    Level and filters of the wrapped handlers are checked by the caller,
+    filters may depend on the caller context, the records are formatted and
+    written by the log queue.
+    """
+
+    def __init__(self, log_queue: LogQueue, handlers: list[logging.Handler]):
+        super().__init__()
+        self.handlers = list(handlers)
+        self._log_queue = log_queue
+
+    def emit(self, record: logging.LogRecord):
+        handlers = [
+            handler
+            for handler in self.handlers
+            if record.levelno >= handler.level and handler.filter(record)
+        ]
+        if handlers:
+            self._log_queue.put(self, (record, handlers))
+
+    def write_batch(self, items: list[tuple]):
+        handler_records = {}
+        for record, handlers in items:
+            # the caller's record is seen by the handlers of parent loggers
+            message = cap_payload(record.getMessage(), self._log_queue.max_payload)
+            record = copy.copy(record)
+            record.msg = message
+            record.args = None
+            for handler in handlers:
+                handler_records.setdefault(handler, []).append(record)
+        for handler, records in handler_records.items():
+            if isinstance(handler, logging.StreamHandler) and handler.stream:
+                self._write_stream(handler, records)
+            else:
+                for record in records:
+                    handler.handle(record)
+
+    @staticmethod
+    def _write_stream(handler: logging.StreamHandler, records: list):
+        """Write the records at once, flushed once."""
+        handler.acquire()
+        try:
+            handler.stream.write(
+                "".join(
+                    handler.format(record) + handler.terminator for record in records
+                )
+            )
+            handler.flush()
+        except Exception:
+            handler.handleError(records[-1])
+        finally:
+            handler.release()
+
+
+class QueuedXMLLogger(XMLLogger):
+    """XML logger queueing the messages, written by the log queue.
+
+    Autoload responses are sampled, the first and then every
+    autoload_sample_rate-th response is recorded, the others are replaced
+    by their size.
+    """
+
+    AUTOLOAD_REQUEST = re.compile(r'CommandName\s*=\s*"GetResourceDescription"')
+
+    def __init__(self, path: str, log_queue: LogQueue, autoload_sample_rate: int = 1):
+        super().__init__(path)
+        self._log_queue = log_queue
+        self._autoload_sample_rate = max(autoload_sample_rate, 1)
+        self._autoload_count = 0
+        self._lock = threading.Lock()
+        # request and response of a connection are logged by its thread
+        self._connection = threading.local()
+
+    def info(self, data: str):
+        if getattr(self._connection, "skip_response", False):
+            self._connection.skip_response = False
+            data = f"Autoload response of {len(data)} characters is not sampled"
+        elif self.AUTOLOAD_REQUEST.search(data):
+            with self._lock:
+                sampled = self._autoload_count % self._autoload_sample_rate == 0
+                self._autoload_count += 1
+            self._connection.skip_response = not sampled
+        self._log_queue.put(self, data)
+
+    def write_batch(self, messages: list[str]):
+        self._write_data(
+            "\r\n".join(
+                cap_payload(self._prepare_output(message), self._log_queue.max_payload)
+                for message in messages
+            )
+        )
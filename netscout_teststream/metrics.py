@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from bisect import bisect_left
+
+from cloudshell.cli.command_template.command_template import CommandTemplate
+from cloudshell.cli.command_template.command_template_executor import (
+    CommandTemplateExecutor,
+)
+from cloudshell.layer_one.core.helper.logger import get_l1_logger
+
+logger = get_l1_logger(name=__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+
+class Histogram:
+    """Prometheus histogram, counts are kept per bucket."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def lines(self, name: str, labels: str) -> list[str]:
+        lines = []
+        cumulative = 0
+        for bucket, count in zip(self.buckets + ("+Inf",), self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bucket}"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+def _label(value) -> str:
+    value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return value.replace("\n", "\\n")
+
+
+class CommandMetrics:
+    """Latency and output size of the CLI commands, session checkout latency.
+
+    Commands are recorded per command template, checkouts per reused flag.
+    """
+
+    COMMAND_DURATION = "netscout_cli_command_duration_seconds"
+    COMMAND_OUTPUT = "netscout_cli_command_output_bytes"
+    CHECKOUT_DURATION = "netscout_cli_session_checkout_duration_seconds"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._durations = {}
+        self._outputs = {}
+        self._checkouts = {}
+
+    def observe_command(self, template: str, duration: float, output_size: int):
+        with self._lock:
+            if template not in self._durations:
+                self._durations[template] = Histogram(LATENCY_BUCKETS)
+                self._outputs[template] = Histogram(SIZE_BUCKETS)
+            self._durations[template].observe(duration)
+            self._outputs[template].observe(output_size)
+
+    def observe_checkout(self, duration: float, reused: bool):
+        with self._lock:
+            if reused not in self._checkouts:
+                self._checkouts[reused] = Histogram(LATENCY_BUCKETS)
+            self._checkouts[reused].observe(duration)
+
+    def reset(self):
+        with self._lock:
+            self._durations.clear()
+            self._outputs.clear()
+            self._checkouts.clear()
+
+    def to_prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, help_text, histograms, label_name in (
+                (
+                    self.COMMAND_DURATION,
+                    "CLI command latency per command template.",
+                    self._durations,
+                    "template",
+                ),
+                (
+                    self.COMMAND_OUTPUT,
+                    "CLI command output size per command template.",
+                    self._outputs,
+                    "template",
+                ),
+                (
+                    self.CHECKOUT_DURATION,
+                    "CLI session checkout latency, reused or new session.",
+                    {str(k).lower(): v for k, v in self._checkouts.items()},
+                    "reused",
+                ),
+            ):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for label_value, histogram in sorted(histograms.items()):
+                    lines.extend(
+                        histogram.lines(name, f'{label_name}="{_label(label_value)}"')
+                    )
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """Write the metrics file, replaced at once for the textfile readers."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+
+
+METRICS = CommandMetrics()
+
+
+def template_name(command_template: CommandTemplate) -> str:
+    return getattr(command_template, "_command", repr(command_template))
+
+
+class TimedCommandTemplateExecutor(CommandTemplateExecutor):
+    """Command template executor recording latency and output size."""
+
+    def execute_command(self, **command_kwargs) -> str:
+        output = ""
+        start_time = time.perf_counter()
+        try:
+            output = super().execute_command(**command_kwargs)
+            return output
+        finally:
+            METRICS.observe_command(
+                template_name(self._command_template),
+                time.perf_counter() - start_time,
+                len(output or ""),
+            )
+
+
+def timed_send_command(
+    cli_service, templates: list[CommandTemplate], command: str, **kwargs
+) -> str:
+    """Send the command built from the templates, a burst of commands."""
+    output = ""
+    start_time = time.perf_counter()
+    try:
+        output = cli_service.send_command(command, **kwargs)
+        return output
+    finally:
+        METRICS.observe_command(
+            " | ".join(sorted({template_name(template) for template in templates})),
+            time.perf_counter() - start_time,
+            len(output or ""),
+        )
+
+
+class MetricsExporter:
+    """Writes the metrics file every interval seconds in a daemon thread."""
+
+    def __init__(self, path: str, interval: int, metrics: CommandMetrics = METRICS):
+        self._path = path
+        self._interval = interval
+        self._metrics = metrics
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+        self._export()
+
+    def _run(self):
+        while not self._stop_event.wait(self._interval):
+            self._export()
+
+    def _export(self):
+        try:
+            self._metrics.write(self._path)
+        except OSError as e:
+            logger.warning(f"Failed to write metrics to {self._path}: {e}")
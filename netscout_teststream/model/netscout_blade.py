@@ -1,25 +1,61 @@
+from __future__ import annotations
+
 import re
 
+from cloudshell.layer_one.core.helper.logger import get_l1_logger
 from cloudshell.layer_one.core.response.resource_info.entities.blade import Blade
 
+logger = get_l1_logger(name=__name__)
+
 
 class NetscoutBlade(Blade):
+    """Netscout Blade.
+
+    Blade types reported by the switch are matched by the normalized name,
+    lowercase with the separators replaced by a space, resolved model is
+    kept for every reported type. Unknown types get the generic model.
+    """
+
     REGISTERED_MODELS = {
-        r"^o[-_\s]blade$": "O-Blade",
-        r"^s[-_\s]blade$": "S-Blade",
-        r"^s[-_\s]blade[-_\s]pro$": "S-Blade-Pro",
-        r"^s[-_\s]blade\s64$": "S-Blade 64",
-        r"^t[-_\s]blade$": "T-Blade",
-        r"^t100[-_\s]blade$": "T100-Blade",
-        r"^t100l[-_\s]blade$": "T100L-Blade",
-        r"^hs[-_\s]bank$": "Hs-Bank",
+        "o blade": "O-Blade",
+        "s blade": "S-Blade",
+        "s blade pro": "S-Blade-Pro",
+        "s blade 64": "S-Blade 64",
+        "t blade": "T-Blade",
+        "t100 blade": "T100-Blade",
+        "t100l blade": "T100L-Blade",
+        "hs bank": "Hs-Bank",
     }
+    MODEL_NAME = "Netscout Generic L1 Blade"
+    SEPARATORS = re.compile(r"[-_\s]+")
+
+    _models = dict(REGISTERED_MODELS)
+    _resolved_models = {}
+
+    @classmethod
+    def normalize_name(cls, model_name: str) -> str:
+        return cls.SEPARATORS.sub(" ", model_name.strip().lower())
+
+    @classmethod
+    def register_models(cls, models: dict):
+        """Add blade models, blade type reported by the switch: model name."""
+        for model_name, model in models.items():
+            cls._models[cls.normalize_name(model_name)] = model
+        cls._resolved_models = {}
 
-    def _associate_blade_model(self, model_name):
-        for patt in self.REGISTERED_MODELS:
-            if re.match(patt, model_name, flags=re.IGNORECASE):
-                return self.REGISTERED_MODELS[patt]
-        raise Exception(f"Blade model {model_name} is not registered")
+    @classmethod
+    def _associate_blade_model(cls, model_name: str) -> str:
+        model = cls._resolved_models.get(model_name)
+        if model is None:
+            model = cls._models.get(cls.normalize_name(model_name))
+            if model is None:
+                logger.warning(
+                    f"Blade model {model_name} is not registered, "
+                    f"using {cls.MODEL_NAME}"
+                )
+                model = cls.MODEL_NAME
+            cls._resolved_models[model_name] = model
+        return model
 
     def __init__(self, resource_id, model_name):
         super().__init__(
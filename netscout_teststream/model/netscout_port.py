@@ -1,5 +1,8 @@
+from functools import lru_cache
+
 from cloudshell.layer_one.core.response.resource_info.entities.attributes import (
     NumericAttribute,
+    StringAttribute,
 )
 from cloudshell.layer_one.core.response.resource_info.entities.port import Port
 
@@ -39,17 +42,41 @@ class NetscoutPort(Port):
         110: (74, 10, 46),  # CPRI1 (614.4 mbps)
     }
     MODEL_NAME = "Netscout Generic L1 Port"
+    DEFAULT_PROTOCOL = (2, 0, 1)
+    MODEL_NAME_ATTRIBUTES_CACHE_SIZE = 4096
 
     def __init__(self, resource_id, port_model_name=None, netscout_protocol_id=0):
         super().__init__(resource_id)
-        protocol_id, protocol_type_id, speed_id = self.PROTOCOL_ASSOCIATION_TABLE.get(
-            int(netscout_protocol_id), (2, 0, 1)
+        # attributes never change once created, ports with the same protocol
+        # and name share them
+        self.attributes.extend(self._protocol_attributes(netscout_protocol_id))
+        if port_model_name:
+            self.attributes.append(self._model_name_attribute(port_model_name))
+        if netscout_protocol_id:
+            self.attributes.append(self._protocol_value_attribute(netscout_protocol_id))
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _protocol_attributes(cls, netscout_protocol_id) -> tuple:
+        """Protocol, Protocol Type and Speed attributes of the Netscout protocol."""
+        protocol_id, protocol_type_id, speed_id = cls.PROTOCOL_ASSOCIATION_TABLE.get(
+            int(netscout_protocol_id), cls.DEFAULT_PROTOCOL
+        )
+        return (
+            NumericAttribute("Protocol", protocol_id),
+            NumericAttribute("Protocol Type", protocol_type_id),
+            NumericAttribute("Speed", speed_id),
         )
-        self.set_protocol(protocol_id)
-        self.set_protocol_type(protocol_type_id)
-        self.set_speed(speed_id)
-        self.set_model_name(port_model_name)
-        self.set_protocol_value(netscout_protocol_id)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _protocol_value_attribute(netscout_protocol_id) -> StringAttribute:
+        return StringAttribute("Protocol Value", netscout_protocol_id)
+
+    @staticmethod
+    @lru_cache(maxsize=MODEL_NAME_ATTRIBUTES_CACHE_SIZE)
+    def _model_name_attribute(port_model_name: str) -> StringAttribute:
+        return StringAttribute("Model Name", port_model_name)
 
     def set_protocol(self, value):
         if value is not None:
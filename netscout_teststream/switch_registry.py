@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable
+
+from cloudshell.layer_one.core.helper.logger import get_l1_logger
+from cloudshell.layer_one.core.layer_one_driver_exception import LayerOneDriverException
+
+from netscout_teststream.cli.netscout_cli_handler import NetscoutCliHandler
+from netscout_teststream.command_actions.command_dialect import (
+    CommandDialect,
+    SoftwareVersion,
+)
+from netscout_teststream.switch_state import SwitchState
+from netscout_teststream.topology_cache import TopologyCache
+
+logger = get_l1_logger(name=__name__)
+
+
+class SwitchContext:
+    """Session group and cached data of one switch served by the driver."""
+
+    def __init__(
+        self,
+        address: str,
+        switch_name: str,
+        cli_handler,
+        topology_ttl: int = TopologyCache.DEFAULT_TTL,
+    ):
+        self.address = address
+        self.name = switch_name
+        self.cli_handler = cli_handler
+        self.software_version = None
+        self.dialect = None
+        self.topology = TopologyCache(topology_ttl)
+        self.state = SwitchState(topology_ttl)
+
+    def __repr__(self):
+        return f"SwitchContext({self.name}, {self.address})"
+
+    def set_software_version(self, software_version: SoftwareVersion):
+        """Keep the version and the command dialect resolved for it."""
+        self.software_version = software_version
+        self.dialect = CommandDialect.for_version(software_version)
+
+    @contextmanager
+    def mapping_service(self):
+        """Default mode session for commands changing the switch mappings.
+
+        Cached topology and state become outdated when the session is released.
+        """
+        try:
+            with self.cli_handler.default_mode_service() as session:
+                yield session
+        finally:
+            self.topology.invalidate()
+            self.state.invalidate()
+
+
+class SwitchRegistry:
+    """Switches served by one driver process.
+
+    Every switch gets its own cli handler, so sessions stay on the switch they
+    selected, and commands for different switches do not wait for each other.
+    Switch is found by the resource address, which is also the first part of
+    its port addresses. Commands without an address use the switch logged in
+    by the current thread.
+    """
+
+    ADDRESS_SEPARATOR = "/"
+    MAX_WORKERS = 8
+
+    def __init__(
+        self,
+        cli_handler_factory: Callable = NetscoutCliHandler,
+        topology_ttl: int = TopologyCache.DEFAULT_TTL,
+    ):
+        self._cli_handler_factory = cli_handler_factory
+        self._topology_ttl = topology_ttl
+        self._switches = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def __len__(self):
+        return len(self._switches)
+
+    @staticmethod
+    def _key(address: str) -> str:
+        return address.strip().lower()
+
+    def register(
+        self,
+        address: str,
+        switch_name: str,
+        host: str,
+        username: str,
+        password: str,
+        port: int = None,
+    ) -> SwitchContext:
+        """Add the switch or update its session attributes, make it current."""
+        key = self._key(address)
+        replaced = None
+        with self._lock:
+            switch = self._switches.get(key)
+            if not switch or switch.name != switch_name:
+                replaced = switch
+                switch = SwitchContext(
+                    address,
+                    switch_name,
+                    self._cli_handler_factory(),
+                    self._topology_ttl,
+                )
+                self._switches[key] = switch
+                logger.debug(f"Registered switch {switch_name} for {address}")
+        if replaced:
+            replaced.cli_handler.close()
+        switch.cli_handler.define_session_attributes(host, username, password, port)
+        self._local.current = switch
+        return switch
+
+    def close(self):
+        """Close the cli handlers of all switches."""
+        with self._lock:
+            switches = list(self._switches.values())
+            self._switches.clear()
+        for switch in switches:
+            switch.cli_handler.close()
+
+    @property
+    def current(self) -> SwitchContext:
+        switch = getattr(self._local, "current", None)
+        if not switch:
+            if len(self._switches) == 1:
+                return next(iter(self._switches.values()))
+            raise LayerOneDriverException(
+                "Switch is not defined, call Login command first"
+            )
+        return switch
+
+    def get(self, address: str) -> SwitchContext:
+        """Switch registered for the resource address or the current switch."""
+        return self._switches.get(self._key(address)) or self.current
+
+    def for_port(self, port_address: str) -> SwitchContext:
+        """Switch the port belongs to."""
+        return self.get(port_address.split(self.ADDRESS_SEPARATOR)[0])
+
+    def group_ports(self, ports: list[str]) -> OrderedDict:
+        """Group port addresses by switch."""
+        groups = OrderedDict()
+        for port in ports:
+            groups.setdefault(self.for_port(port), []).append(port)
+        return groups
+
+    def run_parallel(self, action: Callable, groups: OrderedDict) -> list[str]:
+        """Run action(switch, ports) for every switch group concurrently.
+
+        Return error messages of the failed groups.
+        """
+        if len(groups) == 1:
+            switch, ports = next(iter(groups.items()))
+            action(switch, ports)
+            return []
+
+        exception_messages = []
+        with ThreadPoolExecutor(
+            max_workers=min(len(groups), self.MAX_WORKERS)
+        ) as executor:
+            futures = [
+                executor.submit(action, switch, ports)
+                for switch, ports in groups.items()
+            ]
+            for future in futures:
+                exception = future.exception()
+                if exception:
+                    exception_messages.append(str(exception))
+        return exception_messages
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+
+
+class SwitchState:
+    """Fingerprint of the switch ports state used as the CloudShell state id.
+
+    Fingerprint is a hash of the port addresses, modes and connection flags
+    reported by the switch. It is kept while it is younger than ttl seconds
+    and was not invalidated by a mapping command, so the state id is returned
+    without talking to the switch. The state id set by CloudShell is returned
+    until the fingerprint changes.
+
+    Fingerprint is read with the generation taken before the read, it is
+    dropped if the state was invalidated since then.
+    """
+
+    DEFAULT_TTL = 0
+
+    def __init__(self, ttl: int = DEFAULT_TTL):
+        self._ttl = ttl
+        self._fingerprint = None
+        self._updated = 0
+        self._state_id = None
+        self._state_fingerprint = None
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def fingerprint(port_states) -> str:
+        """Hash of the port state tuples."""
+        digest = hashlib.sha1()
+        for port_state in port_states:
+            digest.update(",".join(port_state).encode())
+            digest.update(b"\n")
+        return digest.hexdigest()
+
+    def is_valid(self) -> bool:
+        return self._fingerprint is not None and time.time() - self._updated < self._ttl
+
+    def invalidate(self):
+        """Mark the fingerprint outdated, it is read from the switch again."""
+        with self._generation_lock:
+            self._generation += 1
+            self._fingerprint = None
+
+    @property
+    def generation(self) -> int:
+        """Invalidations count, taken before reading the fingerprint."""
+        return self._generation
+
+    def update(self, fingerprint: str, generation: int):
+        """Keep the fingerprint unless invalidated after the generation."""
+        with self._generation_lock:
+            if generation != self._generation:
+                return
+            self._fingerprint = fingerprint
+            self._updated = time.time()
+
+    @property
+    def state_id(self) -> str:
+        if self._state_id is not None and self._state_fingerprint == self._fingerprint:
+            return self._state_id
+        return self._fingerprint
+
+    def set_state_id(self, state_id: str):
+        """Bind the state id to the current fingerprint."""
+        self._state_id = state_id
+        self._state_fingerprint = self._fingerprint
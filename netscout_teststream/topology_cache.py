@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+from cloudshell.layer_one.core.helper.logger import get_l1_logger
+from cloudshell.layer_one.core.response.resource_info.entities.base import ResourceInfo
+
+logger = get_l1_logger(name=__name__)
+
+
+class TopologyCache:
+    """Resource tree of a switch reused between autoloads.
+
+    The tree is returned as is while it is younger than ttl seconds and was
+    not invalidated by a mapping command. After that autoload reads the switch
+    again and updates the tree: resources with unchanged data are kept,
+    only new and changed resources are created, vanished ones are removed.
+
+    Mappings invalidate the tree without waiting for the autoload holding the
+    lock. Every invalidation starts a new generation, a tree read while the
+    generation changed is not marked valid.
+    """
+
+    DEFAULT_TTL = 0
+
+    def __init__(self, ttl: int = DEFAULT_TTL):
+        self._ttl = ttl
+        self._resources = {}
+        self._seen = set()
+        self._address = None
+        self._updated = 0
+        self._valid = False
+        self._generation = 0
+        self._update_generation = None
+        self._generation_lock = threading.Lock()
+        self.chassis_dict = {}
+        self.lock = threading.RLock()
+
+    def is_valid(self, address: str) -> bool:
+        return (
+            self._valid
+            and self._address == address
+            and time.time() - self._updated < self._ttl
+        )
+
+    def invalidate(self):
+        """Mark the tree outdated, the next autoload refreshes it."""
+        with self._generation_lock:
+            self._generation += 1
+            self._valid = False
+
+    def begin_update(self, address: str):
+        with self._generation_lock:
+            self._valid = False
+            self._update_generation = self._generation
+        if address != self._address:
+            self._resources.clear()
+        self._address = address
+        self._seen = set()
+        self.chassis_dict = {}
+
+    def get_resource(
+        self,
+        key: tuple,
+        signature: tuple,
+        factory: Callable[[], ResourceInfo],
+        parent: ResourceInfo = None,
+    ) -> ResourceInfo:
+        """Cached resource for the key if its data and parent did not change.
+
+        Otherwise create the resource with the factory and attach it to the
+        parent. Mappings of cached resources are reset, they are built again.
+        """
+        self._seen.add(key)
+        entry = self._resources.get(key)
+        if entry and entry[0] == signature and entry[2] is parent:
+            resource = entry[1]
+            resource.mapping = None
+        else:
+            resource = factory()
+            if parent is not None:
+                resource.set_parent_resource(parent)
+            self._resources[key] = (signature, resource, parent)
+        return resource
+
+    def end_update(self):
+        """Remove resources not found by the last autoload.
+
+        The tree is valid only if it was not invalidated during the update.
+        """
+        for key in set(self._resources) - self._seen:
+            _, resource, parent = self._resources.pop(key)
+            if (
+                parent is not None
+                and parent.child_resources.get(resource.resource_id) is resource
+            ):
+                del parent.child_resources[resource.resource_id]
+        logger.debug(f"Topology updated, {len(self._resources)} resources")
+        with self._generation_lock:
+            if self._generation != self._update_generation:
+                logger.debug("Topology invalidated during the update")
+                return
+            self._updated = time.time()
+            self._valid = True
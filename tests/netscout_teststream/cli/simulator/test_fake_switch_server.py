@@ -0,0 +1,111 @@
+import asyncio
+import re
+import time
+from unittest import TestCase
+
+from netscout_teststream.cli.async_cli_handler import AsyncCliService
+from netscout_teststream.cli.async_session import AsyncTelnetSession
+from netscout_teststream.cli.simulator.fake_switch_server import (
+    INJECTED_ERRORS,
+    FakeSwitchServer,
+)
+from netscout_teststream.command_actions.async_actions import AsyncMappingActions
+from netscout_teststream.command_templates.errors import GENERIC_ERRORS
+
+
+class TestFakeSwitchServer(TestCase):
+    SWITCH_NAME = "3912X_24.30"
+
+    def _run(self, test_coroutine, server: FakeSwitchServer = None):
+        server = server or FakeSwitchServer()
+
+        async def _run():
+            await server.start()
+            session = AsyncTelnetSession("127.0.0.1", "admin", "admin", server.port)
+            try:
+                await session.connect()
+                actions = AsyncMappingActions(
+                    self.SWITCH_NAME, AsyncCliService(session)
+                )
+                return await test_coroutine(actions)
+            finally:
+                await session.disconnect()
+                await server.close()
+
+        return asyncio.run(_run())
+
+    def test_mapping_changes_connections(self):
+        async def _test(actions):
+            await actions.connect_simplex("01.01.01", "01.01.02")
+            await actions.connect_duplex("01.01.04", "01.01.05")
+            await actions.disconnect_simplex("01.01.01", "01.01.02")
+            return await actions.connection_table()
+
+        mapping_table = self._run(_test).mapping_table()
+        self.assertNotIn("01.01.01", mapping_table)
+        self.assertEqual(mapping_table["01.01.04"], ["01.01.05"])
+        self.assertEqual(mapping_table["01.01.05"], ["01.01.04"])
+
+    def test_rejected_commands(self):
+        async def _test(actions):
+            return await actions.execute_batch(
+                [
+                    actions.simplex_command("01.01.01", "99.99.99"),
+                    actions.disconnect_simplex_command("01.01.01", "01.01.03"),
+                ]
+            )
+
+        errors = self._run(_test)
+        self.assertEqual(
+            list(errors.values()),
+            [
+                "Session returned 'Incorrect port number format'",
+                "Session returned 'Subport is not simplex connected'",
+            ],
+        )
+
+    def test_error_injection(self):
+        async def _test(actions):
+            return await actions.execute_batch(
+                [actions.simplex_command("01.01.01", "01.01.02")] * 5
+            )
+
+        server = FakeSwitchServer(error_rate=1, error_commands="^CONNECT", seed=1)
+        errors = self._run(_test, server)
+        self.assertEqual(len(errors), 1)
+        self.assertRegex(list(errors.values())[0], "^Session returned")
+
+    def test_injected_errors_are_generic(self):
+        for error in INJECTED_ERRORS:
+            self.assertTrue(
+                any(re.search(pattern, error) for pattern in GENERIC_ERRORS), error
+            )
+
+    def test_command_latency(self):
+        async def _test(actions):
+            started = time.monotonic()
+            await actions.connection_info("01.07.01")
+            return time.monotonic() - started
+
+        server = FakeSwitchServer(command_latency={"^show conn": 0.2})
+        self.assertGreaterEqual(self._run(_test, server), 0.2)
+
+    def test_answers_written_per_command(self):
+        server = FakeSwitchServer()
+        received = iter(["logon admin admin\rshow version\rshow", " version\r"])
+        events = []
+
+        async def read():
+            return next(received, None)
+
+        async def drain():
+            events.append("drain")
+
+        asyncio.run(server._serve(read, events.append, drain, logged_in=False))
+
+        answers = events[1::2]
+        self.assertEqual(events[2::2], ["drain"] * len(answers))
+        self.assertEqual(
+            [answer.split("\r\n")[0] for answer in answers],
+            ["logon admin admin", "show version", "show version"],
+        )
@@ -0,0 +1,60 @@
+from unittest import TestCase
+
+import netscout_teststream.command_templates.autoload as command_template
+from netscout_teststream.cli.simulator.fake_switch_server import DATA_PATH
+from netscout_teststream.cli.simulator.simulated_switch import SimulatedSwitch
+from netscout_teststream.command_actions.autoload_actions import AutoloadActions
+from netscout_teststream.command_actions.connection_table import ConnectionTable
+
+
+class TestSimulatedSwitch(TestCase):
+    def setUp(self):
+        self._switch = SimulatedSwitch.from_data(DATA_PATH, "3912X_24.30")
+
+    def _mapping_table(self) -> dict:
+        return ConnectionTable.from_output(
+            self._switch.connection_output()
+        ).mapping_table()
+
+    def _connected_ports(self) -> list:
+        actions = AutoloadActions("3912X_24.30", None)
+        actions.set_command_output(
+            command_template.SHOW_PORTS_RAW, self._switch.rawinfo_output()
+        )
+        return actions.connected_ports()
+
+    def test_loaded_from_data(self):
+        table = ConnectionTable.from_output(self._switch.connection_output())
+        self.assertEqual(len(table), 25)
+        self.assertIsNone(SimulatedSwitch.from_data(DATA_PATH, "unknown"))
+
+    def test_connect_simplex(self):
+        self._switch.connect("01.01.01", "01.01.02")
+        self.assertEqual(self._mapping_table()["01.01.01"], ["01.01.02"])
+        connected = self._connected_ports()
+        self.assertIn("01.01.01", connected)
+        self.assertIn("01.01.02", connected)
+
+    def test_connect_replaces_destination_connections(self):
+        self._switch.connect("01.01.01", "01.01.02")
+        self._switch.connect("01.01.04", "01.01.02")
+        mapping_table = self._mapping_table()
+        self.assertNotIn("01.01.01", mapping_table)
+        self.assertEqual(mapping_table["01.01.04"], ["01.01.02"])
+        self.assertNotIn("01.01.01", self._connected_ports())
+
+    def test_disconnect(self):
+        self._switch.connect("01.01.01", "01.01.02", duplex=True)
+        self.assertFalse(self._switch.disconnect_simplex("01.01.02"))
+        self.assertTrue(self._switch.disconnect_duplex("01.01.01", "01.01.02"))
+        self.assertEqual(
+            self._switch.connection_output("01.01.01"), SimulatedSwitch.NOT_FOUND
+        )
+        self.assertNotIn("01.01.02", self._connected_ports())
+
+    def test_idle_ports(self):
+        idle_ports = self._switch.idle_ports()
+        self.assertIn("01.01.01", idle_ports)
+        self.assertNotIn("01.01.03", idle_ports)
+        self._switch.connect("01.01.01", "01.01.02")
+        self.assertNotIn("01.01.01", self._switch.idle_ports())
@@ -0,0 +1,97 @@
+import asyncio
+from unittest import TestCase
+from unittest.mock import Mock
+
+from cloudshell.cli.session.session_exceptions import CommandExecutionException
+
+from netscout_teststream.cli.async_cli_handler import AsyncNetscoutCliHandler
+from netscout_teststream.cli.async_session import AsyncTelnetSession
+from netscout_teststream.cli.simulator.fake_switch_server import FakeSwitchServer
+
+
+def run_with_server(test_coroutine, server: FakeSwitchServer = None):
+    server = server or FakeSwitchServer()
+
+    async def _run():
+        await server.start()
+        try:
+            return await test_coroutine(server)
+        finally:
+            await server.close()
+
+    return asyncio.run(_run())
+
+
+class TestAsyncTelnetSession(TestCase):
+    def test_login_and_command(self):
+        async def _test(server):
+            session = AsyncTelnetSession("127.0.0.1", "admin", "admin", server.port)
+            await session.connect()
+            output = await session.hardware_expect("show status", "=>", Mock())
+            await session.disconnect()
+            return output
+
+        output = run_with_server(_test)
+        self.assertIn("TestStream Management Version 04.05.200.116", output)
+
+    def test_login_with_wrong_password(self):
+        async def _test(server):
+            session = AsyncTelnetSession("127.0.0.1", "admin", "wrong", server.port)
+            try:
+                await session.connect()
+            finally:
+                await session.disconnect()
+
+        with self.assertRaisesRegex(CommandExecutionException, "Invalid username"):
+            run_with_server(_test)
+
+    def test_negotiation_removed_from_data(self):
+        session = AsyncTelnetSession("127.0.0.1", "admin", "admin")
+        session._writer = Mock()
+        IAC, DO, WILL = session.IAC, session.DO, session.WILL
+
+        data = session._negotiate(bytes([IAC, DO, 24]) + b"Te" + bytes([IAC]))
+        self.assertEqual(data, b"Te")
+        data = session._negotiate(bytes([WILL, session.ECHO]) + b"st")
+        self.assertEqual(data, b"st")
+
+        answers = [c.args[0] for c in session._writer.write.call_args_list]
+        self.assertEqual(
+            answers,
+            [
+                bytes([IAC, session.WONT, 24]),
+                bytes([IAC, session.DO, session.ECHO]),
+            ],
+        )
+
+
+class TestAsyncNetscoutCliHandler(TestCase):
+    def _handler(self, server, pool_size):
+        config = Mock()
+        config.read_key.side_effect = lambda key, default=None: {
+            "CLI.POOL.MAX_SIZE": pool_size,
+            "CLI.TYPE": ["TELNET"],
+        }.get(key, default)
+        handler = AsyncNetscoutCliHandler(config)
+        handler.define_session_attributes("127.0.0.1", "admin", "admin", server.port)
+        return handler
+
+    def test_concurrent_commands_share_pool(self):
+        async def _test(server):
+            handler = self._handler(server, 2)
+
+            async def show_status():
+                async with handler.default_mode_service() as cli_service:
+                    return await cli_service.send_command("show status")
+
+            outputs = await asyncio.gather(*(show_status() for _ in range(4)))
+            sessions = len(handler._idle_sessions)
+            await handler.close()
+            return outputs, sessions, server.commands
+
+        outputs, sessions, commands = run_with_server(_test)
+        self.assertEqual(len(outputs), 4)
+        self.assertTrue(all("04.05.200.116" in output for output in outputs))
+        self.assertEqual(sessions, 2)
+        self.assertEqual(commands.count("show status"), 4)
+        self.assertEqual(commands.count("logon admin admin"), 2)
@@ -0,0 +1,38 @@
+from unittest import TestCase
+
+from cloudshell.layer_one.core.layer_one_driver_exception import LayerOneDriverException
+
+from netscout_teststream.cli.netscout_cli_handler import NetscoutCliHandler
+from netscout_teststream.cli.netscout_telnet_session import NetscoutTelnetSession
+
+
+class TestNetscoutCliHandler(TestCase):
+    def setUp(self):
+        self._cli_handler = NetscoutCliHandler()
+
+    def test_session_types_not_imported(self):
+        self.assertEqual(
+            self._cli_handler._defined_session_types,
+            NetscoutCliHandler.SESSION_TYPES,
+        )
+
+    def test_session_class_imported_on_first_use(self):
+        session_class = self._cli_handler._session_class("TELNET")
+        self.assertIs(session_class, NetscoutTelnetSession)
+        self.assertIs(
+            self._cli_handler._defined_session_types["TELNET"], NetscoutTelnetSession
+        )
+        self.assertIsInstance(self._cli_handler._defined_session_types["SSH"], str)
+
+    def test_create_sessions(self):
+        self._cli_handler._session_types = ["TELNET"]
+        self._cli_handler.define_session_attributes("host", "user", "password", 23)
+        (session,) = self._cli_handler._create_sessions()
+        self.assertIsInstance(session, NetscoutTelnetSession)
+        self.assertEqual(session.host, "host")
+
+    def test_create_sessions_undefined_type(self):
+        self._cli_handler._session_types = ["SERIAL"]
+        self._cli_handler.define_session_attributes("host", "user", "password")
+        with self.assertRaisesRegex(LayerOneDriverException, "SERIAL is not defined"):
+            self._cli_handler._create_sessions()
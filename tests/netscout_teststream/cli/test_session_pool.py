@@ -0,0 +1,120 @@
+import threading
+from unittest import TestCase
+from unittest.mock import Mock
+
+from netscout_teststream.cli.session_pool import KeepaliveSessionPoolManager
+
+
+class FakeSession:
+    session_type = "FAKE"
+
+    def __init__(self, host):
+        self.host = host
+        self.alive = True
+        self.connected = False
+        self.probes = 0
+
+    def __eq__(self, other):
+        return self.host == other.host
+
+    def connect(self, prompt, logger):
+        self.connected = True
+
+    def disconnect(self):
+        self.connected = False
+
+    def active(self):
+        return self.connected
+
+    def probe_for_prompt(self, prompt, logger):
+        self.probes += 1
+        if not self.alive:
+            raise Exception("Socket closed")
+        return "=>"
+
+
+class TestKeepaliveSessionPoolManager(TestCase):
+    def setUp(self):
+        self._logger = Mock()
+        self._defined_sessions = [FakeSession("host")]
+        self._pool = KeepaliveSessionPoolManager(
+            max_pool_size=2, pool_timeout=1, keepalive_interval=0
+        )
+
+    def test_connects_copy_of_defined_session(self):
+        session = self._pool.get_session(self._defined_sessions, "=>", self._logger)
+        self.assertIsNot(session, self._defined_sessions[0])
+        self.assertTrue(session.connected)
+        self.assertFalse(self._defined_sessions[0].connected)
+
+    def test_reuses_pooled_session(self):
+        session = self._pool.get_session(self._defined_sessions, "=>", self._logger)
+        self._pool.return_session(session, self._logger)
+        reused = self._pool.get_session(self._defined_sessions, "=>", self._logger)
+
+        self.assertIs(reused, session)
+        self.assertFalse(reused.new_session)
+
+    def test_replaces_dead_session(self):
+        session = self._pool.get_session(self._defined_sessions, "=>", self._logger)
+        self._pool.return_session(session, self._logger)
+        session.alive = False
+
+        new_session = self._pool.get_session(self._defined_sessions, "=>", self._logger)
+
+        self.assertIsNot(new_session, session)
+        self.assertFalse(session.connected)
+        self.assertEqual(self._pool._session_manager.existing_sessions_count(), 1)
+
+    def test_keepalive_removes_dead_sessions(self):
+        first = self._pool.get_session(self._defined_sessions, "=>", self._logger)
+        second = self._pool.get_session(self._defined_sessions, "=>", self._logger)
+        self._pool.return_session(first, self._logger)
+        self._pool.return_session(second, self._logger)
+        second.alive = False
+
+        self._pool.keepalive(self._logger)
+
+        self.assertEqual(self._pool._pool.qsize(), 1)
+        self.assertEqual(first.probes, 1)
+        self.assertFalse(second.connected)
+
+    def test_probe_not_under_pool_lock(self):
+        pool = KeepaliveSessionPoolManager(
+            max_pool_size=2, pool_timeout=1, keepalive_interval=1
+        )
+        session = pool.get_session(self._defined_sessions, "=>", self._logger)
+        pool.return_session(session, self._logger)
+        session.last_used = 0
+        lock_acquired = []
+
+        def probe_for_prompt(prompt, logger):
+            thread = threading.Thread(
+                target=lambda: lock_acquired.append(
+                    pool._session_condition.acquire(timeout=1)
+                    and pool._session_condition.release() is None
+                )
+            )
+            thread.start()
+            thread.join()
+            return "=>"
+
+        session.probe_for_prompt = probe_for_prompt
+        reused = pool.get_session(self._defined_sessions, "=>", self._logger)
+        pool.close(self._logger)
+
+        self.assertIs(reused, session)
+        self.assertEqual(lock_acquired, [True])
+
+    def test_close_stops_keepalive_and_disconnects_idle_sessions(self):
+        pool = KeepaliveSessionPoolManager(
+            max_pool_size=2, pool_timeout=1, keepalive_interval=60
+        )
+        session = pool.get_session(self._defined_sessions, "=>", self._logger)
+        pool.return_session(session, self._logger)
+
+        pool.close(self._logger)
+
+        self.assertFalse(pool._keepalive_thread.is_alive())
+        self.assertFalse(session.connected)
+        self.assertTrue(pool._pool.empty())
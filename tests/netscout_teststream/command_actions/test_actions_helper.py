@@ -0,0 +1,70 @@
+import os
+from unittest import TestCase
+
+import netscout_teststream.command_actions.actions_helper as helper
+
+DATA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    os.pardir,
+    os.pardir,
+    os.pardir,
+    "netscout_teststream",
+    "cli",
+    "simulator",
+    "data",
+)
+
+COLUMNS = [
+    "src_addr",
+    "src_name",
+    "src_rx",
+    "connection_type",
+    "dst_addr",
+    "dst_name",
+    "dst_rx",
+    "speed",
+    "protocol",
+]
+
+
+class TestParseTable(TestCase):
+    def test_show_connection(self):
+        file_name = "show_connection_switch_3912X_24.30.txt"
+        with open(os.path.join(DATA_PATH, file_name)) as f:
+            table = helper.parse_table(f.read(), COLUMNS)
+
+        self.assertEqual(len(table), 25)
+        self.assertEqual(
+            table[19],
+            {
+                "src_addr": "01.01.17",
+                "src_name": "24.30 01.01.17.01",
+                "src_rx": "Not Present",
+                "connection_type": "Unknown",
+                "dst_addr": "01.01.21",
+                "dst_name": "24.30 01.01.21.02",
+                "dst_rx": "Not Present",
+                "speed": "40000",
+                "protocol": "Ethernet",
+            },
+        )
+
+    def test_value_longer_than_column(self):
+        output = "A     B   C\n----  --  --\n\nfirst  second  3\n"
+
+        table = helper.parse_table(output, ["a", "b", "c"])
+
+        self.assertEqual(table, [{"a": "first", "b": "second", "c": "3"}])
+
+    def test_columns_count_mismatch(self):
+        with self.assertRaisesRegex(Exception, "Parsing table error"):
+            helper.parse_table("A  B\n--  --\n1  2\n", ["a"])
+
+    def test_no_table(self):
+        self.assertEqual(helper.parse_table("Connection not found", COLUMNS), [])
+
+    def test_iter_table_is_lazy(self):
+        rows = helper.iter_table("A   B\n--  --\n1   2\n3   4\n", ["a", "b"])
+
+        self.assertEqual(next(rows), {"a": "1", "b": "2"})
+        self.assertEqual(next(rows), {"a": "3", "b": "4"})
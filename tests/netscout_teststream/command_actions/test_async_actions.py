@@ -0,0 +1,70 @@
+import asyncio
+from unittest import TestCase
+
+from netscout_teststream.cli.async_cli_handler import AsyncCliService
+from netscout_teststream.cli.async_session import AsyncTelnetSession
+from netscout_teststream.cli.simulator.fake_switch_server import FakeSwitchServer
+from netscout_teststream.command_actions.async_actions import (
+    AsyncAutoloadActions,
+    AsyncMappingActions,
+)
+
+
+class TestAsyncActions(TestCase):
+    SWITCH_NAME = "3912X_24.30"
+
+    def _run(self, test_coroutine):
+        server = FakeSwitchServer()
+
+        async def _run():
+            await server.start()
+            session = AsyncTelnetSession("127.0.0.1", "admin", "admin", server.port)
+            try:
+                await session.connect()
+                return await test_coroutine(AsyncCliService(session))
+            finally:
+                await session.disconnect()
+                await server.close()
+
+        return asyncio.run(_run()), server.commands
+
+    def test_autoload(self):
+        async def _test(cli_service):
+            actions = AsyncAutoloadActions(self.SWITCH_NAME, cli_service)
+            return (
+                await actions.switch_model_name(),
+                await actions.chassis_table(),
+                await actions.port_table(),
+                await actions.mapping_table(),
+            )
+
+        (model_name, chassis_table, port_table, mapping_table), commands = self._run(
+            _test
+        )
+        self.assertTrue(model_name)
+        self.assertTrue(chassis_table)
+        self.assertEqual(len(port_table), 537)
+        self.assertTrue(mapping_table)
+        self.assertEqual(
+            commands.count(f'show information switch "{self.SWITCH_NAME}"'), 1
+        )
+
+    def test_execute_batch_sends_burst(self):
+        async def _test(cli_service):
+            actions = AsyncMappingActions(self.SWITCH_NAME, cli_service)
+            mapping_commands = [
+                actions.simplex_command("01.01.01", dst)
+                for dst in ("01.01.02", "01.01.03")
+            ]
+            return await actions.execute_batch(mapping_commands)
+
+        errors, commands = self._run(_test)
+        self.assertEqual(errors, {})
+        self.assertEqual(
+            commands[-3:],
+            [
+                f'select switch "{self.SWITCH_NAME}"',
+                "CONNECT -s -F PRTNUM 01.01.01 PRTNUM 01.01.02",
+                "CONNECT -s -F PRTNUM 01.01.01 PRTNUM 01.01.03",
+            ],
+        )
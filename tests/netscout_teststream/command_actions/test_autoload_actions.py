@@ -0,0 +1,55 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import netscout_teststream.command_templates.autoload as command_template
+from netscout_teststream.command_actions.autoload_actions import AutoloadActions
+
+PORTS_RAW_OUTPUT = """01.01.01,90,01,00,00,00,00,00,'Port 1'
+01.01.02,90,16,00,00,00,00,00,'Not used'
+01.01.03,90,01,01,01,00,00,01,'Rack 3, shelf 2'
+"""
+
+
+class TestAutoloadActions(TestCase):
+    def setUp(self):
+        self._cli_service = Mock()
+        self._cli_service.send_command.return_value = PORTS_RAW_OUTPUT
+        self._instance = AutoloadActions("3912X_24.30", self._cli_service)
+
+    def test_port_table(self):
+        port_table = self._instance.port_table()
+
+        self.assertEqual(list(port_table), ["01.01.01", "01.01.03"])
+        self.assertEqual(port_table["01.01.03"].name, "Rack 3, shelf 2")
+        self.assertEqual(port_table["01.01.03"].protocol_id, "90")
+
+    def test_port_states_use_same_output(self):
+        self._instance.port_table()
+        port_states = self._instance.port_states()
+
+        self._cli_service.send_command.assert_called_once()
+        self.assertEqual(port_states[2], ("01.01.03", "90", "01", "01", "01"))
+
+    def test_connected_ports(self):
+        self.assertEqual(self._instance.connected_ports(), ["01.01.03"])
+
+    @patch("netscout_teststream.command_actions.autoload_actions.csv")
+    def test_port_rows_parsed_once(self, csv_mod):
+        csv_mod.reader.return_value = [
+            ["01.01.03", "90", "01", "01", "01", "00", "00", "01", "Port 3"]
+        ]
+
+        self._instance.port_table()
+        self._instance.port_states()
+        self._instance.connected_ports()
+
+        csv_mod.reader.assert_called_once()
+
+    def test_port_rows_parsed_again_for_new_output(self):
+        self._instance.port_table()
+        self._instance.set_command_output(
+            command_template.SHOW_PORTS_RAW, PORTS_RAW_OUTPUT.splitlines()[0]
+        )
+
+        self.assertEqual(self._instance.connected_ports(), [])
+        self.assertEqual(list(self._instance.port_table()), ["01.01.01"])
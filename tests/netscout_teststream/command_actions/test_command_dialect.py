@@ -0,0 +1,29 @@
+from unittest import TestCase
+
+from netscout_teststream.command_actions.command_dialect import (
+    NEW_DIALECT,
+    OLD_DIALECT,
+    CommandDialect,
+    SoftwareVersion,
+)
+
+
+class TestSoftwareVersion(TestCase):
+    def test_parse(self):
+        version = SoftwareVersion.parse("04.05.02 (Build 1)")
+
+        self.assertEqual(version.version_tuple, (4, 5))
+        self.assertEqual(str(version), "04.05.02 (Build 1)")
+
+    def test_parse_major_only(self):
+        self.assertEqual(SoftwareVersion.parse(3).version_tuple, (3, 0))
+
+    def test_parse_error(self):
+        with self.assertRaisesRegex(Exception, "Can not parse Software Version"):
+            SoftwareVersion.parse("unknown")
+
+
+class TestCommandDialect(TestCase):
+    def test_for_version(self):
+        self.assertIs(CommandDialect.for_version(SoftwareVersion(3, 0)), NEW_DIALECT)
+        self.assertIs(CommandDialect.for_version(SoftwareVersion(2, 7)), OLD_DIALECT)
@@ -0,0 +1,77 @@
+import os
+from unittest import TestCase
+
+from netscout_teststream.command_actions.connection_table import (
+    ConnectionInfoDTO,
+    ConnectionTable,
+)
+
+DATA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    os.pardir,
+    os.pardir,
+    os.pardir,
+    "netscout_teststream",
+    "cli",
+    "simulator",
+    "data",
+)
+
+
+def read_data(file_name):
+    with open(os.path.join(DATA_PATH, file_name)) as f:
+        return f.read()
+
+
+class TestConnectionTable(TestCase):
+    def setUp(self):
+        self._table = ConnectionTable.from_output(
+            read_data("show_connection_switch_3912X_24.30.txt")
+        )
+
+    def test_from_output(self):
+        self.assertEqual(len(self._table), 25)
+        self.assertEqual(
+            list(self._table)[19],
+            ConnectionInfoDTO("01.01.17", "01.01.21", "Unknown"),
+        )
+
+    def test_connection_not_found(self):
+        table = ConnectionTable.from_output(
+            read_data("show_connection_switch_HS-3200.txt")
+        )
+        self.assertEqual(len(table), 0)
+
+    def test_port_connections(self):
+        self.assertEqual(
+            self._table.port_connections("01.01.03"),
+            [ConnectionInfoDTO("01.01.25", "01.01.03", "Duplex")],
+        )
+        self.assertEqual(self._table.port_connections("01.01.01"), [])
+
+    def test_mapping_table(self):
+        mapping_table = self._table.mapping_table()
+
+        self.assertEqual(mapping_table["01.01.17"], ["01.01.21"])
+        self.assertNotIn("01.01.21", mapping_table)
+        self.assertEqual(mapping_table["01.07.01"], ["01.06.01"])
+        self.assertEqual(mapping_table["01.06.01"], ["01.07.01"])
+
+    def test_is_simplex_connected(self):
+        self._table.add("01.02.01", "01.02.02", "Simplex")
+        self._table.add("01.02.01", "01.02.03", "Simplex")
+        self._table.add("01.02.04", "01.02.03", "Simplex")
+
+        self.assertTrue(self._table.is_simplex_connected("01.02.01", "01.02.02"))
+        self.assertFalse(self._table.is_simplex_connected("01.02.04", "01.02.02"))
+        self.assertFalse(self._table.is_simplex_connected("01.02.01", "01.02.03"))
+        self.assertFalse(self._table.is_simplex_connected("01.07.01", "01.06.01"))
+        self.assertFalse(self._table.is_simplex_connected("01.01.17", "01.01.21"))
+
+    def test_is_duplex_connected(self):
+        self.assertTrue(self._table.is_duplex_connected("01.07.01", "01.06.01"))
+        self.assertTrue(self._table.is_duplex_connected("01.06.01", "01.07.01"))
+        self.assertFalse(self._table.is_duplex_connected("01.07.01", "01.06.03"))
+
+        self._table.add("01.07.01", "01.02.01", "Simplex")
+        self.assertFalse(self._table.is_duplex_connected("01.07.01", "01.06.01"))
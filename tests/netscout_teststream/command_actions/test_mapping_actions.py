@@ -0,0 +1,229 @@
+import re
+import time
+from unittest import TestCase
+from unittest.mock import Mock
+
+import netscout_teststream.command_actions.actions_helper as helper
+from netscout_teststream.command_actions.command_dialect import (
+    CommandDialect,
+    SoftwareVersion,
+)
+from netscout_teststream.command_actions.mapping_actions import MappingActions
+
+
+class TestMappingActions(TestCase):
+    def setUp(self):
+        self._cli_service = Mock()
+        self._instance = MappingActions("3912X_24.30", self._cli_service)
+
+    def test_execute_batch_sends_single_burst(self):
+        self._cli_service.send_command.side_effect = [
+            "=> ",
+            "CONNECT -s -F PRTNUM 01.01.01 PRTNUM 01.01.02\n=> "
+            "CONNECT -s -F PRTNUM 01.01.01 PRTNUM 01.01.03\nNot compatible\n=> ",
+        ]
+        commands = [
+            self._instance.simplex_command("01.01.01", dst)
+            for dst in ("01.01.02", "01.01.03")
+        ]
+
+        errors = self._instance.execute_batch(commands)
+
+        self.assertEqual(self._cli_service.send_command.call_count, 2)
+        burst_call = self._cli_service.send_command.call_args_list[1]
+        self.assertEqual(
+            burst_call.args[0],
+            "CONNECT -s -F PRTNUM 01.01.01 PRTNUM 01.01.02\r"
+            "CONNECT -s -F PRTNUM 01.01.01 PRTNUM 01.01.03",
+        )
+        self.assertEqual(list(errors), [commands[1]])
+        self.assertEqual(
+            errors[commands[1]], r"Session returned 'Ports\Subports not compatible'"
+        )
+
+    def test_switch_selected_once_per_session(self):
+        self._cli_service.send_command.return_value = "=> "
+        self._instance.connect_simplex("01.01.01", "01.01.02")
+        self._instance.connect_duplex("01.01.01", "01.01.03")
+        commands = [c.args[0] for c in self._cli_service.send_command.call_args_list]
+        self.assertEqual(
+            commands,
+            [
+                'select switch "3912X_24.30"',
+                "CONNECT -s -F PRTNUM 01.01.01 PRTNUM 01.01.02",
+                "CONNECT -d -F PRTNUM 01.01.01 PRTNUM 01.01.03",
+            ],
+        )
+
+    def test_old_command_format(self):
+        instance = MappingActions(
+            "3912X_24.30",
+            self._cli_service,
+            CommandDialect.for_version(SoftwareVersion.parse("2.7")),
+        )
+        command = instance.disconnect_simplex_command("01.01.01", "01.01.02")
+        self.assertEqual(command.command, "disconnect simplex 01.01.02 force")
+
+
+class TestBurstPrompt(TestCase):
+    def test_waits_for_every_prompt(self):
+        prompt = helper.burst_prompt(2)
+        self.assertIsNone(re.search(prompt, "out 1\n=> out 2\n", re.DOTALL))
+        self.assertIsNone(re.search(prompt, "out 1\n=> ", re.DOTALL))
+        self.assertIsNotNone(re.search(prompt, "out 1\n=> out 2\n=> ", re.DOTALL))
+
+    def test_output_received_in_pieces(self):
+        commands_count = 30
+        output = "".join(
+            f"connect simplex prtnum 01.01.{i:02d} to 01.02.{i:02d}\r\n\r\n=> "
+            for i in range(commands_count)
+        )
+        prompt = helper.burst_prompt(commands_count)
+        received = ""
+        start_time = time.perf_counter()
+        for position in range(0, len(output) - 8, 8):
+            received = output[: position + 8]
+            self.assertIsNone(re.search(prompt, received, re.DOTALL))
+
+        self.assertIsNotNone(re.search(prompt, output, re.DOTALL))
+        self.assertLess(time.perf_counter() - start_time, 1)
+
+    def test_marker_in_command_output(self):
+        output = "cmd 1\r\nERROR: 01.01.01 => 01.01.02\r\n=> cmd 2\r\nout 2\r\n=> "
+
+        self.assertIsNone(re.search(helper.burst_prompt(3), output, re.DOTALL))
+        self.assertIsNotNone(re.search(helper.burst_prompt(2), output, re.DOTALL))
+        self.assertEqual(
+            helper.split_burst_output(output, 2),
+            ["cmd 1\r\nERROR: 01.01.01 => 01.01.02\r", " cmd 2\r\nout 2\r"],
+        )
+
+
+class TestPortConnectionTable(TestCase):
+    HEADER = (
+        "GEO addr  Name (>20 ..)            Rx Pwr(dBm)  Conn Type  GEO addr  "
+        "Name (>20 ..)            Rx Pwr(dBm)  Speed    Protocol\n"
+        "--------  -----------------------  -----------  ---------  --------  "
+        "-----------------------  -----------  -------  --------\n"
+    )
+    ROW = (
+        "01.07.01  24.30 01.07.01           Not Present  Duplex     01.06.01  "
+        "24.30 01.06.01           Not Present  10000    Ethernet\n"
+    )
+
+    def setUp(self):
+        self._cli_service = Mock()
+        self._cli_service.session.selected_switch = "3912X_24.30"
+        self._instance = MappingActions("3912X_24.30", self._cli_service)
+
+    def test_single_burst_for_all_ports(self):
+        self._cli_service.send_command.return_value = (
+            f"{self.HEADER}{self.ROW}=> {self.HEADER}{self.ROW}=> "
+        )
+
+        table = self._instance.port_connection_table(["01.06.01", "01.07.01"])
+
+        self._cli_service.send_command.assert_called_once()
+        self.assertEqual(
+            self._cli_service.send_command.call_args.args[0],
+            "show conn prtnum 01.06.01\rshow conn prtnum 01.07.01",
+        )
+        self.assertEqual(len(table), 1)
+        self.assertEqual(table.mapping_table()["01.06.01"], ["01.07.01"])
+
+    def test_no_ports(self):
+        self.assertEqual(len(self._instance.port_connection_table([])), 0)
+        self._cli_service.send_command.assert_not_called()
+
+
+class TestMappingTransaction(TestCase):
+    NOT_COMPATIBLE = "Not compatible"
+
+    def setUp(self):
+        self._cli_service = Mock()
+        self._cli_service.session.selected_switch = "3912X_24.30"
+        self._cli_service.send_command.side_effect = self._send_command
+        self._instance = MappingActions("3912X_24.30", self._cli_service)
+        self.bursts = []
+        self.failing = set()
+
+    def _send_command(self, command, expected_string=None, **kwargs):
+        commands = command.split(helper.BURST_SEPARATOR)
+        self.bursts.append(commands)
+        return "".join(
+            f"{self.NOT_COMPATIBLE if command in self.failing else ''}\n=> "
+            for command in commands
+        )
+
+    def _transaction(self, dst_ports):
+        transaction = self._instance.transaction()
+        for dst_port in dst_ports:
+            transaction.add(
+                self._instance.simplex_command("01.01.01", dst_port),
+                [self._instance.disconnect_simplex_command("01.01.01", dst_port)],
+            )
+        return transaction
+
+    def test_commit(self):
+        result = self._transaction(["01.01.02", "01.01.03"]).commit()
+
+        self.assertTrue(result.succeeded)
+        self.assertEqual(result.applied, ["01.01.02", "01.01.03"])
+        self.assertEqual(len(self.bursts), 1)
+
+    def test_rollback_in_reverse_order(self):
+        self.failing.add("CONNECT -s -F PRTNUM 01.01.01 PRTNUM 01.01.03")
+
+        result = self._transaction(["01.01.02", "01.01.03", "01.01.04"]).commit()
+
+        self.assertFalse(result.succeeded)
+        self.assertEqual(list(result.failed), ["01.01.03"])
+        self.assertEqual(result.rolled_back, ["01.01.02", "01.01.04"])
+        self.assertEqual(result.applied, [])
+        self.assertEqual(
+            self.bursts[1],
+            [
+                "DISCONNECT -s -F PRTNUM 01.01.01 PRTNUM 01.01.04",
+                "DISCONNECT -s -F PRTNUM 01.01.01 PRTNUM 01.01.02",
+            ],
+        )
+        self.assertRegex(
+            result.error_message(),
+            r"^01\.01\.03: .+\. Rolled back ports: 01\.01\.02, 01\.01\.04$",
+        )
+
+    def test_rollback_failed(self):
+        self.failing.update(
+            [
+                "CONNECT -s -F PRTNUM 01.01.01 PRTNUM 01.01.03",
+                "DISCONNECT -s -F PRTNUM 01.01.01 PRTNUM 01.01.02",
+            ]
+        )
+
+        result = self._transaction(["01.01.02", "01.01.03"]).commit()
+
+        self.assertEqual(result.applied, ["01.01.02"])
+        self.assertEqual(list(result.rollback_failed), ["01.01.02"])
+        self.assertRegex(result.error_message(), r"Rollback failed: 01\.01\.02: ")
+
+    def test_failed_step_aborts_transaction(self):
+        transaction = self._transaction(["01.01.02"])
+        transaction.fail("01.01.03", "Connection type is not supported")
+
+        result = transaction.commit()
+
+        self.assertEqual(self.bursts, [])
+        self.assertEqual(
+            result.failed, {"01.01.03": "Connection type is not supported"}
+        )
+
+    def test_without_rollback(self):
+        self.failing.add("CONNECT -s -F PRTNUM 01.01.01 PRTNUM 01.01.03")
+        transaction = self._transaction(["01.01.02", "01.01.03"])
+        transaction.fail("01.01.04", "Connection type is not supported")
+
+        result = transaction.commit(rollback=False)
+
+        self.assertEqual(len(self.bursts), 1)
+        self.assertEqual(result.applied, ["01.01.02"])
+        self.assertEqual(list(result.failed), ["01.01.04", "01.01.03"])
@@ -0,0 +1,45 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from netscout_teststream.model.netscout_blade import NetscoutBlade
+
+
+class TestNetscoutBlade(TestCase):
+    def setUp(self):
+        models_patcher = patch.object(
+            NetscoutBlade, "_models", dict(NetscoutBlade.REGISTERED_MODELS)
+        )
+        resolved_patcher = patch.object(NetscoutBlade, "_resolved_models", {})
+        models_patcher.start()
+        resolved_patcher.start()
+        self.addCleanup(models_patcher.stop)
+        self.addCleanup(resolved_patcher.stop)
+
+    def test_registered_models(self):
+        for model_name, model in (
+            ("S-Blade Pro", "S-Blade-Pro"),
+            ("s_blade_pro", "S-Blade-Pro"),
+            ("S-Blade 64", "S-Blade 64"),
+            ("T100L-Blade", "T100L-Blade"),
+            (" HS Bank ", "Hs-Bank"),
+        ):
+            self.assertEqual(NetscoutBlade("1", model_name).model_name, model)
+
+    def test_unknown_model_is_generic(self):
+        blade = NetscoutBlade("1", "X-Blade")
+
+        self.assertEqual(blade.model_name, NetscoutBlade.MODEL_NAME)
+
+    def test_resolved_model_is_kept(self):
+        NetscoutBlade("1", "T-Blade")
+
+        with patch.object(NetscoutBlade, "normalize_name") as normalize_name:
+            self.assertEqual(NetscoutBlade("2", "T-Blade").model_name, "T-Blade")
+        normalize_name.assert_not_called()
+
+    def test_register_models(self):
+        NetscoutBlade("1", "P Blade")
+        NetscoutBlade.register_models({"P-Blade": "P-Blade"})
+
+        self.assertEqual(NetscoutBlade("1", "P Blade").model_name, "P-Blade")
+        self.assertEqual(NetscoutBlade("2", "S-Blade").model_name, "S-Blade")
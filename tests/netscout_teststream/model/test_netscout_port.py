@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+from netscout_teststream.model.netscout_port import NetscoutPort
+
+
+def attribute_values(port):
+    return [(attribute.name, attribute.value) for attribute in port.attributes]
+
+
+class TestNetscoutPort(TestCase):
+    def test_attributes(self):
+        port = NetscoutPort("01", "Tap 1", "90")
+
+        self.assertEqual(
+            attribute_values(port),
+            [
+                ("Protocol", "69"),
+                ("Protocol Type", "2"),
+                ("Speed", "5"),
+                ("Model Name", "Tap 1"),
+                ("Protocol Value", "90"),
+            ],
+        )
+
+    def test_unknown_protocol(self):
+        port = NetscoutPort("01")
+
+        self.assertEqual(
+            attribute_values(port),
+            [("Protocol", "2"), ("Protocol Type", "0"), ("Speed", "1")],
+        )
+
+    def test_attributes_shared(self):
+        tx_port = NetscoutPort("01-TX", "Tap 1", "90")
+        rx_port = NetscoutPort("01-RX", "Tap 1", "90")
+        other_port = NetscoutPort("02", "Tap 2", "90")
+
+        self.assertIsNot(tx_port.attributes, rx_port.attributes)
+        for tx_attribute, rx_attribute in zip(tx_port.attributes, rx_port.attributes):
+            self.assertIs(tx_attribute, rx_attribute)
+        self.assertIs(tx_port.attributes[0], other_port.attributes[0])
+        self.assertIsNot(tx_port.attributes[3], other_port.attributes[3])
@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+from netscout_teststream.address_translator import AddressTranslator
+from netscout_teststream.model.netscout_blade import NetscoutBlade
+from netscout_teststream.model.netscout_chassis import NetscoutChassis
+from netscout_teststream.model.netscout_port import NetscoutPort
+
+
+class TestAddressTranslator(TestCase):
+    ADDRESS = "192.168.42.240?teststream=3912X_24.30"
+
+    def setUp(self):
+        self._translator = AddressTranslator()
+        chassis = NetscoutChassis(1, self.ADDRESS)
+        self._blade = NetscoutBlade(7, "S-Blade")
+        self._blade.set_parent_resource(chassis)
+
+    def _port(self, port_id):
+        port = NetscoutPort(port_id)
+        port.set_parent_resource(self._blade)
+        return port
+
+    def test_to_switch(self):
+        self.assertEqual(
+            self._translator.to_switch(f"{self.ADDRESS}/7/1"), ("01.07.01", "")
+        )
+        self.assertEqual(
+            self._translator.to_switch(f"{self.ADDRESS}/12/21-Rx"), ("01.12.21", "Rx")
+        )
+
+    def test_incorrect_address(self):
+        with self.assertRaisesRegex(Exception, "Incorrect port address 7/1"):
+            self._translator.to_switch("7/1")
+
+    def test_registered_ports(self):
+        tx_port, rx_port = self._port("01-TX"), self._port("01-RX")
+        self._translator.register_ports(self.ADDRESS, {"01.07.01": (tx_port, rx_port)})
+        self._translator._parse = None
+
+        self.assertEqual(
+            self._translator.to_switch(f"{self.ADDRESS}/7/01-RX"), ("01.07.01", "RX")
+        )
+
+    def test_register_replaces_ports_of_switch(self):
+        other_address = "10.0.0.1?teststream=3903"
+        self._translator.register_ports(self.ADDRESS, {"01.07.01": (self._port("01"),)})
+        self._translator.register_ports(other_address, {})
+        self._translator.register_ports(self.ADDRESS, {"01.07.02": (self._port("02"),)})
+
+        self.assertEqual(
+            set(self._translator._switch_ports),
+            {f"{self.ADDRESS}/7/02"},
+        )
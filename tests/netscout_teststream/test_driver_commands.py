@@ -1,16 +1,503 @@
+import os
+import threading
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock, patch
 
 from cloudshell.layer_one.core.driver_commands_interface import DriverCommandsInterface
 
+import netscout_teststream.command_actions.actions_helper as helper
+from netscout_teststream.cli.simulator.cli_simulator import CLISimulator
+from netscout_teststream.cli.simulator.simulated_switch import SimulatedSwitch
+from netscout_teststream.command_actions.autoload_actions import PortInfoDTO
+from netscout_teststream.command_actions.command_dialect import NEW_DIALECT
 from netscout_teststream.driver_commands import DriverCommands
+from netscout_teststream.model.netscout_blade import NetscoutBlade
+from netscout_teststream.model.netscout_chassis import NetscoutChassis
+from netscout_teststream.switch_registry import SwitchRegistry
+from netscout_teststream.topology_cache import TopologyCache
+
+DATA_PATH = os.path.join(
+    os.path.dirname(__file__),
+    os.pardir,
+    os.pardir,
+    "netscout_teststream",
+    "cli",
+    "simulator",
+    "data",
+)
+
+
+def read_data(file_name):
+    with open(os.path.join(DATA_PATH, file_name)) as f:
+        return f.read()
+
+
+def runtime_config(values=None):
+    """Runtime configuration returning the values, defaults for other keys."""
+    values = values or {}
+    config = Mock()
+    config.read_key.side_effect = lambda key, default=None: values.get(key, default)
+    return config
 
 
 class TestDriverCommands(TestCase):
     def setUp(self):
         self._logger = Mock()
-        self._runtime_config_instance = Mock()
+        self._runtime_config_instance = runtime_config()
         self._instance = DriverCommands(self._runtime_config_instance)
 
     def test_implementing_interface(self):
         self.assertIsInstance(self._instance, DriverCommandsInterface)
+
+
+class TestDriverCommandsMapClear(TestCase):
+    SWITCH_NAME = "3912X_24.30"
+
+    def setUp(self):
+        self._instance = DriverCommands(runtime_config())
+        self._cli_service = Mock()
+        self._cli_service.send_command.side_effect = self._send_command
+        self._cli_handler = MagicMock()
+        self._cli_handler.default_mode_service.return_value.__enter__.return_value = (
+            self._cli_service
+        )
+        self._instance._switches = SwitchRegistry(lambda: self._cli_handler)
+        self._instance._switches.register(
+            "192.168.42.240", self.SWITCH_NAME, "192.168.42.240", "user", "password"
+        )
+        self.bursts = []
+
+    def _send_command(self, command, expected_string=None, **kwargs):
+        if command == f'show connection switch "{self.SWITCH_NAME}"':
+            return read_data(f"show_connection_switch_{self.SWITCH_NAME}.txt")
+        if command == "show status":
+            return read_data("show_status.txt")
+        if expected_string:
+            commands = command.split(helper.BURST_SEPARATOR)
+            self.bursts.append(commands)
+            return "\n=> " * len(commands)
+        return "=> "
+
+    def test_map_clear_uses_single_session(self):
+        self._instance.map_clear(
+            ["192.168.42.240/7/1", "192.168.42.240/6/1", "192.168.42.240/7/3"]
+        )
+
+        self._cli_handler.default_mode_service.assert_called_once_with()
+        self.assertEqual(
+            self.bursts,
+            [
+                [
+                    "DISCONNECT -d -F PRTNUM 01.07.01 PRTNUM 01.06.01",
+                    "DISCONNECT -d -F PRTNUM 01.07.03 PRTNUM 01.06.03",
+                ]
+            ],
+        )
+
+    def test_map_clear_to_filters_destinations(self):
+        self._instance.map_clear_to("192.168.42.240/6/1", ["192.168.42.240/7/1"])
+
+        self.assertEqual(
+            self.bursts, [["DISCONNECT -d -F PRTNUM 01.07.01 PRTNUM 01.06.01"]]
+        )
+
+    def test_map_clear_not_connected_port(self):
+        self._instance.map_clear(["192.168.42.240/1/1"])
+
+        self.assertEqual(self.bursts, [])
+
+
+class TestDriverCommandsValidation(TestCase):
+    ADDRESS = "192.168.42.240"
+
+    def _driver(self, port_mode):
+        driver = DriverCommands(runtime_config({"DRIVER.PORT_MODE": port_mode}))
+        self._cli_handler = MagicMock()
+        driver._switches = SwitchRegistry(lambda: self._cli_handler)
+        driver._switches.register(
+            self.ADDRESS, "3912X_24.30", self.ADDRESS, "user", "password"
+        )
+        return driver
+
+    def test_physical_subports_validated_before_session(self):
+        driver = self._driver("PHYSICAL")
+
+        for map_command in (driver.map_uni, driver.map_clear_to):
+            with self.assertRaises(Exception) as context:
+                map_command(
+                    f"{self.ADDRESS}/1/1-Tx",
+                    [
+                        f"{self.ADDRESS}/1/2-Rx",
+                        f"{self.ADDRESS}/1/3-Tx",
+                        f"{self.ADDRESS}/1/4",
+                    ],
+                )
+            self.assertEqual(
+                str(context.exception),
+                f"{self.ADDRESS}/1/3-Tx: Transmitter sub-port can't be used as "
+                f"a destination, {self.ADDRESS}/1/4: Sub-port is not specified",
+            )
+        self._cli_handler.default_mode_service.assert_not_called()
+
+    def test_physical_source_validated(self):
+        driver = self._driver("PHYSICAL")
+
+        with self.assertRaisesRegex(Exception, "Receiver sub-port"):
+            driver.map_uni(f"{self.ADDRESS}/1/1-Rx", [f"{self.ADDRESS}/1/2-Rx"])
+        self._cli_handler.default_mode_service.assert_not_called()
+
+    def test_incorrect_address_validated_before_session(self):
+        driver = self._driver("LOGICAL")
+
+        with self.assertRaisesRegex(Exception, "Incorrect port address 1/2"):
+            driver.map_uni(f"{self.ADDRESS}/1/1", ["1/2"])
+        self._cli_handler.default_mode_service.assert_not_called()
+
+    def test_convert_port_address(self):
+        driver = self._driver("PHYSICAL")
+
+        self.assertEqual(
+            driver._parse_port_address(f"{self.ADDRESS}/2/7-Rx"), ("01.02.07", "Rx")
+        )
+        self.assertEqual(
+            driver._convert_port_address(f"{self.ADDRESS}/12/7"), "01.12.07"
+        )
+
+
+class TestDriverCommandsIdempotentMapping(TestCase):
+    SWITCH_NAME = "3912X_24.30"
+    ADDRESS = "192.168.42.240"
+
+    def setUp(self):
+        self._instance = DriverCommands(
+            runtime_config({"DRIVER.IDEMPOTENT_MAPPING": True})
+        )
+        self._switch = SimulatedSwitch.from_data(DATA_PATH, self.SWITCH_NAME)
+        self._switch.connect("01.02.01", "01.02.02")
+        self._cli_service = Mock()
+        self._cli_service.send_command.side_effect = self._send_command
+        self._cli_handler = MagicMock()
+        self._cli_handler.default_mode_service.return_value.__enter__.return_value = (
+            self._cli_service
+        )
+        self._instance._switches = SwitchRegistry(lambda: self._cli_handler)
+        self._instance._switches.register(
+            self.ADDRESS, self.SWITCH_NAME, self.ADDRESS, "user", "password"
+        )
+        self.commands = []
+        self.failing = set()
+
+    def _answer(self, command):
+        if command.startswith("show conn prtnum "):
+            return self._switch.connection_output(command.split()[-1])
+        if command == f'show connection switch "{self.SWITCH_NAME}"':
+            return self._switch.connection_output()
+        if command == "show status":
+            return read_data("show_status.txt")
+        self.commands.append(command)
+        return "Not compatible" if command in self.failing else ""
+
+    def _send_command(self, command, expected_string=None, **kwargs):
+        if expected_string:
+            return "".join(
+                f"{self._answer(burst_command)}\n{helper.PROMPT_MARKER} "
+                for burst_command in command.split(helper.BURST_SEPARATOR)
+            )
+        return self._answer(command)
+
+    def test_map_uni_skips_connected_ports(self):
+        self._instance.map_uni(
+            f"{self.ADDRESS}/2/1", [f"{self.ADDRESS}/2/2", f"{self.ADDRESS}/2/3"]
+        )
+
+        self.assertEqual(
+            self.commands,
+            [
+                f'select switch "{self.SWITCH_NAME}"',
+                "CONNECT -s -F PRTNUM 01.02.01 PRTNUM 01.02.03",
+            ],
+        )
+
+    def test_map_uni_all_connected(self):
+        self._instance.map_uni(f"{self.ADDRESS}/2/1", [f"{self.ADDRESS}/2/2"])
+
+        self.assertEqual(self.commands, [f'select switch "{self.SWITCH_NAME}"'])
+
+    def test_map_uni_replaces_other_source(self):
+        self._instance.map_uni(f"{self.ADDRESS}/2/4", [f"{self.ADDRESS}/2/2"])
+
+        self.assertIn("CONNECT -s -F PRTNUM 01.02.04 PRTNUM 01.02.02", self.commands)
+
+    def test_map_uni_rollback_restores_replaced_connections(self):
+        self.failing.add("CONNECT -s -F PRTNUM 01.02.04 PRTNUM 01.02.03")
+
+        with self.assertRaisesRegex(
+            Exception, "^01.02.03: .+Rolled back ports: 01.02.02"
+        ):
+            self._instance.map_uni(
+                f"{self.ADDRESS}/2/4", [f"{self.ADDRESS}/2/2", f"{self.ADDRESS}/2/3"]
+            )
+        self.assertEqual(
+            self.commands[-2:],
+            [
+                "DISCONNECT -s -F PRTNUM 01.02.04 PRTNUM 01.02.02",
+                "CONNECT -s -F PRTNUM 01.02.01 PRTNUM 01.02.02",
+            ],
+        )
+
+    def test_map_clear_to_failure_names_port(self):
+        self.failing.add("DISCONNECT -s -F PRTNUM 01.02.01 PRTNUM 01.02.02")
+
+        with self.assertRaisesRegex(Exception, "^01.02.02: "):
+            self._instance.map_clear_to(f"{self.ADDRESS}/2/1", [f"{self.ADDRESS}/2/2"])
+
+    def test_map_bidi_skips_connected_ports(self):
+        self._instance.map_bidi(f"{self.ADDRESS}/6/1", f"{self.ADDRESS}/7/1")
+        self.assertEqual(self.commands, [f'select switch "{self.SWITCH_NAME}"'])
+
+        self._instance.map_bidi(f"{self.ADDRESS}/6/1", f"{self.ADDRESS}/7/3")
+        self.assertIn("CONNECT -d -F PRTNUM 01.06.01 PRTNUM 01.07.03", self.commands)
+
+
+class TestDriverCommandsAutoload(TestCase):
+    ADDRESS = "192.168.42.240?teststream=3912X_24.30"
+    CONFIG = {}
+
+    def setUp(self):
+        self._instance = DriverCommands(runtime_config(self.CONFIG))
+        self._simulator = CLISimulator(DATA_PATH, Mock())
+        self._send_command = Mock(
+            side_effect=self._simulator._cli_service._test_cli.send_command
+        )
+        self._simulator._cli_service._test_cli.send_command = self._send_command
+        self._instance._switches = SwitchRegistry(lambda: self._simulator, 60)
+        self._instance.login(self.ADDRESS, "user", "password")
+        self._send_command.reset_mock()
+
+    def _sent_commands(self):
+        return [call.args[0] for call in self._send_command.call_args_list]
+
+    def _ports(self, response):
+        (chassis,) = response.resource_info_list
+        return {
+            port.address: port
+            for blade in chassis.child_resources.values()
+            for port in blade.child_resources.values()
+        }
+
+    def test_autoload(self):
+        ports = self._ports(self._instance.get_resource_description(self.ADDRESS))
+
+        self.assertEqual(len(ports), 537)
+        self.assertIs(
+            ports[f"{self.ADDRESS}/6/01"].mapping, ports[f"{self.ADDRESS}/7/01"]
+        )
+
+    def test_autoload_registers_port_addresses(self):
+        self._instance.get_resource_description(self.ADDRESS)
+
+        self.assertEqual(
+            self._instance._addresses._switch_ports[f"{self.ADDRESS}/6/01"],
+            ("01.06.01", ""),
+        )
+
+    def test_cached_topology(self):
+        first = self._instance.get_resource_description(self.ADDRESS)
+        commands_count = self._send_command.call_count
+        second = self._instance.get_resource_description(self.ADDRESS)
+
+        self.assertEqual(self._send_command.call_count, commands_count)
+        self.assertEqual(
+            list(first.resource_info_list), list(second.resource_info_list)
+        )
+
+    def test_mapping_refreshes_topology_incrementally(self):
+        ports = self._ports(self._instance.get_resource_description(self.ADDRESS))
+
+        self._instance.map_uni(f"{self.ADDRESS}/2/1", [f"{self.ADDRESS}/2/2"])
+        self._send_command.reset_mock()
+        refreshed = self._ports(self._instance.get_resource_description(self.ADDRESS))
+
+        self._send_command.assert_called()
+        self.assertEqual(refreshed.keys(), ports.keys())
+        for address, port in refreshed.items():
+            self.assertIs(port, ports[address])
+
+    def test_state_id_cached(self):
+        state_id = self._instance.get_state_id()._state_id
+        commands_count = self._send_command.call_count
+
+        self.assertEqual(commands_count, 1)
+        self.assertEqual(self._instance.get_state_id()._state_id, state_id)
+        self.assertEqual(self._send_command.call_count, commands_count)
+
+    def test_state_id_after_autoload(self):
+        self._instance.get_resource_description(self.ADDRESS)
+        commands_count = self._send_command.call_count
+
+        self._instance.set_state_id("42")
+
+        self.assertEqual(self._instance.get_state_id()._state_id, "42")
+        self.assertEqual(self._send_command.call_count, commands_count)
+
+    def test_state_id_checked_after_mapping(self):
+        self._instance.set_state_id("42")
+        self._instance.map_uni(f"{self.ADDRESS}/2/1", [f"{self.ADDRESS}/2/2"])
+        self._send_command.reset_mock()
+
+        self.assertEqual(self._instance.get_state_id()._state_id, "42")
+        self._send_command.assert_called_once()
+
+    def test_software_version_probed_at_login(self):
+        switch = self._instance._switches.current
+
+        self.assertEqual(switch.software_version.version_tuple[0], 4)
+        self.assertIs(switch.dialect, NEW_DIALECT)
+
+        self._instance.map_uni(f"{self.ADDRESS}/2/1", [f"{self.ADDRESS}/2/2"])
+        self.assertNotIn("show status", self._sent_commands())
+
+
+class TestDriverCommandsRawinfoMappings(TestDriverCommandsAutoload):
+    CONFIG = {
+        "DRIVER.RAWINFO_MAPPINGS": True,
+        "DRIVER.RAWINFO_MAPPINGS_MAX_PORTS": 64,
+    }
+
+    def test_autoload(self):
+        self._instance.get_resource_description(self.ADDRESS)
+
+        commands = self._sent_commands()
+        self.assertNotIn('show connection switch "3912X_24.30"', commands)
+        self.assertIn("show conn prtnum 01.07.01", commands[-1].split("\r"))
+
+    def test_too_many_connected_ports(self):
+        self._instance._rawinfo_mappings_max_ports = 8
+        self._instance.get_resource_description(self.ADDRESS)
+
+        self.assertIn('show connection switch "3912X_24.30"', self._sent_commands())
+
+
+class TestDriverCommandsParallelAutoload(TestDriverCommandsAutoload):
+    CONFIG = {"DRIVER.PARALLEL_AUTOLOAD": True}
+
+    def test_queries_on_separate_sessions(self):
+        # every query waits for the other two, they must be in flight together
+        barrier = threading.Barrier(3, timeout=5)
+        send_command = self._send_command.side_effect
+
+        def wait_for_queries(command, *args, **kwargs):
+            barrier.wait()
+            return send_command(command, *args, **kwargs)
+
+        self._send_command.side_effect = wait_for_queries
+        cli_handler = self._instance._switches.current.cli_handler
+        cli_handler.default_mode_service = Mock(
+            side_effect=self._simulator.default_mode_service
+        )
+        ports = self._ports(self._instance.get_resource_description(self.ADDRESS))
+
+        self.assertEqual(len(ports), 537)
+        self.assertEqual(cli_handler.default_mode_service.call_count, 3)
+        self.assertEqual(
+            set(self._sent_commands()),
+            {
+                'show information switch "3912X_24.30"',
+                'show port rawinfo * switch "3912X_24.30"',
+                'show connection switch "3912X_24.30"',
+            },
+        )
+
+
+class TestDriverCommandsParallelRawinfoMappings(TestDriverCommandsRawinfoMappings):
+    CONFIG = dict(
+        TestDriverCommandsRawinfoMappings.CONFIG, **{"DRIVER.PARALLEL_AUTOLOAD": True}
+    )
+
+    def test_autoload(self):
+        self._instance.get_resource_description(self.ADDRESS)
+
+        commands = self._sent_commands()
+        self.assertNotIn('show connection switch "3912X_24.30"', commands)
+        self.assertIn(
+            "show conn prtnum 01.07.01",
+            [line for command in commands for line in command.split("\r")],
+        )
+
+
+class TestDriverCommandsBladeModels(TestCase):
+    def setUp(self):
+        patcher = patch.multiple(
+            NetscoutBlade,
+            _models=dict(NetscoutBlade.REGISTERED_MODELS),
+            _resolved_models={},
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self._driver = DriverCommands(
+            runtime_config({"DRIVER.BLADE_MODELS": {"P-Blade": "P-Blade"}})
+        )
+
+    def test_blade_models_registered_on_autoload(self):
+        self.assertNotIn("p blade", NetscoutBlade._models)
+        chassis = NetscoutChassis(1, "192.168.42.240")
+
+        blades_dict = self._driver._build_blades(
+            TopologyCache(), 1, chassis, {1: "P-Blade"}
+        )
+
+        self.assertEqual(blades_dict[(1, 1)].model_name, "P-Blade")
+        self.assertEqual(NetscoutBlade._models["p blade"], "P-Blade")
+
+
+class TestDriverCommandsPortIndex(TestCase):
+    ADDRESS = "192.168.42.240?teststream=3903X_25.28"
+
+    def _driver(self, port_mode="LOGICAL"):
+        return DriverCommands(runtime_config({"DRIVER.PORT_MODE": port_mode}))
+
+    def _port_index(self, driver):
+        blade = NetscoutBlade(1, "S-Blade")
+        ports_table = {
+            address: PortInfoDTO(f"Port {address}", address, "90")
+            for address in ("01.01.01", "01.01.02", "01.02.01")
+        }
+        return driver._build_ports(TopologyCache(), {(1, 1): blade}, ports_table)
+
+    def test_logical_port_index(self):
+        driver = self._driver()
+        port_index = self._port_index(driver)
+
+        self.assertEqual(list(port_index), ["01.01.01", "01.01.02"])
+        (src_port,) = port_index["01.01.01"]
+        (dst_port,) = port_index["01.01.02"]
+        skipped = driver._build_mappings(
+            {"01.01.01": ["01.01.02", "01.01.09"], "01.01.08": ["01.01.01"]},
+            port_index,
+        )
+
+        self.assertEqual(skipped, 2)
+        self.assertIs(dst_port.mapping, src_port)
+        self.assertIsNone(src_port.mapping)
+
+    def test_physical_port_index(self):
+        driver = self._driver("PHYSICAL")
+        port_index = self._port_index(driver)
+
+        src_tx, src_rx = port_index["01.01.01"]
+        dst_tx, dst_rx = port_index["01.01.02"]
+        self.assertEqual((src_tx.resource_id, src_rx.resource_id), ("01-TX", "01-RX"))
+        skipped = driver._build_mappings({"01.01.01": ["01.01.02"]}, port_index)
+
+        self.assertEqual(skipped, 0)
+        self.assertIs(dst_rx.mapping, src_tx)
+        self.assertIsNone(dst_tx.mapping)
+
+    def test_autoload_skips_connections_of_not_used_ports(self):
+        driver = self._driver()
+        driver._switches = SwitchRegistry(lambda: CLISimulator(DATA_PATH, Mock()), 60)
+        driver.login(self.ADDRESS, "user", "password")
+
+        (chassis,) = driver.get_resource_description(self.ADDRESS).resource_info_list
+
+        self.assertTrue(chassis.child_resources)
@@ -0,0 +1,133 @@
+import io
+import logging
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import Mock
+
+from netscout_teststream.log_queue import LogQueue, QueuedXMLLogger, cap_payload
+
+AUTOLOAD_REQUEST = (
+    '<Commands><Command CommandName="GetResourceDescription" CommandId="1"/>'
+    "</Commands>"
+)
+MAPPING_REQUEST = '<Commands><Command CommandName="MapUni" CommandId="2"/></Commands>'
+
+
+class TestCapPayload(TestCase):
+    def test_not_limited(self):
+        self.assertEqual(cap_payload("x" * 100, 0), "x" * 100)
+
+    def test_short_payload(self):
+        self.assertEqual(cap_payload("x" * 10, 10), "x" * 10)
+
+    def test_truncated(self):
+        self.assertEqual(
+            cap_payload("x" * 15, 10), "xxxxxxxxxx... [5 characters truncated]"
+        )
+
+
+class TestQueuedLogHandler(TestCase):
+    def setUp(self):
+        self._stream = io.StringIO()
+        self._stream_handler = logging.StreamHandler(self._stream)
+        self._stream_handler.setFormatter(
+            logging.Formatter("%(levelname)s %(message)s")
+        )
+        self._stream_handler.setLevel(logging.INFO)
+        self._other_handler = Mock(level=logging.DEBUG)
+        self._logger = logging.getLogger("tests.log_queue")
+        self._logger.propagate = False
+        self._logger.setLevel(logging.DEBUG)
+        self._logger.handlers = [self._stream_handler, self._other_handler]
+        self.addCleanup(setattr, self._logger, "handlers", [])
+        self._log_queue = LogQueue(max_payload=8)
+
+    def test_records_written_by_queue(self):
+        handler = self._log_queue.attach(self._logger)
+        self.assertEqual(self._logger.handlers, [handler])
+
+        self._logger.info("Output %s", "0123456789")
+        self._logger.debug("Debug output")
+        self.assertEqual(self._stream.getvalue(), "")
+        self._log_queue.start()
+        self._log_queue.stop()
+
+        self.assertEqual(
+            self._stream.getvalue(), "INFO Output 0... [9 characters truncated]\n"
+        )
+        self.assertEqual(self._other_handler.handle.call_count, 2)
+
+    def test_caller_record_not_changed(self):
+        self._log_queue.attach(self._logger)
+        record = self._logger.makeRecord(
+            self._logger.name, logging.INFO, __file__, 1, "Output %s", ("01234",), None
+        )
+
+        self._logger.handle(record)
+        self._log_queue.stop()
+        self._log_queue._run()
+
+        self.assertEqual((record.msg, record.args), ("Output %s", ("01234",)))
+        self.assertEqual(
+            self._stream.getvalue(), "INFO Output 0... [4 characters truncated]\n"
+        )
+
+    def test_filtered_records_not_queued(self):
+        self._other_handler.filter.return_value = False
+        self._log_queue.attach(self._logger)
+
+        self._logger.debug("Debug output")
+        self._log_queue.stop()
+        self._log_queue._run()
+
+        self._other_handler.handle.assert_not_called()
+        self.assertEqual(self._stream.getvalue(), "")
+
+
+class TestQueuedXMLLogger(TestCase):
+    def setUp(self):
+        self._path = os.path.join(tempfile.mkdtemp(), "driver.xml")
+        self._log_queue = LogQueue(max_payload=64)
+
+    def _xml_log(self):
+        self._log_queue.stop()
+        self._log_queue._run()
+        with open(self._path) as f:
+            return f.read().splitlines()
+
+    def test_messages_written_masked_and_capped(self):
+        xml_logger = QueuedXMLLogger(self._path, self._log_queue)
+
+        xml_logger.info("<Password>secret</Password>")
+        xml_logger.info("x" * 70)
+
+        self.assertEqual(
+            self._xml_log(),
+            [
+                "<Password>*******</Password>",
+                f"{'x' * 64}... [6 characters truncated]",
+            ],
+        )
+
+    def test_autoload_responses_sampled(self):
+        xml_logger = QueuedXMLLogger(self._path, self._log_queue, 2)
+
+        for request, response in [
+            (AUTOLOAD_REQUEST, "<Response>1</Response>"),
+            (AUTOLOAD_REQUEST, "<Response>2</Response>"),
+            (MAPPING_REQUEST, "<Response>3</Response>"),
+            (AUTOLOAD_REQUEST, "<Response>4</Response>"),
+        ]:
+            xml_logger.info(request)
+            xml_logger.info(response)
+
+        self.assertEqual(
+            self._xml_log()[1::2],
+            [
+                "<Response>1</Response>",
+                "Autoload response of 22 characters is not sampled",
+                "<Response>3</Response>",
+                "<Response>4</Response>",
+            ],
+        )
@@ -0,0 +1,91 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import Mock
+
+from cloudshell.cli.command_template.command_template import CommandTemplate
+
+from netscout_teststream.metrics import (
+    METRICS,
+    CommandMetrics,
+    Histogram,
+    MetricsExporter,
+    TimedCommandTemplateExecutor,
+    timed_send_command,
+)
+
+
+class TestHistogram(TestCase):
+    def test_cumulative_buckets(self):
+        histogram = Histogram((0.1, 1))
+        for value in (0.05, 0.1, 0.5, 2):
+            histogram.observe(value)
+        self.assertEqual(
+            histogram.lines("latency", 'template="t"'),
+            [
+                'latency_bucket{template="t",le="0.1"} 2',
+                'latency_bucket{template="t",le="1"} 3',
+                'latency_bucket{template="t",le="+Inf"} 4',
+                'latency_sum{template="t"} 2.65',
+                'latency_count{template="t"} 4',
+            ],
+        )
+
+
+class TestCommandMetrics(TestCase):
+    def setUp(self):
+        METRICS.reset()
+
+    def test_prometheus_text(self):
+        metrics = CommandMetrics()
+        metrics.observe_command('show switch "{name}"', 0.2, 100)
+        metrics.observe_checkout(0.01, reused=True)
+        text = metrics.to_prometheus()
+        self.assertIn("# TYPE netscout_cli_command_duration_seconds histogram", text)
+        self.assertIn(
+            'netscout_cli_command_duration_seconds_count{template="show switch '
+            '\\"{name}\\""} 1',
+            text,
+        )
+        self.assertIn(
+            'netscout_cli_command_output_bytes_sum{template="show switch '
+            '\\"{name}\\""} 100',
+            text,
+        )
+        self.assertIn(
+            'netscout_cli_session_checkout_duration_seconds_count{reused="true"} 1',
+            text,
+        )
+
+    def test_executor_records_template(self):
+        cli_service = Mock()
+        cli_service.send_command.return_value = "output"
+        template = CommandTemplate("show conn prtnum {port}")
+        TimedCommandTemplateExecutor(cli_service, template).execute_command(port="1")
+        self.assertIn(
+            'netscout_cli_command_output_bytes_sum{template="show conn prtnum '
+            '{port}"} 6',
+            METRICS.to_prometheus(),
+        )
+
+    def test_failed_command_recorded(self):
+        cli_service = Mock()
+        cli_service.send_command.side_effect = Exception("timeout")
+        templates = [CommandTemplate("b {port}"), CommandTemplate("a {port}")]
+        with self.assertRaises(Exception):
+            timed_send_command(cli_service, templates, "a 1\rb 2")
+        self.assertIn(
+            'netscout_cli_command_duration_seconds_count{template="a {port} | '
+            'b {port}"} 1',
+            METRICS.to_prometheus(),
+        )
+
+    def test_exporter_writes_file(self):
+        METRICS.observe_command("show status", 0.1, 10)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "driver", "metrics.prom")
+            exporter = MetricsExporter(path, 60)
+            exporter.start()
+            exporter.stop()
+            with open(path) as f:
+                self.assertIn('template="show status"', f.read())
@@ -0,0 +1,75 @@
+import threading
+from unittest import TestCase
+from unittest.mock import Mock
+
+from cloudshell.layer_one.core.layer_one_driver_exception import LayerOneDriverException
+
+from netscout_teststream.switch_registry import SwitchRegistry
+
+
+class TestSwitchRegistry(TestCase):
+    def setUp(self):
+        self._instance = SwitchRegistry(Mock)
+        self._first = self._instance.register(
+            "10.0.0.1?teststream=first", "first", "10.0.0.1", "user", "password"
+        )
+        self._second = self._instance.register(
+            "10.0.0.1?teststream=second", "second", "10.0.0.1", "user", "password"
+        )
+
+    def test_switch_has_own_cli_handler(self):
+        self.assertIsNot(self._first.cli_handler, self._second.cli_handler)
+        self._first.cli_handler.define_session_attributes.assert_called_once_with(
+            "10.0.0.1", "user", "password", None
+        )
+
+    def test_register_existing_switch(self):
+        switch = self._instance.register(
+            "10.0.0.1?TestStream=First", "first", "10.0.0.1", "user", "new_password"
+        )
+        self.assertIs(switch, self._first)
+        self.assertEqual(len(self._instance), 2)
+
+    def test_for_port(self):
+        self.assertIs(
+            self._instance.for_port("10.0.0.1?teststream=first/1/1"), self._first
+        )
+        self.assertIs(
+            self._instance.for_port("10.0.0.1?teststream=second/1/1-Rx"), self._second
+        )
+
+    def test_unknown_address_uses_current_switch(self):
+        self.assertIs(self._instance.for_port("10.0.0.1/1/1"), self._second)
+
+    def test_current_switch_is_per_thread(self):
+        result = []
+        thread = threading.Thread(target=lambda: result.append(self._try_current()))
+        thread.start()
+        thread.join()
+        self.assertIsInstance(result[0], LayerOneDriverException)
+
+    def _try_current(self):
+        try:
+            return self._instance.current
+        except LayerOneDriverException as e:
+            return e
+
+    def test_run_parallel_collects_errors(self):
+        def action(switch, ports):
+            if switch is self._second:
+                raise Exception(f"failed {', '.join(ports)}")
+
+        groups = self._instance.group_ports(
+            [
+                "10.0.0.1?teststream=first/1/1",
+                "10.0.0.1?teststream=second/1/1",
+                "10.0.0.1?teststream=second/1/2",
+            ]
+        )
+
+        errors = self._instance.run_parallel(action, groups)
+
+        self.assertEqual(
+            errors,
+            ["failed 10.0.0.1?teststream=second/1/1, 10.0.0.1?teststream=second/1/2"],
+        )
@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from netscout_teststream.switch_state import SwitchState
+
+
+class TestSwitchState(TestCase):
+    PORT_STATES = [
+        ("01.01.01", "90", "01", "00", "00"),
+        ("01.01.02", "90", "01", "01", "01"),
+    ]
+
+    def setUp(self):
+        self._state = SwitchState(ttl=60)
+
+    def test_fingerprint_depends_on_connections(self):
+        changed = [self.PORT_STATES[0], ("01.01.02", "90", "01", "00", "00")]
+
+        self.assertEqual(
+            SwitchState.fingerprint(self.PORT_STATES),
+            SwitchState.fingerprint(list(self.PORT_STATES)),
+        )
+        self.assertNotEqual(
+            SwitchState.fingerprint(self.PORT_STATES), SwitchState.fingerprint(changed)
+        )
+
+    def test_state_id_kept_while_fingerprint_unchanged(self):
+        self._state.update("fingerprint", 0)
+        self._state.set_state_id("42")
+        self._state.invalidate()
+
+        self.assertFalse(self._state.is_valid())
+        self._state.update("fingerprint", self._state.generation)
+        self.assertTrue(self._state.is_valid())
+        self.assertEqual(self._state.state_id, "42")
+
+        self._state.update("changed", self._state.generation)
+        self.assertEqual(self._state.state_id, "changed")
+
+    def test_no_ttl(self):
+        state = SwitchState()
+        state.update("fingerprint", 0)
+
+        self.assertFalse(state.is_valid())
+
+    def test_update_dropped_after_invalidation(self):
+        self._state.update("fingerprint", self._state.generation)
+        self._state.set_state_id("42")
+        generation = self._state.generation
+        # mapping finished while the fingerprint was read
+        self._state.invalidate()
+        self._state.update("before mapping", generation)
+
+        self.assertFalse(self._state.is_valid())
+        self._state.update("after mapping", self._state.generation)
+        self.assertEqual(self._state.state_id, "after mapping")
@@ -0,0 +1,34 @@
+from unittest import TestCase
+
+from netscout_teststream.model.netscout_chassis import NetscoutChassis
+from netscout_teststream.topology_cache import TopologyCache
+
+
+class TestTopologyCache(TestCase):
+    ADDRESS = "192.168.42.240"
+
+    def setUp(self):
+        self._topology = TopologyCache(ttl=60)
+
+    def _update(self, invalidate=False):
+        self._topology.begin_update(self.ADDRESS)
+        self._topology.get_resource(
+            ("chassis", 1), (self.ADDRESS,), lambda: NetscoutChassis(1, self.ADDRESS)
+        )
+        if invalidate:
+            # mapping finished while the switch was read
+            self._topology.invalidate()
+        self._topology.end_update()
+
+    def test_valid_after_update(self):
+        self._update()
+
+        self.assertTrue(self._topology.is_valid(self.ADDRESS))
+        self.assertFalse(self._topology.is_valid("10.0.0.1"))
+
+    def test_invalidated_during_update(self):
+        self._update(invalidate=True)
+
+        self.assertFalse(self._topology.is_valid(self.ADDRESS))
+        self._update()
+        self.assertTrue(self._topology.is_valid(self.ADDRESS))
@@ -47,6 +47,7 @@ class TestMain(TestCase):
 
     @patch("main.os")
     @patch("main.importlib")
+    @patch("main.set_log_level")
     @patch("main.datetime")
     @patch("main.RuntimeConfiguration")
     @patch("main.XMLLogger")
@@ -61,6 +62,7 @@ class TestMain(TestCase):
         xml_logger_class,
         runtime_configuration_class,
         datetime_mod,
+        set_log_level_mod,
         importlib_mod,
         os_mod,
     ):
@@ -69,7 +71,10 @@ class TestMain(TestCase):
         os_mod.path.join.side_effect = [config_path, xml_log_path]
         runtime_config_instance = Mock()
         log_level = Mock()
-        runtime_config_instance.read_key.return_value = log_level
+        runtime_config_instance.read_key.side_effect = lambda key, default=None: {
+            "LOGGING.LEVEL": log_level,
+            "METRICS.EXPORT_INTERVAL": 0,
+        }.get(key, default)
         runtime_configuration_class.return_value = runtime_config_instance
         xml_logger_inst = Mock()
         xml_logger_class.return_value = xml_logger_inst
@@ -107,10 +112,9 @@ class TestMain(TestCase):
             log_file_prefix=driver_name + "_commands",
             use_context=False,
         )
-        runtime_config_instance.read_key.assert_called_once_with(
-            "LOGGING.LEVEL", "INFO"
-        )
-        command_logger.setLevel.assert_called_once_with(log_level)
+        runtime_config_instance.read_key.assert_any_call("LOGGING.LEVEL", "INFO")
+        runtime_config_instance.read_key.assert_any_call("METRICS.EXPORT_INTERVAL", 0)
+        set_log_level_mod.assert_called_once_with(command_logger, log_level)
         importlib_mod.import_module.assert_called_once_with(
             f"{driver_name}.driver_commands", package=None
         )
@@ -122,3 +126,97 @@ class TestMain(TestCase):
             command_executor_inst, xml_logger_inst
         )
         server_inst.start_listening.assert_called_once_with(port=self._port)
+        driver_commands_inst.close.assert_called_once_with()
+
+    @patch("netscout_teststream.log_queue.QueuedXMLLogger")
+    @patch("netscout_teststream.log_queue.LogQueue")
+    @patch("main.os")
+    @patch("main.importlib")
+    @patch("main.set_log_level")
+    @patch("main.RuntimeConfiguration")
+    @patch("main.XMLLogger")
+    @patch("main.get_qs_logger")
+    @patch("main.CommandExecutor")
+    @patch("main.DriverListener")
+    def test_run_driver_async_logging(
+        self,
+        driver_listener_class,
+        command_executor_class,
+        get_qs_logger_mod,
+        xml_logger_class,
+        runtime_configuration_class,
+        set_log_level_mod,
+        importlib_mod,
+        os_mod,
+        log_queue_class,
+        queued_xml_logger_class,
+    ):
+        config_path = Mock()
+        xml_log_path = Mock()
+        os_mod.path.join.side_effect = [config_path, xml_log_path]
+        runtime_config_instance = Mock()
+        runtime_config_instance.read_key.side_effect = lambda key, default=None: {
+            "LOGGING.ASYNC": True,
+            "LOGGING.MAX_PAYLOAD": 1024,
+            "LOGGING.AUTOLOAD_SAMPLE_RATE": 10,
+            "METRICS.EXPORT_INTERVAL": 0,
+        }.get(key, default)
+        runtime_configuration_class.return_value = runtime_config_instance
+        log_queue = log_queue_class.return_value
+        command_logger = get_qs_logger_mod.return_value
+        server_inst = driver_listener_class.return_value
+        server_inst.start_listening.side_effect = Exception("Listening failed")
+
+        with self.assertRaisesRegex(Exception, "Listening failed"):
+            self._instance.run_driver("test driver")
+
+        log_queue_class.assert_called_once_with(1024)
+        log_queue.start.assert_called_once_with()
+        queued_xml_logger_class.assert_called_once_with(xml_log_path, log_queue, 10)
+        xml_logger_class.assert_not_called()
+        set_log_level_mod.assert_called_once_with(command_logger, "INFO")
+        log_queue.attach.assert_called_once_with(command_logger)
+        driver_listener_class.assert_called_once_with(
+            command_executor_class.return_value, queued_xml_logger_class.return_value
+        )
+        log_queue.stop.assert_called_once_with()
+
+    @patch("netscout_teststream.metrics.MetricsExporter")
+    @patch("main.os")
+    @patch("main.importlib")
+    @patch("main.set_log_level")
+    @patch("main.RuntimeConfiguration")
+    @patch("main.XMLLogger")
+    @patch("main.get_qs_logger")
+    @patch("main.CommandExecutor")
+    @patch("main.DriverListener")
+    def test_run_driver_metrics_exporter(
+        self,
+        driver_listener_class,
+        command_executor_class,
+        get_qs_logger_mod,
+        xml_logger_class,
+        runtime_configuration_class,
+        set_log_level_mod,
+        importlib_mod,
+        os_mod,
+        metrics_exporter_class,
+    ):
+        metrics_path = Mock()
+        os_mod.path.join.side_effect = [Mock(), Mock(), metrics_path]
+        runtime_config_instance = Mock()
+        runtime_config_instance.read_key.side_effect = lambda key, default=None: {
+            "LOGGING.ASYNC": False,
+            "METRICS.EXPORT_INTERVAL": 30,
+        }.get(key, default)
+        runtime_configuration_class.return_value = runtime_config_instance
+        metrics_exporter = metrics_exporter_class.return_value
+        server_inst = driver_listener_class.return_value
+        server_inst.start_listening.side_effect = Exception("Listening failed")
+
+        with self.assertRaisesRegex(Exception, "Listening failed"):
+            self._instance.run_driver("test driver")
+
+        metrics_exporter_class.assert_called_once_with(metrics_path, 30)
+        metrics_exporter.start.assert_called_once_with()
+        metrics_exporter.stop.assert_called_once_with()